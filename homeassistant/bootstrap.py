@@ -18,6 +18,7 @@ from homeassistant.components import http
 from homeassistant.const import REQUIRED_NEXT_PYTHON_DATE, REQUIRED_NEXT_PYTHON_VER
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import area_registry, device_registry, entity_registry
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
@@ -28,7 +29,7 @@ from homeassistant.setup import (
 from homeassistant.util.async_ import gather_with_concurrency
 from homeassistant.util.logging import async_activate_log_queue_handler
 from homeassistant.util.package import async_get_user_site, is_virtual_env
-from homeassistant.util.yaml import clear_secret_cache
+from homeassistant.util.yaml import ParseCache, clear_secret_cache
 
 if TYPE_CHECKING:
     from .runner import RuntimeConfig
@@ -108,6 +109,10 @@ async def async_setup_hass(
     if not safe_mode:
         await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
 
+        hass.data[conf_util.DATA_YAML_PARSE_CACHE] = ParseCache(
+            hass.config.path(STORAGE_DIR, conf_util.YAML_PARSE_CACHE_FILE)
+        )
+
         try:
             config_dict = await conf_util.async_hass_config_yaml(hass)
         except HomeAssistantError as err:
@@ -553,3 +558,14 @@ async def _async_set_up_integrations(
             await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
+
+    import_times = hass.data.get(loader.DATA_IMPORT_TIMES, {})
+    _LOGGER.debug(
+        "Integration import times: %s",
+        ", ".join(
+            f"{domain} ({import_time:.2f}s)"
+            for domain, import_time in sorted(
+                import_times.items(), key=lambda item: item[1], reverse=True
+            )
+        ),
+    )
@@ -1,6 +1,18 @@
 """Allow to set up simple automation rules via the config file."""
+import asyncio
 import logging
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Union, cast
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
@@ -42,6 +54,7 @@ from homeassistant.helpers import condition, extract_domain_configs, template
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -77,6 +90,8 @@ from .helpers import async_get_blueprints
 
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
+DATA_REFERENCE_INDEX = "automation_reference_index"
+
 
 CONF_SKIP_CONDITION = "skip_condition"
 CONF_STOP_ACTIONS = "stop_actions"
@@ -106,16 +121,10 @@ def is_on(hass, entity_id):
 @callback
 def automations_with_entity(hass: HomeAssistant, entity_id: str) -> List[str]:
     """Return all automations that reference the entity."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if entity_id in automation_entity.referenced_entities
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].async_referencing_entity(entity_id)
 
 
 @callback
@@ -137,16 +146,10 @@ def entities_in_automation(hass: HomeAssistant, entity_id: str) -> List[str]:
 @callback
 def automations_with_device(hass: HomeAssistant, device_id: str) -> List[str]:
     """Return all automations that reference the device."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if device_id in automation_entity.referenced_devices
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].async_referencing_device(device_id)
 
 
 @callback
@@ -168,6 +171,7 @@ def devices_in_automation(hass: HomeAssistant, entity_id: str) -> List[str]:
 async def async_setup(hass, config):
     """Set up the automation."""
     hass.data[DOMAIN] = component = EntityComponent(LOGGER, DOMAIN, hass)
+    hass.data[DATA_REFERENCE_INDEX] = ReferenceIndex()
 
     # To register the automation blueprints
     async_get_blueprints(hass)
@@ -200,8 +204,8 @@ async def async_setup(hass, config):
     )
 
     async def reload_service_handler(service_call):
-        """Remove all automations and load new ones from config."""
-        conf = await component.async_prepare_reload()
+        """Reload the automations that changed in the config."""
+        conf = await component.async_prepare_reload(skip_reset=True)
         if conf is None:
             return
         async_get_blueprints(hass).async_reset_cache()
@@ -228,6 +232,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         initial_state,
         variables,
         trigger_variables,
+        raw_config=None,
     ):
         """Initialize an automation entity."""
         self._id = automation_id
@@ -244,6 +249,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         self._logger = LOGGER
         self._variables: ScriptVariables = variables
         self._trigger_variables: ScriptVariables = trigger_variables
+        self.raw_config = raw_config
 
     @property
     def name(self):
@@ -324,6 +330,9 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
             f"{__name__}.{split_entity_id(self.entity_id)[1]}"
         )
         self.action_script.update_logger(self._logger)
+        self.hass.data[DATA_REFERENCE_INDEX].async_add(
+            self.entity_id, self.referenced_entities, self.referenced_devices
+        )
 
         state = await self.async_get_last_state()
         if state:
@@ -424,6 +433,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
     async def async_will_remove_from_hass(self):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
+        self.hass.data[DATA_REFERENCE_INDEX].async_remove(self.entity_id)
         await self.async_disable()
 
     async def async_enable(self):
@@ -516,11 +526,21 @@ async def _async_process_config(
 ) -> bool:
     """Process config and add automations.
 
+    Automations that are already running with the same name and config are
+    left untouched, the others are removed or replaced.
+
     Returns if blueprints were used.
     """
     entities = []
     blueprints_used = False
 
+    # Running automations that have not been matched to the config yet
+    unmatched: Dict[Tuple[Optional[str], str], List[AutomationEntity]] = {}
+    for entity in component.entities:
+        if entity.raw_config is not None:
+            unmatched.setdefault((entity.unique_id, entity.name), []).append(entity)
+    to_remove = [entity for entity in component.entities if entity.raw_config is None]
+
     for config_key in extract_domain_configs(config, DOMAIN):
         conf: List[Union[Dict[str, Any], blueprint.BlueprintInputs]] = config[  # type: ignore
             config_key
@@ -549,6 +569,17 @@ async def _async_process_config(
 
             automation_id = config_block.get(CONF_ID)
             name = config_block.get(CONF_ALIAS) or f"{config_key} {list_no}"
+            raw_config = getattr(config_block, "raw_config", None)
+
+            if raw_config is not None:
+                running = unmatched.get((automation_id, name), [])
+                unchanged = next(
+                    (entity for entity in running if entity.raw_config == raw_config),
+                    None,
+                )
+                if unchanged is not None:
+                    running.remove(unchanged)
+                    continue
 
             initial_state = config_block.get(CONF_INITIAL_STATE)
 
@@ -596,10 +627,19 @@ async def _async_process_config(
                 initial_state,
                 variables,
                 config_block.get(CONF_TRIGGER_VARIABLES),
+                raw_config,
             )
 
             entities.append(entity)
 
+    for running in unmatched.values():
+        to_remove.extend(running)
+
+    if to_remove:
+        await asyncio.gather(
+            *(component.async_remove_entity(entity.entity_id) for entity in to_remove)
+        )
+
     if entities:
         await component.async_add_entities(entities)
 
@@ -52,13 +52,21 @@ PLATFORM_SCHEMA = vol.All(
 )
 
 
+class AutomationConfig(dict):
+    """Validated automation config that remembers the config it was built from."""
+
+    raw_config = None
+
+
 async def async_validate_config_item(hass, config, full_config=None):
     """Validate config item."""
     if blueprint.is_blueprint_instance_config(config):
         blueprints = async_get_blueprints(hass)
         return await blueprints.async_inputs_from_config(config)
 
-    config = PLATFORM_SCHEMA(config)
+    raw_config = config
+    config = AutomationConfig(PLATFORM_SCHEMA(config))
+    config.raw_config = raw_config
 
     config[CONF_TRIGGER] = await async_validate_trigger_config(
         hass, config[CONF_TRIGGER]
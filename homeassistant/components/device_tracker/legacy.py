@@ -2,6 +2,8 @@
 import asyncio
 from datetime import timedelta
 import hashlib
+import os
+import tempfile
 from types import ModuleType
 from typing import Any, Callable, Dict, List, Optional, Sequence
 
@@ -31,10 +33,12 @@ from homeassistant.helpers import config_per_platform, discovery
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_registry import async_get_registry
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_time_interval,
     async_track_utc_time_change,
 )
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType, GPSType, HomeAssistantType
 from homeassistant.setup import async_prepare_setup_platform
 from homeassistant.util import dt as dt_util
@@ -113,6 +117,9 @@ SERVICE_SEE_PAYLOAD_SCHEMA = vol.Schema(
 )
 
 YAML_DEVICES = "known_devices.yaml"
+STORAGE_KEY = "device_tracker.known_devices"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
 EVENT_NEW_DEVICE = "device_tracker_new_device"
 
 
@@ -377,8 +384,11 @@ async def get_tracker(hass, config):
     if track_new is None:
         track_new = defaults.get(CONF_TRACK_NEW, DEFAULT_TRACK_NEW)
 
-    devices = await async_load_config(yaml_path, hass, consider_home)
-    tracker = DeviceTracker(hass, consider_home, track_new, defaults, devices)
+    known_devices = KnownDevices(hass, yaml_path, consider_home)
+    devices = await known_devices.async_load()
+    tracker = DeviceTracker(
+        hass, consider_home, track_new, defaults, devices, known_devices
+    )
     return tracker
 
 
@@ -392,9 +402,15 @@ class DeviceTracker:
         track_new: bool,
         defaults: dict,
         devices: Sequence,
+        known_devices: Optional["KnownDevices"] = None,
     ) -> None:
         """Initialize a device tracker."""
         self.hass = hass
+        if known_devices is None:
+            known_devices = KnownDevices(
+                hass, hass.config.path(YAML_DEVICES), consider_home
+            )
+        self.known_devices = known_devices
         self.devices = {dev.dev_id: dev for dev in devices}
         self.mac_to_dev = {dev.mac: dev for dev in devices if dev.mac}
         self.consider_home = consider_home
@@ -404,7 +420,6 @@ class DeviceTracker:
             else defaults.get(CONF_TRACK_NEW, DEFAULT_TRACK_NEW)
         )
         self.defaults = defaults
-        self._is_updating = asyncio.Lock()
 
         for dev in devices:
             if self.devices[dev.dev_id] is not dev:
@@ -536,22 +551,15 @@ class DeviceTracker:
             },
         )
 
-        # update known_devices.yaml
-        self.hass.async_create_task(
-            self.async_update_config(
-                self.hass.config.path(YAML_DEVICES), dev_id, device
-            )
-        )
+        # update the known devices
+        self.hass.async_create_task(self.async_update_config(device))
 
-    async def async_update_config(self, path, dev_id, device):
-        """Add device to YAML configuration file.
+    async def async_update_config(self, device):
+        """Add device to the known devices.
 
         This method is a coroutine.
         """
-        async with self._is_updating:
-            await self.hass.async_add_executor_job(
-                update_config, self.hass.config.path(YAML_DEVICES), dev_id, device
-            )
+        self.known_devices.async_add_device(device)
 
     @callback
     def async_update_stale(self, now: dt_util.dt.datetime):
@@ -856,6 +864,189 @@ async def async_load_config(
     return result
 
 
+class KnownDevices:
+    """Storage of the known devices, indexed by device id.
+
+    The devices used to live in known_devices.yaml only, which was appended to
+    for every new device and parsed in full on startup. They are now kept in
+    storage and new devices are still appended to known_devices.yaml, so the
+    file keeps the comments and order it was maintained with. When the file is
+    edited by hand it is imported again on the next start.
+    """
+
+    def __init__(
+        self, hass: HomeAssistantType, yaml_path: str, consider_home: timedelta
+    ) -> None:
+        """Initialize the known devices."""
+        self.hass = hass
+        self.yaml_path = yaml_path
+        self.consider_home = consider_home
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._devices: Dict[str, dict] = {}
+        self._yaml_mtime: Optional[int] = None
+        # Devices that are not in known_devices.yaml yet
+        self._unexported: Dict[str, None] = {}
+        self._unsub_export: Optional[Callable[[], None]] = None
+
+    async def async_load(self) -> List[Device]:
+        """Load the known devices, migrating known_devices.yaml if needed.
+
+        This method is a coroutine.
+        """
+        data = await self._store.async_load()
+        yaml_mtime = await self.hass.async_add_executor_job(_get_mtime, self.yaml_path)
+
+        if data is None or data["yaml_mtime"] != yaml_mtime:
+            # First start or known_devices.yaml was edited by hand
+            devices = await async_load_config(
+                self.yaml_path, self.hass, self.consider_home
+            )
+            self._devices = {}
+            self._unexported = {}
+            for device in devices:
+                self._async_set_entry(device)
+            self._yaml_mtime = yaml_mtime
+            await self._store.async_save(self._data_to_save())
+            return devices
+
+        self._devices = data["devices"]
+        self._yaml_mtime = yaml_mtime
+        self._unexported = dict.fromkeys(data["unexported"])
+        if self._unexported:
+            self._async_schedule_export()
+
+        return [
+            self._entry_to_device(dev_id, entry)
+            for dev_id, entry in data["devices"].items()
+        ]
+
+    @callback
+    def async_add_device(self, device: Device) -> None:
+        """Add a device and schedule saving it."""
+        self._async_set_entry(device)
+        self._unexported[device.dev_id] = None
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        self._async_schedule_export()
+
+    @callback
+    def _async_set_entry(self, device: Device) -> None:
+        """Store the configuration of a device."""
+        entry = {
+            ATTR_NAME: device.name,
+            ATTR_MAC: device.mac,
+            ATTR_ICON: device.icon,
+            "picture": device.config_picture,
+            "track": device.track,
+        }
+        if device.consider_home != self.consider_home:
+            entry[CONF_CONSIDER_HOME] = device.consider_home.total_seconds()
+        self._devices[device.dev_id] = entry
+
+    def _entry_to_device(self, dev_id: str, entry: dict) -> Device:
+        """Create a device from its stored configuration."""
+        consider_home = entry.get(CONF_CONSIDER_HOME)
+        return Device(
+            self.hass,
+            self.consider_home
+            if consider_home is None
+            else timedelta(seconds=consider_home),
+            entry["track"],
+            dev_id,
+            entry[ATTR_MAC],
+            entry[ATTR_NAME],
+            picture=entry["picture"],
+            icon=entry[ATTR_ICON],
+        )
+
+    @callback
+    def _async_schedule_export(self) -> None:
+        """Schedule writing known_devices.yaml."""
+        if self._unsub_export is None:
+            self._unsub_export = async_call_later(
+                self.hass, SAVE_DELAY, self._async_export
+            )
+
+    async def _async_export(self, _now) -> None:
+        """Append the new devices to known_devices.yaml."""
+        self._unsub_export = None
+        unexported = {
+            dev_id: self._devices[dev_id]
+            for dev_id in self._unexported
+            if dev_id in self._devices
+        }
+        self._unexported = {}
+        if not unexported:
+            return
+
+        try:
+            yaml_mtime = await self.hass.async_add_executor_job(
+                _export_known_devices, self.yaml_path, self._yaml_mtime, unexported
+            )
+        except OSError as err:
+            LOGGER.error("Unable to write %s: %s", self.yaml_path, err)
+            self._unexported.update(dict.fromkeys(unexported))
+            return
+
+        if yaml_mtime is not None:
+            self._yaml_mtime = yaml_mtime
+        self._store.async_delay_save(self._data_to_save, 0)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        """Return the data to store."""
+        return {
+            "devices": self._devices,
+            "yaml_mtime": self._yaml_mtime,
+            "unexported": list(self._unexported),
+        }
+
+
+def _get_mtime(path: str) -> Optional[int]:
+    """Return the modification time of a file if it exists."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _export_known_devices(
+    path: str, yaml_mtime: Optional[int], unexported: dict
+) -> Optional[int]:
+    """Append devices to a YAML file.
+
+    The file is replaced by a copy with the devices appended, so an
+    interrupted write can not truncate it. Returns the modification time of
+    the written file if it was unchanged since the last export, a file edited
+    by hand is imported again on the next start.
+    """
+    unchanged = _get_mtime(path) == yaml_mtime
+    try:
+        with open(path, encoding="utf-8") as fil:
+            content = fil.read()
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        content = ""
+        mode = 0o644
+    if content and not content.endswith("\n"):
+        content += "\n"
+    content += f"\n{dump(unexported)}"
+
+    tmp_filename = ""
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w", encoding="utf-8", dir=os.path.dirname(path), delete=False
+        ) as fdesc:
+            fdesc.write(content)
+            tmp_filename = fdesc.name
+        os.chmod(tmp_filename, mode)
+        os.replace(tmp_filename, path)
+    finally:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+
+    return _get_mtime(path) if unchanged else None
+
+
 def update_config(path: str, dev_id: str, device: Device):
     """Add device to YAML configuration file."""
     with open(path, "a") as out:
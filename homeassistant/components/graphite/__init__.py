@@ -25,6 +25,17 @@ DEFAULT_PORT = 2003
 DEFAULT_PREFIX = "ha"
 DOMAIN = "graphite"
 
+# Lines are sent in batches once this many are pending or the oldest pending
+# line waited for the flush interval.
+BATCH_SIZE = 1000
+FLUSH_INTERVAL = 1
+# Events are dropped while this many are waiting to be processed
+MAX_QUEUE_SIZE = 10000
+# How long to wait before connecting again after the connection failed
+RECONNECT_INTERVAL = 10
+# How often dropped events and lines are reported
+DROPPED_REPORT_INTERVAL = 60
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.Schema(
@@ -60,7 +71,12 @@ def setup(hass, config):
 
 
 class GraphiteFeeder(threading.Thread):
-    """Feed data to Graphite."""
+    """Feed data to Graphite.
+
+    Lines are sent in batches over a persistent connection that is opened
+    again when it fails. While Graphite is slow or unreachable, events queue
+    up to MAX_QUEUE_SIZE and are dropped after that.
+    """
 
     def __init__(self, hass, host, port, prefix):
         """Initialize the feeder."""
@@ -73,6 +89,14 @@ class GraphiteFeeder(threading.Thread):
         self._queue = queue.Queue()
         self._quit_object = object()
         self._we_started = False
+        self._sock = None
+        self._connect_failed_time = None
+        self._lines = []
+        self._flush_time = None
+        self.dropped_events = 0
+        self.dropped_lines = 0
+        self._dropped_reported = (0, 0)
+        self._dropped_report_time = 0
 
         hass.bus.listen_once(EVENT_HOMEASSISTANT_START, self.start_listen)
         hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, self.shutdown)
@@ -93,19 +117,94 @@ class GraphiteFeeder(threading.Thread):
     def event_listener(self, event):
         """Queue an event for processing."""
         if self.is_alive() or not self._we_started:
+            if self._queue.qsize() >= MAX_QUEUE_SIZE:
+                self.dropped_events += 1
+                return
             _LOGGER.debug("Received event")
             self._queue.put(event)
         else:
             _LOGGER.error("Graphite feeder thread has died, not queuing event")
 
     def _send_to_graphite(self, data):
-        """Send data to Graphite."""
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(10)
-        sock.connect((self._host, self._port))
-        sock.sendall(data.encode("ascii"))
-        sock.send(b"\n")
-        sock.close()
+        """Send data to Graphite over the persistent connection."""
+        if self._sock is None:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(10)
+            try:
+                sock.connect((self._host, self._port))
+            except OSError:
+                sock.close()
+                raise
+            self._sock = sock
+
+        try:
+            self._sock.sendall(data.encode("ascii"))
+        except OSError:
+            self._close_connection()
+            raise
+
+    def _close_connection(self):
+        """Close the connection to Graphite."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _flush(self):
+        """Send the pending lines to Graphite."""
+        lines, self._lines = self._lines, []
+        self._report_dropped()
+        if not lines:
+            return
+
+        now = time.monotonic()
+        if (
+            self._connect_failed_time is not None
+            and now - self._connect_failed_time < RECONNECT_INTERVAL
+        ):
+            self.dropped_lines += len(lines)
+            return
+
+        _LOGGER.debug(
+            "Sending %d lines to graphite, %d events queued",
+            len(lines),
+            self._queue.qsize(),
+        )
+        try:
+            self._send_to_graphite("\n".join(lines) + "\n")
+        except socket.gaierror:
+            if self._connect_failed_time is None:
+                _LOGGER.error("Unable to connect to host %s", self._host)
+        except OSError:
+            if self._connect_failed_time is None:
+                _LOGGER.exception("Failed to send data to graphite")
+        else:
+            if self._connect_failed_time is not None:
+                _LOGGER.info("Connection to graphite restored")
+            self._connect_failed_time = None
+            return
+
+        self._connect_failed_time = now
+        self.dropped_lines += len(lines)
+
+    def _report_dropped(self):
+        """Log the number of dropped events and lines."""
+        dropped = (self.dropped_events, self.dropped_lines)
+        now = time.monotonic()
+        if (
+            dropped == self._dropped_reported
+            or now - self._dropped_report_time < DROPPED_REPORT_INTERVAL
+        ):
+            return
+
+        _LOGGER.warning(
+            "Graphite is not keeping up, dropped %d events and %d lines so far, "
+            "%d events queued",
+            self.dropped_events,
+            self.dropped_lines,
+            self._queue.qsize(),
+        )
+        self._dropped_reported = dropped
+        self._dropped_report_time = now
 
     def _report_attributes(self, entity_id, new_state):
         """Report the attributes."""
@@ -123,19 +222,28 @@ class GraphiteFeeder(threading.Thread):
         ]
         if not lines:
             return
-        _LOGGER.debug("Sending to graphite: %s", lines)
-        try:
-            self._send_to_graphite("\n".join(lines))
-        except socket.gaierror:
-            _LOGGER.error("Unable to connect to host %s", self._host)
-        except OSError:
-            _LOGGER.exception("Failed to send data to graphite")
+        _LOGGER.debug("Queuing for graphite: %s", lines)
+        if not self._lines:
+            self._flush_time = time.monotonic() + FLUSH_INTERVAL
+        self._lines.extend(lines)
 
     def run(self):
         """Run the process to export the data."""
         while True:
-            event = self._queue.get()
+            if self._lines:
+                try:
+                    event = self._queue.get(
+                        timeout=max(self._flush_time - time.monotonic(), 0)
+                    )
+                except queue.Empty:
+                    self._flush()
+                    continue
+            else:
+                event = self._queue.get()
+
             if event == self._quit_object:
+                self._flush()
+                self._close_connection()
                 _LOGGER.debug("Event processing thread stopped")
                 self._queue.task_done()
                 return
@@ -164,3 +272,6 @@ class GraphiteFeeder(threading.Thread):
                 _LOGGER.warning("Processing unexpected event type %s", event.event_type)
 
             self._queue.task_done()
+
+            if len(self._lines) >= BATCH_SIZE:
+                self._flush()
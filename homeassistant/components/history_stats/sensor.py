@@ -1,4 +1,5 @@
 """Component to make instant statistics about your history."""
+from collections import deque
 import datetime
 import logging
 import math
@@ -122,6 +123,15 @@ class HistoryStatsSensor(Entity):
         self.value = None
         self.count = None
 
+        # State changes of the tracked entity since the start of the period,
+        # as (timestamp, matches entity_states) tuples. They are queried from
+        # the recorder once and then kept up to date with state_changed events,
+        # so the recorder is only queried again if the start moves back.
+        self._history_start = None
+        self._history_initial_state = False
+        self._history = deque()
+        self._pending_changes = deque()
+
     async def async_added_to_hass(self):
         """Create listeners when the entity is added."""
 
@@ -134,10 +144,27 @@ class HistoryStatsSensor(Entity):
                 """Force the component to refresh."""
                 self.async_schedule_update_ha_state(True)
 
+            @callback
+            def state_changed(event):
+                """Record the state change and refresh."""
+                new_state = event.data.get("new_state")
+                # Same filter as the recorder uses for state changes
+                if (
+                    new_state is not None
+                    and new_state.last_changed == new_state.last_updated
+                ):
+                    self._pending_changes.append(
+                        (
+                            new_state.last_changed.timestamp(),
+                            new_state.state in self._entity_states,
+                        )
+                    )
+                force_refresh()
+
             force_refresh()
             self.async_on_remove(
                 async_track_state_change_event(
-                    self.hass, [self._entity_id], force_refresh
+                    self.hass, [self._entity_id], state_changed
                 )
             )
 
@@ -215,29 +242,28 @@ class HistoryStatsSensor(Entity):
             start_timestamp == p_start_timestamp
             and end_timestamp == p_end_timestamp
             and end_timestamp <= now_timestamp
+            and not self._pending_changes
         ):
             # Don't compute anything as the value cannot have changed
             return
 
-        # Get history between start and end
-        history_list = history.state_changes_during_period(
-            self.hass, start, end, str(self._entity_id)
-        )
-
-        if self._entity_id not in history_list:
-            return
+        if self._history_start is None or start_timestamp < self._history_start:
+            if not self._query_history(start, end, start_timestamp):
+                return
+        else:
+            self._trim_history(start_timestamp)
+        self._fold_pending_changes()
 
-        # Get the first state
-        last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state in self._entity_states
+        end_time = dt_util.as_timestamp(end)
+        last_state = self._history_initial_state
         last_time = start_timestamp
         elapsed = 0
         count = 0
 
         # Make calculations
-        for item in history_list.get(self._entity_id):
-            current_state = item.state in self._entity_states
-            current_time = item.last_changed.timestamp()
+        for current_time, current_state in self._history:
+            if current_time >= end_time:
+                break
 
             if last_state:
                 elapsed += current_time - last_time
@@ -258,6 +284,49 @@ class HistoryStatsSensor(Entity):
         # Save counter
         self.count = count
 
+    def _query_history(self, start, end, start_timestamp):
+        """Load the state changes during the period from the recorder."""
+        # Get history between start and end
+        history_list = history.state_changes_during_period(
+            self.hass, start, end, str(self._entity_id)
+        )
+
+        if self._entity_id not in history_list:
+            self._history_start = None
+            return False
+
+        # Get the first state
+        initial_state = history.get_state(self.hass, start, self._entity_id)
+
+        self._history_start = start_timestamp
+        self._history_initial_state = (
+            initial_state is not None and initial_state in self._entity_states
+        )
+        self._history = deque(
+            (item.last_changed.timestamp(), item.state in self._entity_states)
+            for item in history_list[self._entity_id]
+        )
+        return True
+
+    def _trim_history(self, start_timestamp):
+        """Drop state changes that happened before the start of the period.
+
+        The last dropped change is the state at the start of the period.
+        """
+        self._history_start = start_timestamp
+        while self._history and self._history[0][0] <= start_timestamp:
+            self._history_initial_state = self._history.popleft()[1]
+
+    def _fold_pending_changes(self):
+        """Add the state changes received since the last update."""
+        last_time = self._history[-1][0] if self._history else None
+        while self._pending_changes:
+            change = self._pending_changes.popleft()
+            # Skip changes that were already returned by the recorder
+            if last_time is None or change[0] > last_time:
+                self._history.append(change)
+                last_time = change[0]
+
     def update_period(self):
         """Parse the templates and store a datetime tuple in _period."""
         start = None
@@ -27,6 +27,7 @@ from homeassistant.helpers import (
     config_validation as cv,
     entity_platform,
 )
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.state import async_reproduce_state
 from homeassistant.loader import async_get_integration
 
@@ -75,6 +76,7 @@ def _ensure_no_intersection(value):
 CONF_SCENE_ID = "scene_id"
 CONF_SNAPSHOT = "snapshot_entities"
 DATA_PLATFORM = "homeassistant_scene"
+DATA_REFERENCE_INDEX = "homeassistant_scene_reference_index"
 EVENT_SCENE_RELOADED = "scene_reloaded"
 STATES_SCHEMA = vol.All(dict, _convert_states)
 
@@ -120,16 +122,10 @@ _LOGGER = logging.getLogger(__name__)
 @callback
 def scenes_with_entity(hass: HomeAssistant, entity_id: str) -> List[str]:
     """Return all scenes that reference the entity."""
-    if DATA_PLATFORM not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    platform = hass.data[DATA_PLATFORM]
-
-    return [
-        scene_entity.entity_id
-        for scene_entity in platform.entities.values()
-        if entity_id in scene_entity.scene_config.states
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].async_referencing_entity(entity_id)
 
 
 @callback
@@ -150,6 +146,7 @@ def entities_in_scene(hass: HomeAssistant, entity_id: str) -> List[str]:
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up Home Assistant scene entries."""
+    hass.data.setdefault(DATA_REFERENCE_INDEX, ReferenceIndex())
     _process_scenes_config(hass, async_add_entities, config)
 
     # This platform can be loaded multiple times. Only first time register the service.
@@ -282,6 +279,16 @@ class HomeAssistantScene(Scene):
         self.scene_config = scene_config
         self.from_service = from_service
 
+    async def async_added_to_hass(self) -> None:
+        """Index the entities referenced by the scene."""
+        self.hass.data[DATA_REFERENCE_INDEX].async_add(
+            self.entity_id, self.scene_config.states
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove the scene from the reference index."""
+        self.hass.data[DATA_REFERENCE_INDEX].async_remove(self.entity_id)
+
     @property
     def name(self):
         """Return the name of the scene."""
@@ -302,10 +302,12 @@ class HomeAssistantHTTP:
         """Register a folder or file to serve as a static path."""
         if os.path.isdir(path):
             if cache_headers:
-                resource = CachingStaticResource
+                resource = CachingStaticResource(url_path, path)
+                # Index the files in the background before they are requested
+                self.hass.async_create_task(resource.async_build_index())
             else:
-                resource = web.StaticResource
-            self.app.router.register_resource(resource(url_path, path))
+                resource = web.StaticResource(url_path, path)
+            self.app.router.register_resource(resource)
             return
 
         if cache_headers:
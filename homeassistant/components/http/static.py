@@ -1,48 +1,309 @@
 """Static file handling for HTTP component."""
+import asyncio
+from collections import OrderedDict
+from email.utils import formatdate
+import mimetypes
+import os
 from pathlib import Path
+import posixpath
+import stat
+from typing import Dict, NamedTuple, Optional
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse
+from aiohttp.web import FileResponse, Response
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
+from multidict import CIMultiDict
 
 # mypy: allow-untyped-defs
 
 CACHE_TIME = 31 * 86400  # = 1 month
 CACHE_HEADERS = {hdrs.CACHE_CONTROL: f"public, max-age={CACHE_TIME}"}
 
+# Precompressed siblings of static files, in order of preference
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+# Files up to this size are served from memory, larger ones are streamed
+MEMORY_CACHE_MAX_FILE_SIZE = 512 * 1024
+# Total size of the recently served files kept in memory per resource
+MEMORY_CACHE_SIZE = 16 * 1024 * 1024
+
+
+class StaticVariant(NamedTuple):
+    """A representation of a static file with a content encoding."""
+
+    path: Path
+    size: int
+    mtime: float
+    last_modified: str
+    etag: str
+
+
+class StaticFile(NamedTuple):
+    """A static file and its precompressed variants."""
+
+    content_type: str
+    variants: Dict[Optional[str], StaticVariant]
+
+
+def _get_variant(
+    directory: Path, path: Path, follow_symlinks: bool
+) -> Optional[StaticVariant]:
+    """Return the variant stored at path, None if it is not a file."""
+    filepath = path.resolve()
+    if not follow_symlinks:
+        filepath.relative_to(directory)
+    file_stat = filepath.stat()
+    if not stat.S_ISREG(file_stat.st_mode):
+        return None
+    return StaticVariant(
+        filepath,
+        file_stat.st_size,
+        file_stat.st_mtime,
+        formatdate(file_stat.st_mtime, usegmt=True),
+        f'"{file_stat.st_mtime_ns:x}-{file_stat.st_size:x}"',
+    )
+
+
+def _get_static_file(
+    directory: Path, path: Path, follow_symlinks: bool
+) -> Optional[StaticFile]:
+    """Describe the file at path, None if it is not a file."""
+    variant = _get_variant(directory, path, follow_symlinks)
+    if variant is None:
+        return None
+
+    variants: Dict[Optional[str], StaticVariant] = {None: variant}
+    for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+        try:
+            compressed = _get_variant(
+                directory, path.with_name(f"{path.name}{suffix}"), follow_symlinks
+            )
+        except (ValueError, OSError):
+            continue
+        if compressed is not None:
+            variants[encoding] = compressed
+
+    return StaticFile(
+        mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+        variants,
+    )
+
+
+def _build_index(directory: Path, follow_symlinks: bool) -> Dict[str, StaticFile]:
+    """Index the files below directory by their relative URL."""
+    index = {}
+
+    for root, _, filenames in os.walk(directory, followlinks=follow_symlinks):
+        names = set(filenames)
+        for name in filenames:
+            if any(
+                name.endswith(suffix) and name[: -len(suffix)] in names
+                for _, suffix in PRECOMPRESSED_ENCODINGS
+            ):
+                # Served as a variant of the uncompressed file
+                continue
+
+            path = Path(root, name)
+            try:
+                static_file = _get_static_file(directory, path, follow_symlinks)
+            except (ValueError, OSError):
+                continue
+            if static_file is not None:
+                index[path.relative_to(directory).as_posix()] = static_file
+
+    return index
+
+
+def _lookup_static_file(
+    directory: Path, filename: Path, follow_symlinks: bool
+) -> Optional[StaticFile]:
+    """Look up a file that is not indexed, None if it is a directory."""
+    filepath = directory.joinpath(filename).resolve()
+    if not follow_symlinks:
+        filepath.relative_to(directory)
+    if filepath.is_dir():
+        return None
+    static_file = _get_static_file(directory, filepath, follow_symlinks)
+    if static_file is None:
+        raise FileNotFoundError(filepath)
+    return static_file
+
+
+def _select_encoding(
+    accept_encoding: str, variants: Dict[Optional[str], StaticVariant]
+) -> Optional[str]:
+    """Select the preferred content encoding accepted by the client."""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.partition(";")
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip())
+
+    for encoding, _ in PRECOMPRESSED_ENCODINGS:
+        if encoding in variants and encoding in accepted:
+            return encoding
+    return None
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return if the ETag is in an If-None-Match header."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate in ("*", etag):
+            return True
+    return False
+
+
+class VariantFileResponse(FileResponse):
+    """File response that serves its file as it is.
+
+    FileResponse replaces files with their .gz sibling if the client accepts
+    gzip, but the variant has already been selected.
+    """
+
+    async def prepare(self, request):
+        """Prepare the response without looking for a .gz sibling."""
+        if hdrs.ACCEPT_ENCODING in request.headers:
+            headers = CIMultiDict(request.headers)
+            del headers[hdrs.ACCEPT_ENCODING]
+            request = request.clone(headers=headers)
+        return await super().prepare(request)
+
 
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
+
+    The files of the directory are indexed in the executor when the resource
+    is first used, including their precompressed siblings. Requests are
+    answered from the index without touching the filesystem on the event
+    loop, and recently served small files are kept in memory. Like the cache
+    headers, this assumes files do not change while Home Assistant is running.
+    Files that are not indexed yet are looked up when they are requested.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the static resource."""
+        super().__init__(*args, **kwargs)
+        self._index_task: Optional["asyncio.Future[Dict[str, StaticFile]]"] = None
+        self._memory_cache: "OrderedDict[Path, bytes]" = OrderedDict()
+        self._memory_cache_size = 0
+
+    def _async_get_index(self) -> "asyncio.Future[Dict[str, StaticFile]]":
+        """Return the task building the index."""
+        if self._index_task is None:
+            self._index_task = asyncio.get_running_loop().run_in_executor(
+                None, _build_index, self._directory, self._follow_symlinks
+            )
+        return self._index_task
+
+    async def async_build_index(self) -> None:
+        """Build the index of the static files."""
+        await self._async_get_index()
 
     async def _handle(self, request):
         rel_url = request.match_info["filename"]
-        try:
-            filename = Path(rel_url)
-            if filename.anchor:
-                # rel_url is an absolute name like
-                # /static/\\machine_name\c$ or /static/D:\path
-                # where the static dir is totally different
-                raise HTTPForbidden()
-            filepath = self._directory.joinpath(filename).resolve()
-            if not self._follow_symlinks:
-                filepath.relative_to(self._directory)
-        except (ValueError, FileNotFoundError) as error:
-            # relatively safe
-            raise HTTPNotFound() from error
-        except Exception as error:
-            # perm error or other kind!
-            request.app.logger.exception(error)
-            raise HTTPNotFound() from error
-
-        # on opening a dir, load its contents if allowed
-        if filepath.is_dir():
-            return await super()._handle(request)
-        if filepath.is_file():
-            return FileResponse(
-                filepath,
+        index = await self._async_get_index()
+        static_file = index.get(rel_url)
+
+        if static_file is None:
+            try:
+                filename = Path(rel_url)
+                if filename.anchor:
+                    # rel_url is an absolute name like
+                    # /static/\\machine_name\c$ or /static/D:\path
+                    # where the static dir is totally different
+                    raise HTTPForbidden()
+                static_file = await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    _lookup_static_file,
+                    self._directory,
+                    filename,
+                    self._follow_symlinks,
+                )
+            except (ValueError, FileNotFoundError) as error:
+                # relatively safe
+                raise HTTPNotFound() from error
+            except Exception as error:
+                # perm error or other kind!
+                request.app.logger.exception(error)
+                raise HTTPNotFound() from error
+
+            # on opening a dir, load its contents if allowed
+            if static_file is None:
+                return await super()._handle(request)
+            if posixpath.normpath(rel_url) == rel_url:
+                # Other spellings of the name would grow the index unbounded
+                index[rel_url] = static_file
+
+        return await self._async_serve(request, static_file)
+
+    async def _async_serve(self, request, static_file: StaticFile):
+        """Serve the variant of a static file accepted by the client."""
+        encoding = _select_encoding(
+            request.headers.get(hdrs.ACCEPT_ENCODING, ""), static_file.variants
+        )
+        variant = static_file.variants[encoding]
+        headers = {
+            **CACHE_HEADERS,
+            hdrs.ETAG: variant.etag,
+            hdrs.LAST_MODIFIED: variant.last_modified,
+        }
+        if len(static_file.variants) > 1:
+            headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+
+        if hdrs.IF_NONE_MATCH in request.headers:
+            if _etag_matches(request.headers[hdrs.IF_NONE_MATCH], variant.etag):
+                return Response(status=304, headers=headers)
+        elif (
+            request.if_modified_since is not None
+            # HTTP dates have a resolution of one second
+            and int(variant.mtime) <= request.if_modified_since.timestamp()
+        ):
+            return Response(status=304, headers=headers)
+
+        headers[hdrs.CONTENT_TYPE] = static_file.content_type
+        if encoding is not None:
+            headers[hdrs.CONTENT_ENCODING] = encoding
+
+        if (
+            variant.size > MEMORY_CACHE_MAX_FILE_SIZE
+            or hdrs.RANGE in request.headers
+            or hdrs.IF_UNMODIFIED_SINCE in request.headers
+        ):
+            # Partial and conditional requests are left to the file response
+            # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
+            return VariantFileResponse(
+                variant.path,
                 chunk_size=self._chunk_size,
-                # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
-                headers=CACHE_HEADERS,  # type: ignore
+                headers=headers,  # type: ignore
+            )
+
+        body = self._memory_cache.get(variant.path)
+        if body is None:
+            body = await asyncio.get_running_loop().run_in_executor(
+                None, variant.path.read_bytes
             )
-        raise HTTPNotFound
+            self._async_cache_body(variant.path, body)
+        else:
+            self._memory_cache.move_to_end(variant.path)
+
+        return Response(body=body, headers=headers)
+
+    def _async_cache_body(self, path: Path, body: bytes) -> None:
+        """Keep a file in memory, dropping the least recently served ones."""
+        if path in self._memory_cache:
+            return
+        self._memory_cache[path] = body
+        self._memory_cache_size += len(body)
+        while self._memory_cache_size > MEMORY_CACHE_SIZE:
+            _, dropped = self._memory_cache.popitem(last=False)
+            self._memory_cache_size -= len(dropped)
@@ -1,15 +1,19 @@
 """Support for sending data to an Influx database."""
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime, timezone
+import json
 import logging
 import math
+import os
 import queue
 import threading
 import time
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from influxdb import InfluxDBClient, exceptions
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
-from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
+from influxdb_client.client.write_api import SYNCHRONOUS
 from influxdb_client.rest import ApiException
 import requests.exceptions
 import urllib3.exceptions
@@ -26,7 +30,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import callback
+from homeassistant.core import Event, State, callback
 from homeassistant.helpers import event as event_helper, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
@@ -34,6 +38,7 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 
 from .const import (
     API_VERSION_2,
@@ -68,28 +73,32 @@ from .const import (
     CONF_TOKEN,
     CONF_USERNAME,
     CONF_VERIFY_SSL,
+    CONF_WRITER_THREADS,
     CONNECTION_ERROR,
     DEFAULT_API_VERSION,
     DEFAULT_HOST_V2,
     DEFAULT_MEASUREMENT_ATTR,
     DEFAULT_SSL_V2,
+    DEFAULT_WRITER_THREADS,
     DOMAIN,
+    DROPPED_MESSAGE,
     EVENT_NEW_STATE,
-    INFLUX_CONF_FIELDS,
-    INFLUX_CONF_MEASUREMENT,
     INFLUX_CONF_ORG,
     INFLUX_CONF_STATE,
-    INFLUX_CONF_TAGS,
-    INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    MAX_QUEUE_SIZE,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
+    REPLAYED_MESSAGE,
     RESUMED_MESSAGE,
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPILL_FILE,
+    SPILL_MAX_SIZE,
+    SPILL_REPLAY_BATCH_SIZE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
@@ -157,6 +166,9 @@ _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
 _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {
         vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+        vol.Optional(CONF_WRITER_THREADS, default=DEFAULT_WRITER_THREADS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=8)
+        ),
         vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
         vol.Optional(CONF_MEASUREMENT_ATTR, default=DEFAULT_MEASUREMENT_ATTR): vol.In(
             ["unit_of_measurement", "domain__device_class", "entity_id"]
@@ -193,8 +205,65 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def _generate_event_to_json(conf: Dict) -> Callable[[Dict], str]:
-    """Build event to json converter and add to config."""
+# Escapes for measurements, tag keys, tag values and field keys
+_KEY_ESCAPES = str.maketrans(
+    {"\\": "\\\\", " ": "\\ ", ",": "\\,", "=": "\\=", "\n": "\\n"}
+)
+# Escapes for string field values
+_STRING_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+# Nanoseconds per unit of each precision
+_PRECISION_NANOSECONDS = {None: 1, "ns": 1, "us": 1000, "ms": 1000000, "s": 1000000000}
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _escape_key(key: Any) -> str:
+    """Escape a measurement, tag or field key for the line protocol."""
+    return str(key).translate(_KEY_ESCAPES)
+
+
+def _escape_tag_value(value: Any) -> str:
+    """Escape a tag value for the line protocol."""
+    if value is None:
+        return ""
+    escaped = str(value).translate(_KEY_ESCAPES)
+    if escaped.endswith("\\"):
+        escaped += " "
+    return escaped
+
+
+def _encode_field(key: str, value: Any) -> str:
+    """Encode a float or string field for the line protocol."""
+    if key == "":
+        return ""
+    if isinstance(value, str):
+        if not value:
+            return ""
+        return f'{_escape_key(key)}="{value.translate(_STRING_ESCAPES)}"'
+    return f"{_escape_key(key)}={value!r}"
+
+
+def _encode_time(time_fired: Any, precision: str) -> int:
+    """Encode the time an event was fired in the given precision."""
+    if isinstance(time_fired, int):
+        return time_fired
+    if time_fired.tzinfo is None:
+        time_fired = time_fired.replace(tzinfo=timezone.utc)
+    delta = time_fired - _EPOCH
+    nanoseconds = (
+        delta.days * 86400000000000
+        + delta.seconds * 1000000000
+        + delta.microseconds * 1000
+    )
+    return nanoseconds // _PRECISION_NANOSECONDS[precision]
+
+
+def _generate_event_to_line(conf: Dict) -> Callable[[Event], Optional[str]]:
+    """Build a converter of events to lines of the InfluxDB line protocol.
+
+    The measurement and tags of a line only change with the tag attributes of
+    an entity, so they are encoded once and cached per entity.
+    """
     entity_filter = convert_include_exclude_filter(conf)
     tags = conf.get(CONF_TAGS)
     tags_attributes = conf.get(CONF_TAGS_ATTRIBUTES)
@@ -202,21 +271,50 @@ def _generate_event_to_json(conf: Dict) -> Callable[[Dict], str]:
     measurement_attr = conf.get(CONF_MEASUREMENT_ATTR)
     override_measurement = conf.get(CONF_OVERRIDE_MEASUREMENT)
     global_ignore_attributes = set(conf[CONF_IGNORE_ATTRIBUTES])
+    precision = conf.get(CONF_PRECISION)
     component_config = EntityValues(
         conf[CONF_COMPONENT_CONFIG],
         conf[CONF_COMPONENT_CONFIG_DOMAIN],
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
-
-    def event_to_json(event: Dict) -> str:
-        """Convert event into json in format Influx expects."""
+    # Maps entity ids to the measurement, tag values and their encoded prefix
+    prefixes: Dict[str, Tuple[str, Tuple, str]] = {}
+
+    def get_prefix(state: State, measurement: str) -> str:
+        """Return the encoded measurement and tags of a state."""
+        tag_values = tuple(
+            state.attributes[key] for key in tags_attributes if key in state.attributes
+        )
+        cached = prefixes.get(state.entity_id)
+        if cached is not None and cached[0] == measurement and cached[1] == tag_values:
+            return cached[2]
+
+        line_tags = {CONF_DOMAIN: state.domain, CONF_ENTITY_ID: state.object_id}
+        for key in tags_attributes:
+            if key in state.attributes:
+                line_tags[key] = state.attributes[key]
+        line_tags.update(tags)
+
+        prefix = ",".join(
+            [_escape_key(measurement)]
+            + [
+                f"{_escape_key(key)}={_escape_tag_value(value)}"
+                for key, value in sorted(line_tags.items())
+                if key != "" and _escape_tag_value(value) != ""
+            ]
+        )
+        prefixes[state.entity_id] = (measurement, tag_values, prefix)
+        return prefix
+
+    def event_to_line(event: Event) -> Optional[str]:
+        """Convert event into a line of the InfluxDB line protocol."""
         state = event.data.get(EVENT_NEW_STATE)
         if (
             state is None
             or state.state in (STATE_UNKNOWN, "", STATE_UNAVAILABLE)
             or not entity_filter(state.entity_id)
         ):
-            return
+            return None
 
         try:
             _include_state = _include_value = False
@@ -258,61 +356,60 @@ def _generate_event_to_json(conf: Dict) -> Callable[[Dict], str]:
                 else:
                     include_uom = measurement_attr != "unit_of_measurement"
 
-        json = {
-            INFLUX_CONF_MEASUREMENT: measurement,
-            INFLUX_CONF_TAGS: {
-                CONF_DOMAIN: state.domain,
-                CONF_ENTITY_ID: state.object_id,
-            },
-            INFLUX_CONF_TIME: event.time_fired,
-            INFLUX_CONF_FIELDS: {},
-        }
+        fields: Dict[str, Any] = {}
         if _include_state:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_STATE] = state.state
+            fields[INFLUX_CONF_STATE] = state.state
         if _include_value:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_VALUE] = _state_as_value
+            fields[INFLUX_CONF_VALUE] = _state_as_value
 
         ignore_attributes = set(entity_config.get(CONF_IGNORE_ATTRIBUTES, []))
         ignore_attributes.update(global_ignore_attributes)
         for key, value in state.attributes.items():
             if key in tags_attributes:
-                json[INFLUX_CONF_TAGS][key] = value
-            elif (
+                continue
+            if (
                 (key != CONF_UNIT_OF_MEASUREMENT or include_uom)
                 and (key != "device_class" or include_dc)
                 and key not in ignore_attributes
             ):
                 # If the key is already in fields
-                if key in json[INFLUX_CONF_FIELDS]:
+                if key in fields:
                     key = f"{key}_"
                 # Prevent column data errors in influxDB.
                 # For each value we try to cast it as float
                 # But if we can not do it we store the value
                 # as string add "_str" postfix to the field key
                 try:
-                    json[INFLUX_CONF_FIELDS][key] = float(value)
+                    fields[key] = float(value)
                 except (ValueError, TypeError):
                     new_key = f"{key}_str"
                     new_value = str(value)
-                    json[INFLUX_CONF_FIELDS][new_key] = new_value
+                    fields[new_key] = new_value
 
                     if RE_DIGIT_TAIL.match(new_value):
-                        json[INFLUX_CONF_FIELDS][key] = float(
-                            RE_DECIMAL.sub("", new_value)
-                        )
+                        fields[key] = float(RE_DECIMAL.sub("", new_value))
 
                 # Infinity and NaN are not valid floats in InfluxDB
                 try:
-                    if not math.isfinite(json[INFLUX_CONF_FIELDS][key]):
-                        del json[INFLUX_CONF_FIELDS][key]
+                    if not math.isfinite(fields[key]):
+                        del fields[key]
                 except (KeyError, TypeError):
                     pass
 
-        json[INFLUX_CONF_TAGS].update(tags)
+        encoded_fields = ",".join(
+            field
+            for field in (
+                _encode_field(key, value) for key, value in sorted(fields.items())
+            )
+            if field
+        )
 
-        return json
+        return (
+            f"{get_prefix(state, measurement)} {encoded_fields} "
+            f"{_encode_time(event.time_fired, precision)}"
+        )
 
-    return event_to_json
+    return event_to_line
 
 
 @dataclass
@@ -320,7 +417,7 @@ class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
 
     data_repositories: List[str]
-    write: Callable[[str], None]
+    write: Callable[[List[str]], None]
     query: Callable[[str, str], List[Any]]
     close: Callable[[], None]
 
@@ -340,14 +437,14 @@ def get_influx_connection(conf, test_write=False, test_read=False):
         if CONF_SSL_CA_CERT in conf:
             kwargs[CONF_SSL_CA_CERT] = conf[CONF_SSL_CA_CERT]
         bucket = conf.get(CONF_BUCKET)
-        influx = InfluxDBClientV2(**kwargs)
+        influx = InfluxDBClientV2(**kwargs, enable_gzip=True)
         query_api = influx.query_api()
-        initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
-        write_api = influx.write_api(write_options=initial_write_mode)
+        # Batches are written by the writer threads of the component
+        write_api = influx.write_api(write_options=SYNCHRONOUS)
 
-        def write_v2(json):
-            """Write data to V2 influx."""
-            data = {"bucket": bucket, "record": json}
+        def write_v2(lines):
+            """Write lines of the line protocol to V2 influx."""
+            data = {"bucket": bucket, "record": lines}
 
             if precision is not None:
                 data["write_precision"] = precision
@@ -358,7 +455,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):
                 raise ConnectionError(CONNECTION_ERROR % exc) from exc
             except ApiException as exc:
                 if exc.status == CODE_INVALID_INPUTS:
-                    raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                    raise ValueError(WRITE_ERROR % (lines, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
         def query_v2(query, _=None):
@@ -384,7 +481,6 @@ def get_influx_connection(conf, test_write=False, test_read=False):
                 write_v2(b"")
             except ValueError:
                 pass
-            write_api = influx.write_api(write_options=ASYNCHRONOUS)
 
         if test_read:
             tables = query_v2(TEST_QUERY_V2)
@@ -424,10 +520,10 @@ def get_influx_connection(conf, test_write=False, test_read=False):
 
     influx = InfluxDBClient(**kwargs)
 
-    def write_v1(json):
-        """Write data to V1 influx."""
+    def write_v1(lines):
+        """Write lines of the line protocol to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(lines, time_precision=precision, protocol="line")
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -436,7 +532,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):
             raise ConnectionError(CONNECTION_ERROR % exc) from exc
         except exceptions.InfluxDBClientError as exc:
             if exc.code == CODE_INVALID_INPUTS:
-                raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                raise ValueError(WRITE_ERROR % (lines, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
     def query_v1(query, database=None):
@@ -478,9 +574,21 @@ def setup(hass, config):
         event_helper.call_later(hass, RETRY_INTERVAL, lambda _: setup(hass, config))
         return True
 
-    event_to_json = _generate_event_to_json(conf)
+    event_to_line = _generate_event_to_line(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    # Buffered lines can only be written with the settings they were encoded for
+    spill_settings = {
+        key: conf.get(key)
+        for key in (CONF_API_VERSION, CONF_PRECISION, CONF_DB_NAME, CONF_BUCKET)
+    }
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass,
+        influx,
+        event_to_line,
+        max_tries,
+        spill_settings,
+        conf[CONF_WRITER_THREADS],
+    )
     instance.start()
 
     def shutdown(event):
@@ -494,23 +602,166 @@ def setup(hass, config):
     return True
 
 
+class SpillBuffer:
+    """A file buffering lines until they can be written to InfluxDB.
+
+    Lines are appended while InfluxDB is unavailable, up to SPILL_MAX_SIZE
+    bytes, and written back one batch after each successful write. The first
+    line of the file is a comment with the settings the lines were encoded
+    for, buffers encoded for other settings are discarded.
+    """
+
+    def __init__(self, path: str, settings: Dict[str, Any]) -> None:
+        """Initialize the buffer."""
+        self.path = path
+        self.replay_path = f"{path}.replay"
+        self.dropped = 0
+        self._header = f"#{json.dumps(settings, sort_keys=True)}\n"
+        self._replay_offset = 0
+        self._lock = threading.Lock()
+        self._replay_lock = threading.Lock()
+        for spill_path in (self.path, self.replay_path):
+            self._discard_other_settings(spill_path)
+        self.pending = os.path.exists(path) or os.path.exists(self.replay_path)
+
+    def _discard_other_settings(self, path: str) -> None:
+        """Remove a buffer that was encoded for other settings."""
+        try:
+            with open(path, encoding="utf-8") as spill:
+                header = spill.readline()
+            if header != self._header:
+                _LOGGER.warning(
+                    "Discarding events buffered in %s for other settings", path
+                )
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as err:
+            _LOGGER.error("Unable to read buffered events from %s: %s", path, err)
+
+    def append(self, lines: List[str]) -> None:
+        """Buffer lines, dropping them if the buffer is full."""
+        data = "".join(f"{line}\n" for line in lines)
+        with self._lock:
+            try:
+                size = os.path.getsize(self.path)
+            except OSError:
+                size = 0
+            if not size:
+                data = f"{self._header}{data}"
+            if size + len(data) > SPILL_MAX_SIZE:
+                self.dropped += len(lines)
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as spill:
+                    spill.write(data)
+            except OSError as err:
+                _LOGGER.error("Unable to buffer events in %s: %s", self.path, err)
+                self.dropped += len(lines)
+                return
+            self.pending = True
+
+    def replay(self, write: Callable[[List[str]], None]) -> int:
+        """Write the next batch of buffered lines, return how many were written.
+
+        Lines are kept in the buffer if writing fails with a ConnectionError.
+        """
+        if not self.pending or not self._replay_lock.acquire(blocking=False):
+            return 0
+
+        try:
+            with self._lock:
+                if not os.path.exists(self.replay_path):
+                    os.replace(self.path, self.replay_path)
+                    self._replay_offset = 0
+
+            # The offset is not persisted, lines written before a restart are
+            # written again. InfluxDB overwrites the points with themselves.
+            lines = []
+            with open(self.replay_path, "rb") as spill:
+                spill.seek(self._replay_offset)
+                while len(lines) < SPILL_REPLAY_BATCH_SIZE:
+                    line = spill.readline()
+                    if not line:
+                        break
+                    if not line.startswith(b"#"):
+                        lines.append(line.decode("utf-8").rstrip("\n"))
+                offset = spill.tell()
+                done = not spill.read(1)
+
+            written = 0
+            if lines:
+                try:
+                    write(lines)
+                except ValueError as err:
+                    _LOGGER.error(err)
+                except ConnectionError:
+                    return 0
+                else:
+                    written = len(lines)
+
+            self._replay_offset = offset
+            if done:
+                os.remove(self.replay_path)
+                with self._lock:
+                    self.pending = os.path.exists(self.path)
+            return written
+        except OSError as err:
+            _LOGGER.error("Unable to replay events from %s: %s", self.path, err)
+            return 0
+        finally:
+            self._replay_lock.release()
+
+
 class InfluxThread(threading.Thread):
-    """A threaded event handler class."""
+    """A threaded event handler class.
+
+    Events are encoded in batches on this thread and written by a pool of
+    writer threads. Batches that cannot be written, and events that waited
+    too long to be encoded, are buffered on disk and written once InfluxDB
+    accepts writes again.
+    """
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(
+        self, hass, influx, event_to_line, max_tries, spill_settings, writers=1
+    ):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue = queue.Queue()
         self.influx = influx
-        self.event_to_json = event_to_json
+        self.event_to_line = event_to_line
         self.max_tries = max_tries
         self.write_errors = 0
+        self.write_latency = 0.0
+        self.dropped_events = 0
         self.shutdown = False
+        self.spill = SpillBuffer(
+            hass.config.path(STORAGE_DIR, SPILL_FILE), spill_settings
+        )
+        self._dropped_reported = 0
+        self._write_errors_lock = threading.Lock()
+        self._writers = ThreadPoolExecutor(writers, thread_name_prefix=DOMAIN)
+        self._writer_slots = threading.Semaphore(writers)
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Return metrics of the events written to InfluxDB."""
+        return {
+            "queue_depth": self.queue.qsize(),
+            "write_latency": self.write_latency,
+            "write_errors": self.write_errors,
+            "dropped_events": self.dropped_events + self.spill.dropped,
+            "buffered_events": self.spill.pending,
+        }
+
     @callback
     def _event_listener(self, event):
         """Listen for new messages on the bus and queue them for Influx."""
+        if self.queue.qsize() >= MAX_QUEUE_SIZE:
+            self.dropped_events += 1
+            return
         item = (time.monotonic(), event)
         self.queue.put(item)
 
@@ -519,17 +770,16 @@ class InfluxThread(threading.Thread):
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
-    def get_events_json(self):
-        """Return a batch of events formatted for writing."""
+    def get_events_lines(self) -> Tuple[int, List[str]]:
+        """Return a batch of events encoded for writing."""
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
 
         count = 0
-        json = []
-
-        dropped = 0
+        lines = []
+        old_lines = []
 
         try:
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
+            while len(lines) < BATCH_BUFFER_SIZE and not self.shutdown:
                 timeout = None if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
@@ -540,52 +790,84 @@ class InfluxThread(threading.Thread):
                     timestamp, event = item
                     age = time.monotonic() - timestamp
 
+                    line = self.event_to_line(event)
+                    if not line:
+                        continue
                     if age < queue_seconds:
-                        event_json = self.event_to_json(event)
-                        if event_json:
-                            json.append(event_json)
+                        lines.append(line)
                     else:
-                        dropped += 1
+                        old_lines.append(line)
 
         except queue.Empty:
             pass
 
-        if dropped:
-            _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
+        if old_lines:
+            _LOGGER.warning(CATCHING_UP_MESSAGE, len(old_lines))
+            self.spill.append(old_lines)
+
+        dropped = self.dropped_events + self.spill.dropped
+        if dropped != self._dropped_reported:
+            _LOGGER.warning(DROPPED_MESSAGE, dropped - self._dropped_reported)
+            self._dropped_reported = dropped
 
-        return count, json
+        return count, lines
 
-    def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
+    def write_to_influxdb(self, lines: List[str]) -> None:
+        """Write encoded events to influxdb, with retry."""
+        start = time.monotonic()
         for retry in range(self.max_tries + 1):
             try:
-                self.influx.write(json)
-
-                if self.write_errors:
-                    _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
-                    self.write_errors = 0
-
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
+                self.influx.write(lines)
                 break
             except ValueError as err:
                 _LOGGER.error(err)
-                break
+                return
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
-                else:
+                    continue
+                with self._write_errors_lock:
                     if not self.write_errors:
                         _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    self.write_errors += len(lines)
+                self.spill.append(lines)
+                return
+
+        self.write_latency = time.monotonic() - start
+        with self._write_errors_lock:
+            if self.write_errors:
+                _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
+                self.write_errors = 0
+
+        _LOGGER.debug(WROTE_MESSAGE, len(lines), self.write_latency, self.queue.qsize())
+
+        replayed = self.spill.replay(self.influx.write)
+        if replayed:
+            _LOGGER.debug(REPLAYED_MESSAGE, replayed)
+
+    def _write_batch(self, count: int, lines: List[str]) -> None:
+        """Write a batch on a writer thread and mark its events done."""
+        try:
+            self.write_to_influxdb(lines)
+        finally:
+            self._writer_slots.release()
+            self._events_done(count)
+
+    def _events_done(self, count: int) -> None:
+        """Mark processed events as done."""
+        for _ in range(count):
+            self.queue.task_done()
 
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
-            count, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
-            for _ in range(count):
-                self.queue.task_done()
+            count, lines = self.get_events_lines()
+            if not lines:
+                self._events_done(count)
+                continue
+            self._writer_slots.acquire()
+            self._writers.submit(self._write_batch, count, lines)
+        self._writers.shutdown(wait=True)
 
     def block_till_done(self):
         """Block till all events processed."""
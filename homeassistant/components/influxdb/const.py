@@ -32,6 +32,7 @@ CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
+CONF_WRITER_THREADS = "writer_threads"
 
 CONF_LANGUAGE = "language"
 CONF_QUERIES = "queries"
@@ -59,6 +60,7 @@ DEFAULT_RANGE_START = "-15m"
 DEFAULT_RANGE_STOP = "now()"
 DEFAULT_FUNCTION_FLUX = "|> limit(n: 1)"
 DEFAULT_MEASUREMENT_ATTR = "unit_of_measurement"
+DEFAULT_WRITER_THREADS = 1
 
 INFLUX_CONF_MEASUREMENT = "measurement"
 INFLUX_CONF_TAGS = "tags"
@@ -78,6 +80,12 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+# Events are dropped while this many are waiting to be encoded
+MAX_QUEUE_SIZE = 100000
+# Lines that could not be written are buffered in a file up to this size
+SPILL_FILE = "influxdb.spill"
+SPILL_MAX_SIZE = 50 * 1024 * 1024
+SPILL_REPLAY_BATCH_SIZE = 1000
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -117,9 +125,11 @@ QUERY_ERROR = (
     "Could not execute query '%s' due to '%s'. Check the syntax of your query."
 )
 RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
-CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
-RESUMED_MESSAGE = "Resumed, lost %d events."
-WROTE_MESSAGE = "Wrote %d events."
+CATCHING_UP_MESSAGE = "Catching up, buffered %d old events."
+RESUMED_MESSAGE = "Resumed, buffered %d events while InfluxDB was unavailable."
+WROTE_MESSAGE = "Wrote %d events in %.3f seconds, %d events queued."
+REPLAYED_MESSAGE = "Wrote %d buffered events."
+DROPPED_MESSAGE = "Dropped %d events, the queue or the buffer is full."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
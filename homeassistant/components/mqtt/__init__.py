@@ -1,14 +1,16 @@
 """Support for MQTT message handling."""
 import asyncio
-from functools import lru_cache, partial, wraps
+from collections import deque
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
 from operator import attrgetter
 import os
 import ssl
+import threading
 import time
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
 import uuid
 
 import attr
@@ -65,7 +67,7 @@ from .const import (
     PROTOCOL_311,
 )
 from .discovery import LAST_DISCOVERY
-from .models import Message, MessageCallbackType, PublishPayloadType
+from .models import Message, MessageCallbackType, PublishPayloadType, ReceivePayload
 from .util import _VALID_QOS_SCHEMA, valid_publish_topic, valid_subscribe_topic
 
 _LOGGER = logging.getLogger(__name__)
@@ -104,6 +106,10 @@ CONNECTION_FAILED_RECOVERABLE = "connection_failed_recoverable"
 DISCOVERY_COOLDOWN = 2
 TIMEOUT_ACK = 10
 
+# Bounds for the number of inbound messages handled per event loop iteration
+MIN_MESSAGE_BATCH = 16
+MAX_MESSAGE_BATCH = 1024
+
 PLATFORMS = [
     "alarm_control_panel",
     "binary_sensor",
@@ -529,12 +535,122 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str = attr.ib(default="utf-8")
 
 
+class _SubscriptionNode:
+    """Node in the subscription trie, one per topic filter level."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: Dict[str, _SubscriptionNode] = {}
+        self.subscriptions: Dict[Subscription, None] = {}
+
+
+class SubscriptionTrie:
+    """Prefix tree of subscriptions keyed by topic filter level.
+
+    Matching a topic walks the trie once, following the literal level as
+    well as any `+` and `#` wildcard branches, so its cost depends on the
+    depth of the topic rather than on the number of subscriptions.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionNode()
+        self._order: Dict[Subscription, int] = {}
+        self._counter = 0
+
+    def __contains__(self, subscription: object) -> bool:
+        """Return if the subscription is in the trie."""
+        return subscription in self._order
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over a snapshot of the subscriptions in insertion order."""
+        return iter(list(self._order))
+
+    def __len__(self) -> int:
+        """Return the number of subscriptions."""
+        return len(self._order)
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _SubscriptionNode()
+            node = child
+        node.subscriptions[subscription] = None
+        self._order[subscription] = self._counter
+        self._counter += 1
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription and prune the branches left empty."""
+        del self._order[subscription]
+        path = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.subscriptions[subscription]
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.children or child.subscriptions:
+                break
+            del parent.children[level]
+
+    def has_topic(self, topic: str) -> bool:
+        """Return if any subscription uses exactly this topic filter."""
+        node = self._root
+        for level in topic.split("/"):
+            if level not in node.children:
+                return False
+            node = node.children[level]
+        return bool(node.subscriptions)
+
+    def match(self, topic: str) -> List[Subscription]:
+        """Return the subscriptions matching a topic in insertion order."""
+        levels = topic.split("/")
+        # Wildcards at the first level do not match topics starting with $
+        wildcards = not topic.startswith("$")
+        matches: List[Subscription] = []
+        nodes = [self._root]
+
+        for idx, level in enumerate(levels):
+            next_nodes = []
+            for node in nodes:
+                children = node.children
+                if wildcards or idx > 0:
+                    multi = children.get("#")
+                    if multi is not None:
+                        matches.extend(multi.subscriptions)
+                    single = children.get("+")
+                    if single is not None:
+                        next_nodes.append(single)
+                child = children.get(level)
+                if child is not None:
+                    next_nodes.append(child)
+            if not next_nodes:
+                break
+            nodes = next_nodes
+        else:
+            for node in nodes:
+                matches.extend(node.subscriptions)
+                # A trailing # also matches the parent level itself
+                multi = node.children.get("#")
+                if multi is not None:
+                    matches.extend(multi.subscriptions)
+
+        if len(matches) > 1:
+            matches.sort(key=self._order.__getitem__)
+        return matches
+
+
 class MQTT:
     """Home Assistant MQTT client."""
 
@@ -552,7 +668,7 @@ class MQTT:
         self.hass = hass
         self.config_entry = config_entry
         self.conf = conf
-        self.subscriptions: List[Subscription] = []
+        self.subscriptions = SubscriptionTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -561,6 +677,21 @@ class MQTT:
 
         self._pending_operations = {}
 
+        # Messages received on the paho network thread waiting to be handled
+        # on the event loop, with the monotonic time they were received.
+        self._message_buffer: Deque[Tuple[Any, float]] = deque()
+        self._message_buffer_lock = threading.Lock()
+        self._message_drain_scheduled = False
+        self._message_batch_size = MIN_MESSAGE_BATCH
+        self._message_queue_stats = {
+            "max_depth": 0,
+            "batches": 0,
+            "messages": 0,
+            "last_batch_size": 0,
+            "last_batch_latency": 0.0,
+            "max_batch_latency": 0.0,
+        }
+
         if self.hass.state == CoreState.running:
             self._ha_started.set()
         else:
@@ -739,11 +870,8 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
-        self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
+        self.subscriptions.add(subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -756,9 +884,8 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if self.subscriptions.has_topic(topic):
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
@@ -846,16 +973,66 @@ class MQTT:
             )
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+        Runs on the paho network thread. Messages are buffered and the event
+        loop is only woken up when no drain of the buffer is pending yet.
+        """
+        with self._message_buffer_lock:
+            self._message_buffer.append((msg, time.monotonic()))
+            depth = len(self._message_buffer)
+            if depth > self._message_queue_stats["max_depth"]:
+                self._message_queue_stats["max_depth"] = depth
+            if self._message_drain_scheduled:
+                return
+            self._message_drain_scheduled = True
+        self.hass.loop.call_soon_threadsafe(self._async_drain_messages)
+
+    @callback
+    def _async_drain_messages(self) -> None:
+        """Handle a batch of buffered messages on the event loop."""
+        with self._message_buffer_lock:
+            count = min(self._message_batch_size, len(self._message_buffer))
+            batch = [self._message_buffer.popleft() for _ in range(count)]
+            remaining = len(self._message_buffer)
+            if not remaining:
+                self._message_drain_scheduled = False
+
+        for msg, _ in batch:
+            try:
+                self._mqtt_handle_message(msg)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error handling message on %s", msg.topic)
+
+        stats = self._message_queue_stats
+        if batch:
+            latency = time.monotonic() - batch[0][1]
+            stats["batches"] += 1
+            stats["messages"] += count
+            stats["last_batch_size"] = count
+            stats["last_batch_latency"] = latency
+            stats["max_batch_latency"] = max(stats["max_batch_latency"], latency)
+
+        if remaining:
+            # Falling behind, grow the batch so the backlog drains in fewer
+            # loop iterations. Yield to the loop before handling the rest.
+            self._message_batch_size = min(
+                self._message_batch_size * 2, MAX_MESSAGE_BATCH
+            )
+            self.hass.loop.call_soon(self._async_drain_messages)
+        elif count < self._message_batch_size // 2:
+            self._message_batch_size = max(
+                self._message_batch_size // 2, MIN_MESSAGE_BATCH
+            )
+
+    @callback
+    def async_message_queue_info(self) -> Dict[str, Any]:
+        """Return debug info about the inbound message queue."""
+        return {
+            "depth": len(self._message_buffer),
+            "batch_size": self._message_batch_size,
+            **self._message_queue_stats,
+        }
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -867,23 +1044,32 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        subscriptions = self._matching_subscriptions(msg.topic)
+        subscriptions = self.subscriptions.match(msg.topic)
+        # Payloads decoded per encoding, shared by all subscriptions
+        payloads: Dict[Optional[str], Optional[SubscribePayloadType]] = {
+            None: msg.payload
+        }
 
         for subscription in subscriptions:
 
-            payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
+            if subscription.encoding in payloads:
+                payload = payloads[subscription.encoding]
+            else:
                 try:
-                    payload = msg.payload.decode(subscription.encoding)
+                    payload = ReceivePayload(msg.payload.decode(subscription.encoding))
                 except (AttributeError, UnicodeDecodeError):
-                    _LOGGER.warning(
-                        "Can't decode payload %s on %s with encoding %s (for %s)",
-                        msg.payload[0:8192],
-                        msg.topic,
-                        subscription.encoding,
-                        subscription.job,
-                    )
-                    continue
+                    payload = None
+                payloads[subscription.encoding] = payload
+
+            if payload is None and subscription.encoding is not None:
+                _LOGGER.warning(
+                    "Can't decode payload %s on %s with encoding %s (for %s)",
+                    msg.payload[0:8192],
+                    msg.topic,
+                    subscription.encoding,
+                    subscription.job,
+                )
+                continue
 
             self.hass.async_run_hass_job(
                 subscription.job,
@@ -967,16 +1153,6 @@ def _raise_on_error(result_code: int) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
@@ -985,6 +1161,7 @@ async def websocket_mqtt_info(hass, connection, msg):
     """Get MQTT debug info for device."""
     device_id = msg["device_id"]
     mqtt_info = await debug_info.info_for_device(hass, device_id)
+    mqtt_info["message_queue"] = hass.data[DATA_MQTT].async_message_queue_info()
 
     connection.send_result(msg["id"], mqtt_info)
 
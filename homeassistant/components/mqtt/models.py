@@ -4,9 +4,19 @@ from typing import Callable, Optional, Union
 
 import attr
 
+from homeassistant.helpers.template import JSONValueStr
+
 PublishPayloadType = Union[str, bytes, int, float, None]
 
 
+class ReceivePayload(JSONValueStr):
+    """Decoded MQTT payload shared by all subscribers of a message.
+
+    The payload is parsed as JSON at most once, the first time `json` is
+    accessed by a template.
+    """
+
+
 @attr.s(slots=True, frozen=True)
 class Message:
     """MQTT Message."""
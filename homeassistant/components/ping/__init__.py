@@ -1,28 +1,314 @@
 """The ping component."""
+import asyncio
+from datetime import timedelta
+import logging
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
-from homeassistant.core import callback
+from icmplib import (
+    Host,
+    ICMPLibError,
+    ICMPRequest,
+    ICMPSocketError,
+    ICMPv4Socket,
+    ICMPv6Socket,
+    NameLookupError,
+    SocketPermissionError,
+    TimeoutExceeded,
+    is_ipv6_address,
+    ping as icmp_ping,
+    resolve,
+)
+from icmplib.sockets import ICMPSocket
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+_LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "ping"
 PLATFORMS = ["binary_sensor"]
 
 PING_ID = "ping_id"
+PING_ENGINE = "ping_engine"
 DEFAULT_START_ID = 129
 MAX_PING_ID = 65534
 
+ENGINE_TIMEOUT = 1
+
 
 @callback
-def async_get_next_ping_id(hass):
+def async_get_next_ping_id(hass, count=1):
     """Find the next id to use in the outbound ping.
 
+    Reserves a block of count consecutive ids and returns the first one.
+
     Must be called in async
     """
     current_id = hass.data.setdefault(DOMAIN, {}).get(PING_ID, DEFAULT_START_ID)
 
-    if current_id == MAX_PING_ID:
+    if current_id + count > MAX_PING_ID:
         next_id = DEFAULT_START_ID
     else:
         next_id = current_id + 1
 
-    hass.data[DOMAIN][PING_ID] = next_id
+    hass.data[DOMAIN][PING_ID] = next_id + count - 1
 
     return next_id
+
+
+async def async_get_ping_engine(hass: HomeAssistant) -> Optional["PingEngine"]:
+    """Return the shared ping engine.
+
+    Returns None if neither raw nor datagram ICMP sockets can be opened, in
+    which case callers should fall back to the ping binary.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if PING_ENGINE not in domain_data:
+        domain_data[PING_ENGINE] = hass.async_create_task(
+            _async_create_ping_engine(hass)
+        )
+    return await domain_data[PING_ENGINE]
+
+
+async def _async_create_ping_engine(hass: HomeAssistant) -> Optional["PingEngine"]:
+    """Create the ping engine with the best available socket type."""
+
+    def _check_socket(privileged):
+        """Verify we can create the ICMP socket."""
+        try:
+            icmp_ping("127.0.0.1", count=0, timeout=0, privileged=privileged)
+        except SocketPermissionError:
+            return False
+        return True
+
+    for privileged in (True, False):
+        if await hass.async_add_executor_job(_check_socket, privileged):
+            _LOGGER.debug("Using ping engine with privileged=%s", privileged)
+            return PingEngine(hass, privileged)
+
+    return None
+
+
+def _ping_batches(
+    batches: List[Tuple[int, int, List[str]]], privileged: bool
+) -> Dict[Tuple[str, int], Host]:
+    """Ping each batch of hosts from a single socket per address family.
+
+    All echo requests are sent before any reply is awaited, the replies are
+    then collected until one deadline for the whole sweep, so hosts that do
+    not reply do not delay the others.
+    """
+    results = {}
+    sockets: Dict[bool, ICMPSocket] = {}
+    # Requests of each address and packet count, and the hosts resolving to it
+    requests: Dict[Tuple[str, int], List[ICMPRequest]] = {}
+    hosts_by_request: Dict[Tuple[str, int], List[str]] = {}
+    sequence = 0
+
+    for count, first_id, hosts in batches:
+        next_id = first_id
+        for host in hosts:
+            try:
+                address = resolve(host)
+            except NameLookupError:
+                _LOGGER.debug("Unable to resolve %s", host)
+                results[host, count] = Host(host, 0, 0, 0, count, 0)
+                continue
+            key = (address, count)
+            if key not in requests:
+                requests[key] = [
+                    ICMPRequest(
+                        destination=address,
+                        id=next_id,
+                        sequence=(sequence + index) % 0x10000,
+                    )
+                    for index in range(count)
+                ]
+                sequence += count
+                next_id += 1
+            hosts_by_request.setdefault(key, []).append(host)
+
+    # Replies are matched by identifier and sequence, the identifier of
+    # datagram sockets is replaced by the kernel when sending
+    pending: Dict[bool, Dict[Tuple[int, int], ICMPRequest]] = {}
+    replies: Dict[int, float] = {}
+    try:
+        for (address, _), address_requests in requests.items():
+            ipv6 = is_ipv6_address(address)
+            if ipv6 not in sockets:
+                socket_class = ICMPv6Socket if ipv6 else ICMPv4Socket
+                sockets[ipv6] = socket_class(privileged=privileged)
+            for request in address_requests:
+                try:
+                    sockets[ipv6].send(request)
+                except ICMPSocketError as err:
+                    _LOGGER.debug("Unable to ping %s: %s", address, err)
+                    continue
+                pending.setdefault(ipv6, {})[request.id, request.sequence] = request
+
+        deadline = time.monotonic() + ENGINE_TIMEOUT
+        for ipv6, sock in sockets.items():
+            family_pending = pending.get(ipv6, {})
+            while family_pending:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    reply = sock.receive(timeout=timeout)
+                    reply.raise_for_status()
+                except TimeoutExceeded:
+                    break
+                except ICMPLibError:
+                    continue
+                request = family_pending.pop((reply.id, reply.sequence), None)
+                if request is not None:
+                    replies[id(request)] = (reply.time - request.time) * 1000
+    except ICMPLibError as err:
+        _LOGGER.error("Error sending ICMP echo requests: %s", err)
+    finally:
+        for sock in sockets.values():
+            sock.close()
+
+    for (address, count), address_requests in requests.items():
+        round_trip_times = [
+            replies[id(request)]
+            for request in address_requests
+            if id(request) in replies
+        ]
+        if round_trip_times:
+            host_result = Host(
+                address,
+                min(round_trip_times),
+                sum(round_trip_times) / len(round_trip_times),
+                max(round_trip_times),
+                count,
+                len(round_trip_times),
+            )
+        else:
+            host_result = Host(address, 0, 0, 0, count, 0)
+        for host in hosts_by_request[address, count]:
+            results[host, count] = host_result
+
+    return results
+
+
+class PingEngine:
+    """Send ICMP echo requests to many hosts at once.
+
+    Requests made during the same event loop iteration are coalesced into a
+    single sweep. A sweep runs one executor job that pings all hosts from one
+    socket per address family, matching the replies to the requests by
+    identifier and sequence number.
+    """
+
+    def __init__(self, hass: HomeAssistant, privileged: bool) -> None:
+        """Initialize the ping engine."""
+        self.hass = hass
+        self.privileged = privileged
+        self._pending: Dict[Tuple[str, int], List[asyncio.Future]] = {}
+        self._tracked: Dict[timedelta, Dict[object, Tuple[str, int, Callable]]] = {}
+        self._unsub_intervals: Dict[timedelta, CALLBACK_TYPE] = {}
+        self._sweeping_intervals: Set[timedelta] = set()
+
+    async def async_ping(self, host: str, count: int) -> Host:
+        """Ping a host as part of the next sweep."""
+        future = self.hass.loop.create_future()
+        if not self._pending:
+            self.hass.loop.call_soon(self._async_start_sweep)
+        self._pending.setdefault((host, count), []).append(future)
+        return await future
+
+    async def async_ping_hosts(self, targets: Iterable[Tuple[str, int]]) -> List[Host]:
+        """Ping several hosts in a single sweep."""
+        return await asyncio.gather(
+            *(self.async_ping(host, count) for host, count in targets)
+        )
+
+    @callback
+    def async_track_host(
+        self,
+        host: str,
+        count: int,
+        interval: timedelta,
+        action: Callable[[Host], None],
+    ) -> CALLBACK_TYPE:
+        """Ping a host every interval and pass the result to a callback.
+
+        All hosts tracked with the same interval are pinged in one sweep.
+        """
+        token = object()
+        tracked = self._tracked.setdefault(interval, {})
+        tracked[token] = (host, count, action)
+
+        if interval not in self._unsub_intervals:
+
+            async def _async_sweep_interval(now):
+                """Ping all hosts tracked with this interval."""
+                if interval in self._sweeping_intervals:
+                    _LOGGER.debug(
+                        "Skipping ping sweep every %s, the previous one is running",
+                        interval,
+                    )
+                    return
+                self._sweeping_intervals.add(interval)
+                try:
+                    entries = list(self._tracked.get(interval, {}).values())
+                    results = await self.async_ping_hosts(
+                        (entry[0], entry[1]) for entry in entries
+                    )
+                finally:
+                    self._sweeping_intervals.discard(interval)
+                for entry, result in zip(entries, results):
+                    entry[2](result)
+
+            self._unsub_intervals[interval] = async_track_time_interval(
+                self.hass, _async_sweep_interval, interval
+            )
+
+        @callback
+        def _async_untrack():
+            """Stop tracking the host."""
+            tracked.pop(token, None)
+            if tracked or self._tracked.get(interval) is not tracked:
+                return
+            del self._tracked[interval]
+            self._unsub_intervals.pop(interval)()
+
+        return _async_untrack
+
+    @callback
+    def _async_start_sweep(self) -> None:
+        """Ping all the pending hosts."""
+        pending, self._pending = self._pending, {}
+        self.hass.async_create_task(self._async_sweep(pending))
+
+    async def _async_sweep(
+        self, pending: Dict[Tuple[str, int], List[asyncio.Future]]
+    ) -> None:
+        """Run a sweep and resolve the futures waiting on it."""
+        by_count: Dict[int, List[str]] = {}
+        for host, count in pending:
+            by_count.setdefault(count, []).append(host)
+
+        batches = [
+            (count, async_get_next_ping_id(self.hass, len(hosts)), hosts)
+            for count, hosts in by_count.items()
+        ]
+        _LOGGER.debug("Pinging %d hosts", len(pending))
+
+        try:
+            results = await self.hass.async_add_executor_job(
+                _ping_batches, batches, self.privileged
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(err)
+            return
+
+        for key, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(results[key])
@@ -1,13 +1,12 @@
 """Tracks the latency of a host by sending ICMP echo requests (ping)."""
 import asyncio
 from datetime import timedelta
-from functools import partial
 import logging
 import re
 import sys
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
-from icmplib import SocketPermissionError, ping as icmp_ping
+from icmplib import Host
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import (
@@ -15,11 +14,12 @@ from homeassistant.components.binary_sensor import (
     PLATFORM_SCHEMA,
     BinarySensorEntity,
 )
-from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_SCAN_INTERVAL
+from homeassistant.core import CALLBACK_TYPE, callback
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.reload import setup_reload_service
+from homeassistant.helpers.reload import async_setup_reload_service
 
-from . import DOMAIN, PLATFORMS, async_get_next_ping_id
+from . import DOMAIN, PLATFORMS, PingEngine, async_get_ping_engine
 from .const import PING_TIMEOUT
 
 _LOGGER = logging.getLogger(__name__)
@@ -60,34 +60,41 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 )
 
 
-def setup_platform(hass, config, add_entities, discovery_info=None) -> None:
+async def async_setup_platform(
+    hass, config, async_add_entities, discovery_info=None
+) -> None:
     """Set up the Ping Binary sensor."""
-    setup_reload_service(hass, DOMAIN, PLATFORMS)
+    await async_setup_reload_service(hass, DOMAIN, PLATFORMS)
 
     host = config[CONF_HOST]
     count = config[CONF_PING_COUNT]
     name = config.get(CONF_NAME, f"{DEFAULT_NAME} {host}")
+    interval = config.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL)
 
-    try:
-        # Verify we can create a raw socket, or
-        # fallback to using a subprocess
-        icmp_ping("127.0.0.1", count=0, timeout=0)
-        ping_cls = PingDataICMPLib
-    except SocketPermissionError:
-        ping_cls = PingDataSubProcess
+    # Use the shared engine if we can create an ICMP socket, or
+    # fallback to using a subprocess
+    engine = await async_get_ping_engine(hass)
+    if engine is not None:
+        ping_data = PingDataICMPLib(hass, host, count, engine)
+    else:
+        ping_data = PingDataSubProcess(hass, host, count)
 
-    ping_data = ping_cls(hass, host, count)
-
-    add_entities([PingBinarySensor(name, ping_data)], True)
+    async_add_entities([PingBinarySensor(name, ping_data, interval)], True)
 
 
 class PingBinarySensor(BinarySensorEntity):
     """Representation of a Ping Binary sensor."""
 
-    def __init__(self, name: str, ping) -> None:
+    def __init__(self, name: str, ping, interval) -> None:
         """Initialize the Ping Binary sensor."""
         self._name = name
         self._ping = ping
+        self._interval = interval
+
+    @property
+    def should_poll(self) -> bool:
+        """Return True if the sensor is not updated by the ping engine."""
+        return not isinstance(self._ping, PingDataICMPLib)
 
     @property
     def name(self) -> str:
@@ -115,6 +122,13 @@ class PingBinarySensor(BinarySensorEntity):
                 ATTR_ROUND_TRIP_TIME_MIN: self._ping.data["min"],
             }
 
+    async def async_added_to_hass(self) -> None:
+        """Let the ping engine update the sensor in its sweeps."""
+        if isinstance(self._ping, PingDataICMPLib):
+            self.async_on_remove(
+                self._ping.async_track(self._interval, self.async_write_ha_state)
+            )
+
     async def async_update(self) -> None:
         """Get the latest data."""
         await self._ping.async_update()
@@ -133,20 +147,37 @@ class PingData:
 
 
 class PingDataICMPLib(PingData):
-    """The Class for handling the data retrieval using icmplib."""
+    """The Class for handling the data retrieval using the ping engine."""
+
+    def __init__(self, hass, host, count, engine: PingEngine) -> None:
+        """Initialize the data object."""
+        super().__init__(hass, host, count)
+        self._engine = engine
+
+    @callback
+    def async_track(
+        self, interval, update_callback: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Update the data in the engine sweeps and call back afterwards."""
+
+        @callback
+        def _async_handle_result(data: Host) -> None:
+            """Process the result of a sweep."""
+            self._process(data)
+            update_callback()
+
+        return self._engine.async_track_host(
+            self._ip_address, self._count, interval, _async_handle_result
+        )
 
     async def async_update(self) -> None:
         """Retrieve the latest details from the host."""
         _LOGGER.debug("ping address: %s", self._ip_address)
-        data = await self.hass.async_add_executor_job(
-            partial(
-                icmp_ping,
-                self._ip_address,
-                count=self._count,
-                timeout=1,
-                id=async_get_next_ping_id(self.hass),
-            )
-        )
+        self._process(await self._engine.async_ping(self._ip_address, self._count))
+
+    @callback
+    def _process(self, data: Host) -> None:
+        """Store the statistics of the echo requests."""
         self.available = data.is_alive
         if not self.available:
             self.data = False
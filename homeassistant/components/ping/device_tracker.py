@@ -1,10 +1,10 @@
 """Tracks devices by sending a ICMP echo request (ping)."""
+import asyncio
 from datetime import timedelta
 import logging
 import subprocess
 import sys
 
-from icmplib import SocketPermissionError, ping as icmp_ping
 import voluptuous as vol
 
 from homeassistant import const, util
@@ -15,10 +15,9 @@ from homeassistant.components.device_tracker.const import (
     SOURCE_TYPE_ROUTER,
 )
 import homeassistant.helpers.config_validation as cv
-from homeassistant.util.async_ import run_callback_threadsafe
 from homeassistant.util.process import kill_subprocess
 
-from . import async_get_next_ping_id
+from . import async_get_ping_engine
 from .const import PING_ATTEMPTS_COUNT, PING_TIMEOUT
 
 _LOGGER = logging.getLogger(__name__)
@@ -76,28 +75,30 @@ class HostSubProcess:
 
 
 class HostICMPLib:
-    """Host object with ping detection."""
+    """Host object with ping detection through the shared ping engine."""
 
-    def __init__(self, ip_address, dev_id, hass, config):
+    def __init__(self, ip_address, dev_id, hass, config, engine):
         """Initialize the Host pinger."""
         self.hass = hass
         self.ip_address = ip_address
         self.dev_id = dev_id
         self._count = config[CONF_PING_COUNT]
+        self._engine = engine
 
     def ping(self):
-        """Send an ICMP echo request and return True if success."""
-        next_id = run_callback_threadsafe(
-            self.hass.loop, async_get_next_ping_id, self.hass
+        """Send ICMP echo requests and return the result."""
+        return asyncio.run_coroutine_threadsafe(
+            self._engine.async_ping(self.ip_address, PING_ATTEMPTS_COUNT),
+            self.hass.loop,
         ).result()
 
-        return icmp_ping(
-            self.ip_address, count=PING_ATTEMPTS_COUNT, timeout=1, id=next_id
-        ).is_alive
-
     def update(self, see):
         """Update device state by sending one or more ping messages."""
-        if self.ping():
+        self.process(self.ping(), see)
+
+    def process(self, result, see):
+        """Update device state from the result of the echo requests."""
+        if result.is_alive:
             see(dev_id=self.dev_id, source_type=SOURCE_TYPE_ROUTER)
             return True
 
@@ -109,21 +110,36 @@ class HostICMPLib:
         )
 
 
+def update_icmplib_hosts(hass, engine, hosts, see):
+    """Update all the hosts in a single sweep of the ping engine."""
+    results = asyncio.run_coroutine_threadsafe(
+        engine.async_ping_hosts(
+            (host.ip_address, PING_ATTEMPTS_COUNT) for host in hosts
+        ),
+        hass.loop,
+    ).result()
+    for host, result in zip(hosts, results):
+        host.process(result, see)
+
+
 def setup_scanner(hass, config, see, discovery_info=None):
     """Set up the Host objects and return the update function."""
 
-    try:
-        # Verify we can create a raw socket, or
-        # fallback to using a subprocess
-        icmp_ping("127.0.0.1", count=0, timeout=0)
-        host_cls = HostICMPLib
-    except SocketPermissionError:
-        host_cls = HostSubProcess
-
-    hosts = [
-        host_cls(ip, dev_id, hass, config)
-        for (dev_id, ip) in config[const.CONF_HOSTS].items()
-    ]
+    # Use the shared engine if we can create an ICMP socket, or
+    # fallback to using a subprocess
+    engine = asyncio.run_coroutine_threadsafe(
+        async_get_ping_engine(hass), hass.loop
+    ).result()
+    if engine is not None:
+        hosts = [
+            HostICMPLib(ip, dev_id, hass, config, engine)
+            for (dev_id, ip) in config[const.CONF_HOSTS].items()
+        ]
+    else:
+        hosts = [
+            HostSubProcess(ip, dev_id, hass, config)
+            for (dev_id, ip) in config[const.CONF_HOSTS].items()
+        ]
     interval = config.get(
         CONF_SCAN_INTERVAL,
         timedelta(seconds=len(hosts) * config[CONF_PING_COUNT]) + SCAN_INTERVAL,
@@ -137,8 +153,11 @@ def setup_scanner(hass, config, see, discovery_info=None):
     def update_interval(now):
         """Update all the hosts on every interval time."""
         try:
-            for host in hosts:
-                host.update(see)
+            if engine is not None:
+                update_icmplib_hosts(hass, engine, hosts, see)
+            else:
+                for host in hosts:
+                    host.update(see)
         finally:
             hass.helpers.event.track_point_in_utc_time(
                 update_interval, util.dt.utcnow() + interval
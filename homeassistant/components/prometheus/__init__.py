@@ -25,6 +25,7 @@ from homeassistant.const import (
     ATTR_TEMPERATURE,
     ATTR_UNIT_OF_MEASUREMENT,
     CONTENT_TYPE_TEXT_PLAIN,
+    EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
     PERCENTAGE,
     STATE_ON,
@@ -49,6 +50,7 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_DEFAULT_METRIC = "default_metric"
 CONF_OVERRIDE_METRIC = "override_metric"
+CONF_COLLECT_ON_SCRAPE = "collect_on_scrape"
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_METRIC): cv.string}
 )
@@ -61,6 +63,7 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_PROM_NAMESPACE): cv.string,
                 vol.Optional(CONF_DEFAULT_METRIC): cv.string,
                 vol.Optional(CONF_OVERRIDE_METRIC): cv.string,
+                vol.Optional(CONF_COLLECT_ON_SCRAPE, default=False): cv.boolean,
                 vol.Optional(CONF_COMPONENT_CONFIG, default={}): vol.Schema(
                     {cv.entity_id: COMPONENT_CONFIG_SCHEMA_ENTRY}
                 ),
@@ -79,8 +82,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass, config):
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(prometheus_client))
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -101,14 +102,43 @@ def setup(hass, config):
         component_config,
         override_metric,
         default_metric,
+        conf[CONF_COLLECT_ON_SCRAPE],
     )
 
+    hass.http.register_view(PrometheusView(prometheus_client, metrics))
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_event)
+
+    if metrics.collector is not None:
+        prometheus_client.REGISTRY.register(metrics.collector)
+
+        def unregister_collector(event):
+            """Stop exporting the states of this instance."""
+            prometheus_client.REGISTRY.unregister(metrics.collector)
+
+        hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, unregister_collector)
+
     return True
 
 
+class StateCollector:
+    """Export the metrics generated from the states at the last scrape."""
+
+    def __init__(self):
+        """Initialize the state collector."""
+        self.families = []
+
+    def collect(self):
+        """Return the metric families of the last scrape."""
+        return self.families
+
+
 class PrometheusMetrics:
-    """Model all of the metrics which should be exposed to Prometheus."""
+    """Model all of the metrics which should be exposed to Prometheus.
+
+    By default the metrics are updated on every state change. When collecting
+    on scrape, state changes only update the counters and the gauges are
+    generated from the current states when Prometheus scrapes them.
+    """
 
     def __init__(
         self,
@@ -119,9 +149,14 @@ class PrometheusMetrics:
         component_config,
         override_metric,
         default_metric,
+        collect_on_scrape=False,
+        registry=None,
     ):
         """Initialize Prometheus Metrics."""
         self.prometheus_cli = prometheus_cli
+        self._namespace = namespace
+        self._registry = registry if registry is not None else prometheus_cli.REGISTRY
+        self.collector = StateCollector() if collect_on_scrape else None
         self._component_config = component_config
         self._override_metric = override_metric
         self._default_metric = default_metric
@@ -154,17 +189,27 @@ class PrometheusMetrics:
         if not self._filter(state.entity_id):
             return
 
-        handler = f"_handle_{domain}"
+        if self.collector is None:
+            self.handle_state(state)
 
-        if hasattr(self, handler) and state.state != STATE_UNAVAILABLE:
-            getattr(self, handler)(state)
+        counter = f"_count_{domain}"
+
+        if hasattr(self, counter) and state.state != STATE_UNAVAILABLE:
+            getattr(self, counter)(state)
 
-        labels = self._labels(state)
         state_change = self._metric(
             "state_change", self.prometheus_cli.Counter, "The number of state changes"
         )
-        state_change.labels(**labels).inc()
+        state_change.labels(**self._labels(state)).inc()
+
+    def handle_state(self, state):
+        """Update the gauges of a state."""
+        handler = f"_handle_{state.domain}"
 
+        if hasattr(self, handler) and state.state != STATE_UNAVAILABLE:
+            getattr(self, handler)(state)
+
+        labels = self._labels(state)
         entity_available = self._metric(
             "entity_available",
             self.prometheus_cli.Gauge,
@@ -179,6 +224,29 @@ class PrometheusMetrics:
         )
         last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
 
+    def collect_states(self, states):
+        """Generate the gauges of the states for the current scrape.
+
+        Runs in the executor, the counters are kept up to date by the events.
+        """
+        registry = self.prometheus_cli.CollectorRegistry(auto_describe=False)
+        metrics = PrometheusMetrics(
+            self.prometheus_cli,
+            self._filter,
+            self._namespace,
+            self._climate_units,
+            self._component_config,
+            self._override_metric,
+            self._default_metric,
+            registry=registry,
+        )
+
+        for state in states:
+            if self._filter(state.entity_id):
+                metrics.handle_state(state)
+
+        self.collector.families = list(registry.collect())
+
     def _handle_attributes(self, state):
         for key, value in state.attributes.items():
             metric = self._metric(
@@ -204,7 +272,9 @@ class PrometheusMetrics:
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
-            self._metrics[metric] = factory(full_metric_name, documentation, labels)
+            self._metrics[metric] = factory(
+                full_metric_name, documentation, labels, registry=self._registry
+            )
             return self._metrics[metric]
 
     @staticmethod
@@ -463,7 +533,7 @@ class PrometheusMetrics:
     def _handle_zwave(self, state):
         self._battery(state)
 
-    def _handle_automation(self, state):
+    def _count_automation(self, state):
         metric = self._metric(
             "automation_triggered_count",
             self.prometheus_cli.Counter,
@@ -479,15 +549,27 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli):
+    def __init__(self, prometheus_cli, metrics):
         """Initialize Prometheus view."""
         self.prometheus_cli = prometheus_cli
+        self.metrics = metrics
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
+        hass = request.app["hass"]
+
+        states = None
+        if self.metrics.collector is not None:
+            states = hass.states.async_all()
 
         return web.Response(
-            body=self.prometheus_cli.generate_latest(),
+            body=await hass.async_add_executor_job(self._generate_latest, states),
             content_type=CONTENT_TYPE_TEXT_PLAIN,
         )
+
+    def _generate_latest(self, states):
+        """Generate the metrics, collecting the states if given."""
+        if states is not None:
+            self.metrics.collect_states(states)
+        return self.prometheus_cli.generate_latest()
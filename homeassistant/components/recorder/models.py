@@ -18,7 +18,7 @@ from sqlalchemy.orm import relationship
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Context, Event, EventOrigin, State, split_entity_id
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_dumps
 import homeassistant.util.dt as dt_util
 
 # SQLAlchemy Schema
@@ -146,7 +146,8 @@ class States(Base):  # type: ignore
         else:
             dbstate.domain = state.domain
             dbstate.state = state.state
-            dbstate.attributes = json.dumps(dict(state.attributes), cls=JSONEncoder)
+            # MySQL databases with the 3 byte utf8 charset reject 4 byte characters
+            dbstate.attributes = json_dumps(state.attributes, ensure_ascii=True)
             dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
 
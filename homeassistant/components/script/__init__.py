@@ -24,6 +24,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.script import (
     ATTR_CUR,
     ATTR_MAX,
@@ -51,6 +52,8 @@ CONF_FIELDS = "fields"
 
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
+DATA_REFERENCE_INDEX = "script_reference_index"
+
 EVENT_SCRIPT_STARTED = "script_started"
 
 
@@ -91,16 +94,10 @@ def is_on(hass, entity_id):
 @callback
 def scripts_with_entity(hass: HomeAssistant, entity_id: str) -> List[str]:
     """Return all scripts that reference the entity."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if entity_id in script_entity.script.referenced_entities
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].async_referencing_entity(entity_id)
 
 
 @callback
@@ -122,16 +119,10 @@ def entities_in_script(hass: HomeAssistant, entity_id: str) -> List[str]:
 @callback
 def scripts_with_device(hass: HomeAssistant, device_id: str) -> List[str]:
     """Return all scripts that reference the device."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if device_id in script_entity.script.referenced_devices
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].async_referencing_device(device_id)
 
 
 @callback
@@ -153,6 +144,7 @@ def devices_in_script(hass: HomeAssistant, entity_id: str) -> List[str]:
 async def async_setup(hass, config):
     """Load the scripts from the configuration."""
     hass.data[DOMAIN] = component = EntityComponent(_LOGGER, DOMAIN, hass)
+    hass.data[DATA_REFERENCE_INDEX] = ReferenceIndex()
 
     await _async_process_config(hass, config, component)
 
@@ -334,8 +326,17 @@ class ScriptEntity(ToggleEntity):
         """Turn script off."""
         await self.script.async_stop()
 
+    async def async_added_to_hass(self):
+        """Index the entities and devices referenced by the script."""
+        self.hass.data[DATA_REFERENCE_INDEX].async_add(
+            self.entity_id,
+            self.script.referenced_entities,
+            self.script.referenced_devices,
+        )
+
     async def async_will_remove_from_hass(self):
         """Stop script and remove service when it will be removed from Home Assistant."""
+        self.hass.data[DATA_REFERENCE_INDEX].async_remove(self.entity_id)
         await self.script.async_stop()
 
         # remove service
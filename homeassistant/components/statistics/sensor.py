@@ -1,7 +1,9 @@
 """Support for statistics for sensor values."""
+from bisect import bisect_left, insort
 from collections import deque
+from fractions import Fraction
 import logging
-import statistics
+import math
 
 import voluptuous as vol
 
@@ -100,6 +102,12 @@ class StatisticsSensor(Entity):
         self.states = deque(maxlen=self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
 
+        # Aggregates of the numeric states, updated as states enter and leave
+        # the queue. The sums are exact so they do not drift on removal.
+        self._sorted_states = []
+        self._sum = Fraction(0)
+        self._sum_squares = Fraction(0)
+
         self.count = 0
         self.mean = self.median = self.stdev = self.variance = None
         self.total = self.min = self.max = None
@@ -151,17 +159,53 @@ class StatisticsSensor(Entity):
 
         try:
             if self.is_binary:
-                self.states.append(new_state.state)
+                value = new_state.state
             else:
-                self.states.append(float(new_state.state))
-
-            self.ages.append(new_state.last_updated)
+                value = float(new_state.state)
         except ValueError:
             _LOGGER.error(
                 "%s: parsing error, expected number and received %s",
                 self.entity_id,
                 new_state.state,
             )
+            return
+
+        if not self.is_binary and not math.isfinite(value):
+            # The exact running sums can not hold NaN or infinite values
+            _LOGGER.error(
+                "%s: parsing error, expected finite number and received %s",
+                self.entity_id,
+                new_state.state,
+            )
+            return
+
+        if len(self.states) == self.states.maxlen:
+            # The deques drop their oldest entry when appending to a full queue
+            self._remove_from_aggregates(self.states[0])
+
+        self.states.append(value)
+        self.ages.append(new_state.last_updated)
+        self._add_to_aggregates(value)
+
+    def _add_to_aggregates(self, value):
+        """Add a value entering the queue to the aggregates."""
+        if self.is_binary:
+            return
+
+        insort(self._sorted_states, value)
+        exact = Fraction(value)
+        self._sum += exact
+        self._sum_squares += exact * exact
+
+    def _remove_from_aggregates(self, value):
+        """Remove a value leaving the queue from the aggregates."""
+        if self.is_binary:
+            return
+
+        del self._sorted_states[bisect_left(self._sorted_states, value)]
+        exact = Fraction(value)
+        self._sum -= exact
+        self._sum_squares -= exact * exact
 
     @property
     def name(self):
@@ -228,7 +272,7 @@ class StatisticsSensor(Entity):
                 (now - self.ages[0]),
             )
             self.ages.popleft()
-            self.states.popleft()
+            self._remove_from_aggregates(self.states.popleft())
 
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
@@ -248,24 +292,38 @@ class StatisticsSensor(Entity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            count = self.count
+            sorted_states = self._sorted_states
+
+            if count:  # require only one data point
+                self.mean = round(float(self._sum / count), self._precision)
+                middle = count // 2
+                if count % 2:
+                    median = sorted_states[middle]
+                else:
+                    median = (sorted_states[middle - 1] + sorted_states[middle]) / 2
+                self.median = round(median, self._precision)
+            else:
+                _LOGGER.debug(
+                    "%s: mean requires at least one data point", self.entity_id
+                )
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if count > 1:  # require at least two data points
+                squared_deviations = self._sum_squares - self._sum ** 2 / count
+                variance = float(squared_deviations / (count - 1))
+                self.stdev = round(math.sqrt(variance), self._precision)
+                self.variance = round(variance, self._precision)
+            else:
+                _LOGGER.debug(
+                    "%s: variance requires at least two data points", self.entity_id
+                )
                 self.stdev = self.variance = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(float(self._sum), self._precision)
+                self.min = round(sorted_states[0], self._precision)
+                self.max = round(sorted_states[-1], self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -3,7 +3,6 @@ from collections import deque
 import logging
 import math
 
-import numpy as np
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import (
@@ -130,6 +129,14 @@ class SensorTrend(BinarySensorEntity):
         self._state = None
         self.samples = deque(maxlen=max_samples)
 
+        # Sufficient statistics of the least squares fit over the samples,
+        # with timestamps centred on a reference time for numerical stability.
+        # They are recomputed from the samples once the samples have been
+        # replaced, which bounds the rounding error of the removals.
+        self._reference_time = None
+        self._sum_t = self._sum_v = self._sum_tt = self._sum_tv = 0.0
+        self._removed_samples = 0
+
     @property
     def name(self):
         """Return the name of the sensor."""
@@ -179,7 +186,7 @@ class SensorTrend(BinarySensorEntity):
                     state = new_state.state
                 if state not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
                     sample = (new_state.last_updated.timestamp(), float(state))
-                    self.samples.append(sample)
+                    self._add_sample(sample)
                     self.async_schedule_update_ha_state(True)
             except (ValueError, TypeError) as ex:
                 _LOGGER.error(ex)
@@ -196,13 +203,13 @@ class SensorTrend(BinarySensorEntity):
         if self._sample_duration > 0:
             cutoff = utcnow().timestamp() - self._sample_duration
             while self.samples and self.samples[0][0] < cutoff:
-                self.samples.popleft()
+                self._remove_oldest_sample()
 
         if len(self.samples) < 2:
             return
 
         # Calculate gradient of linear trend
-        await self.hass.async_add_executor_job(self._calculate_gradient)
+        self._calculate_gradient()
 
         # Update state
         self._state = (
@@ -213,12 +220,57 @@ class SensorTrend(BinarySensorEntity):
         if self._invert:
             self._state = not self._state
 
+    def _add_sample(self, sample):
+        """Add a sample, dropping the oldest one if the maximum is reached."""
+        if len(self.samples) == self.samples.maxlen:
+            self._remove_oldest_sample()
+
+        self.samples.append(sample)
+        if self._reference_time is None:
+            self._reference_time = sample[0]
+
+        timestamp = sample[0] - self._reference_time
+        value = sample[1]
+        self._sum_t += timestamp
+        self._sum_v += value
+        self._sum_tt += timestamp * timestamp
+        self._sum_tv += timestamp * value
+
+    def _remove_oldest_sample(self):
+        """Remove the oldest sample."""
+        sample = self.samples.popleft()
+        self._removed_samples += 1
+        if self._removed_samples >= len(self.samples):
+            self._reset_sums()
+            return
+
+        timestamp = sample[0] - self._reference_time
+        value = sample[1]
+        self._sum_t -= timestamp
+        self._sum_v -= value
+        self._sum_tt -= timestamp * timestamp
+        self._sum_tv -= timestamp * value
+
+    def _reset_sums(self):
+        """Recompute the sums from the samples around a new reference time."""
+        self._reference_time = self.samples[0][0] if self.samples else None
+        self._sum_t = self._sum_v = self._sum_tt = self._sum_tv = 0.0
+        self._removed_samples = 0
+        for sample_time, value in self.samples:
+            timestamp = sample_time - self._reference_time
+            self._sum_t += timestamp
+            self._sum_v += value
+            self._sum_tt += timestamp * timestamp
+            self._sum_tv += timestamp * value
+
     def _calculate_gradient(self):
-        """Compute the linear trend gradient of the current samples.
-
-        This need run inside executor.
-        """
-        timestamps = np.array([t for t, _ in self.samples])
-        values = np.array([s for _, s in self.samples])
-        coeffs = np.polyfit(timestamps, values, 1)
-        self._gradient = coeffs[0]
+        """Compute the linear trend gradient of the current samples."""
+        count = len(self.samples)
+        denominator = count * self._sum_tt - self._sum_t * self._sum_t
+        if denominator == 0:
+            # All samples share the same timestamp
+            self._gradient = 0.0
+            return
+        self._gradient = (
+            count * self._sum_tv - self._sum_t * self._sum_v
+        ) / denominator
@@ -1,8 +1,10 @@
 """Support for the definition of zones."""
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 import logging
-from typing import Any, Dict, Optional, cast
+from numbers import Number
+from typing import Any, Dict, List, Optional, cast
 
 import voluptuous as vol
 
@@ -18,10 +20,19 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_RADIUS,
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
     STATE_UNAVAILABLE,
 )
-from homeassistant.core import Event, HomeAssistant, ServiceCall, State, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    State,
+    callback,
+)
 from homeassistant.helpers import (
     collection,
     config_validation as cv,
@@ -88,6 +99,110 @@ RELOAD_SERVICE_SCHEMA = vol.Schema({})
 STORAGE_KEY = DOMAIN
 STORAGE_VERSION = 1
 
+DATA_ZONE_INDEX = "zone_index"
+
+# Zones with a larger radius are checked on every lookup instead of indexed
+INDEX_MAX_RADIUS = 10000
+# Lower bound of the length of one degree of latitude in meters
+METERS_PER_DEGREE_LATITUDE = 110000
+
+
+class ZoneIndex:
+    """Index of the active zones sorted by latitude.
+
+    A point can only be in zones whose latitude is within the largest indexed
+    radius plus the accuracy of the point, so only those zones need an exact
+    distance calculation. The index is rebuilt after a zone state changed.
+    Zone entities invalidate it as soon as they write or remove their state,
+    zone states written by others are picked up from state changed events.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the zone index."""
+        self.hass = hass
+        self._dirty = True
+        self._latitudes: List[float] = []
+        self._zones: List[State] = []
+        self._unindexed: List[State] = []
+        self._max_radius = 0.0
+
+    @callback
+    def async_setup(self) -> CALLBACK_TYPE:
+        """Track zone state changes, return a function to stop tracking."""
+        return self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_zone_changed, self._async_is_zone
+        )
+
+    @callback
+    def async_invalidate(self) -> None:
+        """Mark the index as outdated."""
+        self._dirty = True
+
+    @callback
+    def _async_is_zone(self, event: Event) -> bool:
+        """Return if a state change is about a zone."""
+        return cast(str, event.data["entity_id"]).startswith(f"{DOMAIN}.")
+
+    @callback
+    def _async_zone_changed(self, event: Event) -> None:
+        """Mark the index as outdated."""
+        self.async_invalidate()
+
+    @callback
+    def _async_rebuild(self) -> None:
+        """Rebuild the index from the active zones."""
+        indexed = []
+        self._unindexed = []
+        self._max_radius = 0.0
+
+        for zone in self.hass.states.async_all(DOMAIN):
+            if zone.state == STATE_UNAVAILABLE or zone.attributes.get(ATTR_PASSIVE):
+                continue
+
+            latitude = zone.attributes.get(ATTR_LATITUDE)
+            zone_radius = zone.attributes.get(ATTR_RADIUS)
+            if (
+                not isinstance(latitude, Number)
+                or not isinstance(zone_radius, Number)
+                or zone_radius > INDEX_MAX_RADIUS
+            ):
+                self._unindexed.append(zone)
+                continue
+
+            indexed.append((latitude, zone))
+            self._max_radius = max(self._max_radius, zone_radius)
+
+        indexed.sort(key=lambda item: item[0])
+        self._latitudes = [latitude for latitude, _ in indexed]
+        self._zones = [zone for _, zone in indexed]
+        self._dirty = False
+
+    @callback
+    def async_candidates(self, latitude: float, radius: float) -> List[State]:
+        """Return the active zones a point could be in, sorted by entity ID."""
+        if self._dirty:
+            self._async_rebuild()
+
+        if isinstance(latitude, Number) and isinstance(radius, Number):
+            window = (self._max_radius + radius) / METERS_PER_DEGREE_LATITUDE
+            zones = self._zones[
+                bisect_left(self._latitudes, latitude - window) : bisect_right(
+                    self._latitudes, latitude + window
+                )
+            ]
+        else:
+            zones = self._zones
+
+        return sorted(zones + self._unindexed, key=lambda zone: zone.entity_id)
+
+
+@callback
+def _async_invalidate_zone_index(hass: HomeAssistant) -> None:
+    """Mark the zone index as outdated after a zone changed."""
+    zone_index: Optional[ZoneIndex] = hass.data.get(DATA_ZONE_INDEX)
+    if zone_index is not None:
+        zone_index.async_invalidate()
+
 
 @bind_hass
 def async_active_zone(
@@ -97,18 +212,26 @@ def async_active_zone(
 
     This method must be run in the event loop.
     """
-    # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (
-        cast(State, hass.states.get(entity_id))
-        for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
-    )
+    zone_index: Optional[ZoneIndex] = hass.data.get(DATA_ZONE_INDEX)
+    if zone_index is not None:
+        zones = zone_index.async_candidates(latitude, radius)
+    else:
+        # The zone integration is not set up, check all zones
+        zones = [
+            zone
+            for zone in (
+                cast(State, hass.states.get(entity_id))
+                for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
+            )
+            if zone.state != STATE_UNAVAILABLE and not zone.attributes.get(ATTR_PASSIVE)
+        ]
 
     min_dist = None
     closest = None
 
+    # Zones are sorted by entity ID so that we are deterministic if
+    # equal distance to 2 zones
     for zone in zones:
-        if zone.state == STATE_UNAVAILABLE or zone.attributes.get(ATTR_PASSIVE):
-            continue
 
         zone_dist = distance(
             latitude,
@@ -181,6 +304,17 @@ async def async_setup(hass: HomeAssistant, config: Dict) -> bool:
     component = entity_component.EntityComponent(_LOGGER, DOMAIN, hass)
     id_manager = collection.IDManager()
 
+    zone_index = hass.data[DATA_ZONE_INDEX] = ZoneIndex(hass)
+    unsub_zone_index = zone_index.async_setup()
+
+    @callback
+    def remove_zone_index(_: Event) -> None:
+        """Stop tracking zone state changes."""
+        unsub_zone_index()
+        hass.data.pop(DATA_ZONE_INDEX, None)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, remove_zone_index)
+
     yaml_collection = collection.IDLessCollection(
         logging.getLogger(f"{__name__}.yaml_collection"), id_manager
     )
@@ -324,6 +458,17 @@ class Zone(entity.Entity):
         """Zone does not poll."""
         return False
 
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and invalidate the zone index."""
+        super().async_write_ha_state()
+        _async_invalidate_zone_index(self.hass)
+
+    async def async_remove(self, *, force_remove: bool = False) -> None:
+        """Remove the zone and invalidate the zone index."""
+        await super().async_remove(force_remove=force_remove)
+        _async_invalidate_zone_index(self.hass)
+
     async def async_update_config(self, config: Dict) -> None:
         """Handle when the config is updated."""
         if self._config == config:
@@ -59,15 +59,17 @@ from homeassistant.requirements import (
 )
 from homeassistant.util.package import is_docker_env
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
-from homeassistant.util.yaml import SECRET_YAML, load_yaml
+from homeassistant.util.yaml import SECRET_YAML, ParseCache, load_yaml
 
 _LOGGER = logging.getLogger(__name__)
 
 DATA_PERSISTENT_ERRORS = "bootstrap_persistent_errors"
+DATA_YAML_PARSE_CACHE = "yaml_parse_cache"
 RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
+YAML_PARSE_CACHE_FILE = "yaml_parse_cache"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
 
@@ -318,23 +320,35 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> Dict:
     This function allow a component inside the asyncio loop to reload its
     configuration by itself. Include package merge.
     """
+    parse_cache = hass.data.get(DATA_YAML_PARSE_CACHE)
+
+    def _load_hass_config_yaml() -> Dict[Any, Any]:
+        """Load the configuration and persist the parse cache."""
+        try:
+            return load_yaml_config_file(
+                hass.config.path(YAML_CONFIG_FILE), parse_cache
+            )
+        finally:
+            if parse_cache is not None:
+                parse_cache.save()
+
     # Not using async_add_executor_job because this is an internal method.
-    config = await hass.loop.run_in_executor(
-        None, load_yaml_config_file, hass.config.path(YAML_CONFIG_FILE)
-    )
+    config = await hass.loop.run_in_executor(None, _load_hass_config_yaml)
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
     return config
 
 
-def load_yaml_config_file(config_path: str) -> Dict[Any, Any]:
+def load_yaml_config_file(
+    config_path: str, parse_cache: Optional[ParseCache] = None
+) -> Dict[Any, Any]:
     """Parse a YAML configuration file.
 
     Raises FileNotFoundError or HomeAssistantError.
 
     This method needs to run in an executor.
     """
-    conf_dict = load_yaml(config_path)
+    conf_dict = load_yaml(config_path, parse_cache)
 
     if not isinstance(conf_dict, dict):
         msg = (
@@ -752,7 +766,7 @@ async def async_process_component_config(
     """
     domain = integration.domain
     try:
-        component = integration.get_component()
+        component = await integration.async_get_component()
     except LOAD_EXCEPTIONS as ex:
         _LOGGER.error("Unable to import %s: %s", domain, ex)
         return None
@@ -760,7 +774,7 @@ async def async_process_component_config(
     # Check if the integration has a custom config validator
     config_validator = None
     try:
-        config_validator = integration.get_platform("config")
+        config_validator = await integration.async_get_platform("config")
     except ImportError as err:
         # Filter out import error of the config platform.
         # If the config platform contains bad imports, make sure
@@ -831,7 +845,7 @@ async def async_process_component_config(
             continue
 
         try:
-            platform = p_integration.get_platform(domain)
+            platform = await p_integration.async_get_platform(domain)
         except LOAD_EXCEPTIONS:
             _LOGGER.exception("Platform error: %s", domain)
             continue
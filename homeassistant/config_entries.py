@@ -217,7 +217,7 @@ class ConfigEntry:
         self.supports_unload = await support_entry_unload(hass, self.domain)
 
         try:
-            component = integration.get_component()
+            component = await integration.async_get_component()
         except ImportError as err:
             _LOGGER.error(
                 "Error importing integration %s to set up %s configuration entry: %s",
@@ -231,7 +231,7 @@ class ConfigEntry:
 
         if self.domain == integration.domain:
             try:
-                integration.get_platform("config_flow")
+                await integration.async_get_platform("config_flow")
             except ImportError as err:
                 _LOGGER.error(
                     "Error importing platform config_flow from integration %s to set up %s configuration entry: %s",
@@ -554,7 +554,7 @@ class ConfigEntriesFlowManager(data_entry_flow.FlowManager):
         await async_process_deps_reqs(self.hass, self._hass_config, integration)
 
         try:
-            integration.get_platform("config_flow")
+            await integration.async_get_platform("config_flow")
         except ImportError as err:
             _LOGGER.error(
                 "Error occurred loading configuration flow for integration %s: %s",
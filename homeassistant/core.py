@@ -108,6 +108,10 @@ BLOCK_LOG_TIMEOUT = 60
 # How long we wait for the result of a service call
 SERVICE_CALL_LIMIT = 10  # seconds
 
+# How deep events fired from eagerly run listeners may nest before their
+# listeners are scheduled instead
+EAGER_CALLBACK_MAX_DEPTH = 10
+
 # Source of core configuration
 SOURCE_DISCOVERED = "discovered"
 SOURCE_STORAGE = "storage"
@@ -658,12 +662,18 @@ class Event:
 
 
 class EventBus:
-    """Allow the firing of and listening for events."""
+    """Allow the firing of and listening for events.
+
+    When eager_callbacks is set, listeners decorated with @callback run while
+    the event is fired instead of being scheduled on the event loop.
+    """
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: Dict[str, List[Tuple[HassJob, Optional[Callable]]]] = {}
         self._hass = hass
+        self.eager_callbacks = False
+        self._eager_depth = 0
 
     @callback
     def async_listeners(self) -> Dict[str, int]:
@@ -718,6 +728,10 @@ class EventBus:
         if not listeners:
             return
 
+        if self.eager_callbacks and self._eager_depth < EAGER_CALLBACK_MAX_DEPTH:
+            self._async_run_listeners_eagerly(listeners, event)
+            return
+
         for job, event_filter in listeners:
             if event_filter is not None:
                 try:
@@ -728,6 +742,46 @@ class EventBus:
                     continue
             self._hass.async_add_hass_job(job, event)
 
+    @callback
+    def _async_run_listeners_eagerly(
+        self, listeners: List[Tuple[HassJob, Optional[Callable]]], event: Event
+    ) -> None:
+        """Run the callback listeners of an event and schedule the others.
+
+        Coroutine listeners are started together once the callbacks ran.
+        Listeners firing events nest up to EAGER_CALLBACK_MAX_DEPTH deep,
+        deeper events have their listeners scheduled.
+        """
+        coroutine_jobs = []
+
+        self._eager_depth += 1
+        try:
+            # Listeners may subscribe or unsubscribe while they run
+            for job, event_filter in list(listeners):
+                if event_filter is not None:
+                    try:
+                        if not event_filter(event):
+                            continue
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception("Error in event filter")
+                        continue
+                if job.job_type == HassJobType.Callback:
+                    try:
+                        job.target(event)
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception(
+                            "Error running listener %s for %s", job, event
+                        )
+                elif job.job_type == HassJobType.Coroutinefunction:
+                    coroutine_jobs.append(job)
+                else:
+                    self._hass.async_add_hass_job(job, event)
+        finally:
+            self._eager_depth -= 1
+
+        for job in coroutine_jobs:
+            self._hass.async_add_hass_job(job, event)
+
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -1,5 +1,6 @@
 """Provide a way to connect entities belonging to one device."""
 from collections import OrderedDict
+from functools import partial
 import logging
 import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union, cast
@@ -141,7 +142,11 @@ class DeviceRegistry:
     def __init__(self, hass: HomeAssistantType) -> None:
         """Initialize the device registry."""
         self.hass = hass
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.JournaledStore(
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            collections={"devices": "id", "deleted_devices": "id"},
+        )
         self._clear_index()
         self.hass.bus.async_listen(
             EVENT_CONFIG_ENTRY_DISABLED_BY_UPDATED,
@@ -447,7 +452,7 @@ class DeviceRegistry:
 
         new = attr.evolve(old, **changes)
         self._update_device(old, new)
-        self.async_schedule_save()
+        self.async_schedule_save(device_id)
 
         self.hass.bus.async_fire(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -476,7 +481,7 @@ class DeviceRegistry:
         self.hass.bus.async_fire(
             EVENT_DEVICE_REGISTRY_UPDATED, {"action": "remove", "device_id": device_id}
         )
-        self.async_schedule_save()
+        self.async_schedule_save(device_id)
 
     async def async_load(self) -> None:
         """Load the device registry."""
@@ -529,46 +534,57 @@ class DeviceRegistry:
         self._rebuild_index()
 
     @callback
-    def async_schedule_save(self) -> None:
-        """Schedule saving the device registry."""
-        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+    def async_schedule_save(self, *device_ids: str) -> None:
+        """Schedule saving the device registry.
+
+        If device ids are given, only the changes of those devices are saved.
+        """
+        if not device_ids:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+            return
+
+        for device_id in device_ids:
+            self._store.async_delay_save_change(
+                "devices",
+                device_id,
+                partial(self._device_to_save, device_id),
+                SAVE_DELAY,
+            )
+            self._store.async_delay_save_change(
+                "deleted_devices",
+                device_id,
+                partial(self._deleted_device_to_save, device_id),
+                SAVE_DELAY,
+            )
 
     @callback
     def _data_to_save(self) -> Dict[str, List[Dict[str, Any]]]:
         """Return data of device registry to store in a file."""
         data = {}
 
-        data["devices"] = [
-            {
-                "config_entries": list(entry.config_entries),
-                "connections": list(entry.connections),
-                "identifiers": list(entry.identifiers),
-                "manufacturer": entry.manufacturer,
-                "model": entry.model,
-                "name": entry.name,
-                "sw_version": entry.sw_version,
-                "entry_type": entry.entry_type,
-                "id": entry.id,
-                "via_device_id": entry.via_device_id,
-                "area_id": entry.area_id,
-                "name_by_user": entry.name_by_user,
-                "disabled_by": entry.disabled_by,
-            }
-            for entry in self.devices.values()
-        ]
+        data["devices"] = [_device_as_dict(entry) for entry in self.devices.values()]
         data["deleted_devices"] = [
-            {
-                "config_entries": list(entry.config_entries),
-                "connections": list(entry.connections),
-                "identifiers": list(entry.identifiers),
-                "id": entry.id,
-                "orphaned_timestamp": entry.orphaned_timestamp,
-            }
-            for entry in self.deleted_devices.values()
+            _deleted_device_as_dict(entry) for entry in self.deleted_devices.values()
         ]
 
         return data
 
+    @callback
+    def _device_to_save(self, device_id: str) -> Optional[Dict[str, Any]]:
+        """Return data of a device to store, or None if it was removed."""
+        entry = self.devices.get(device_id)
+        if entry is None:
+            return None
+        return _device_as_dict(entry)
+
+    @callback
+    def _deleted_device_to_save(self, device_id: str) -> Optional[Dict[str, Any]]:
+        """Return data of a deleted device to store, or None if it was removed."""
+        entry = self.deleted_devices.get(device_id)
+        if entry is None:
+            return None
+        return _deleted_device_as_dict(entry)
+
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
@@ -591,7 +607,7 @@ class DeviceRegistry:
                 self.deleted_devices[deleted_device.id] = attr.evolve(
                     deleted_device, config_entries=config_entries
                 )
-            self.async_schedule_save()
+            self.async_schedule_save(deleted_device.id)
 
     @callback
     def async_purge_expired_orphaned_devices(self) -> None:
@@ -651,6 +667,36 @@ class DeviceRegistry:
             self.async_update_device(device.id, disabled_by=DISABLED_CONFIG_ENTRY)
 
 
+def _device_as_dict(entry: DeviceEntry) -> Dict[str, Any]:
+    """Return the data of a device to store in a file."""
+    return {
+        "config_entries": list(entry.config_entries),
+        "connections": list(entry.connections),
+        "identifiers": list(entry.identifiers),
+        "manufacturer": entry.manufacturer,
+        "model": entry.model,
+        "name": entry.name,
+        "sw_version": entry.sw_version,
+        "entry_type": entry.entry_type,
+        "id": entry.id,
+        "via_device_id": entry.via_device_id,
+        "area_id": entry.area_id,
+        "name_by_user": entry.name_by_user,
+        "disabled_by": entry.disabled_by,
+    }
+
+
+def _deleted_device_as_dict(entry: DeletedDeviceEntry) -> Dict[str, Any]:
+    """Return the data of a deleted device to store in a file."""
+    return {
+        "config_entries": list(entry.config_entries),
+        "connections": list(entry.connections),
+        "identifiers": list(entry.identifiers),
+        "id": entry.id,
+        "orphaned_timestamp": entry.orphaned_timestamp,
+    }
+
+
 @callback
 def async_get(hass: HomeAssistantType) -> DeviceRegistry:
     """Get device registry."""
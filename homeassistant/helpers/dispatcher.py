@@ -1,8 +1,9 @@
 """Helpers for Home Assistant dispatcher & internal component/platform."""
+from functools import partial
 import logging
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Iterable, Sequence, Tuple
 
-from homeassistant.core import HassJob, callback
+from homeassistant.core import EAGER_CALLBACK_MAX_DEPTH, HassJob, HassJobType, callback
 from homeassistant.loader import bind_hass
 from homeassistant.util.async_ import run_callback_threadsafe
 from homeassistant.util.logging import catch_log_exception
@@ -11,6 +12,7 @@ from .typing import HomeAssistantType
 
 _LOGGER = logging.getLogger(__name__)
 DATA_DISPATCHER = "dispatcher"
+DATA_DISPATCHER_DEPTH = "dispatcher_depth"
 
 
 @bind_hass
@@ -29,40 +31,48 @@ def dispatcher_connect(
     return remove_dispatcher
 
 
+def _format_err(signal: str, target: Callable[..., Any], *args: Any) -> str:
+    """Format error message."""
+    return "Exception in {} when dispatching '{}': {}".format(
+        # Functions wrapped in partial do not have a __name__
+        getattr(target, "__name__", None) or str(target),
+        signal,
+        args,
+    )
+
+
 @callback
 @bind_hass
 def async_dispatcher_connect(
-    hass: HomeAssistantType, signal: str, target: Callable[..., Any]
+    hass: HomeAssistantType,
+    signal: str,
+    target: Callable[..., Any],
+    inline: bool = False,
 ) -> Callable[[], None]:
     """Connect a callable function to a signal.
 
+    Callbacks connected with inline are run as soon as the signal is sent,
+    unless signals sent by inline callbacks nest EAGER_CALLBACK_MAX_DEPTH
+    deep. Other targets are scheduled as jobs.
+
     This method must be run in the event loop.
     """
     if DATA_DISPATCHER not in hass.data:
         hass.data[DATA_DISPATCHER] = {}
 
-    job = HassJob(
-        catch_log_exception(
-            target,
-            lambda *args: "Exception in {} when dispatching '{}': {}".format(
-                # Functions wrapped in partial do not have a __name__
-                getattr(target, "__name__", None) or str(target),
-                signal,
-                args,
-            ),
-        )
-    )
+    job = HassJob(catch_log_exception(target, partial(_format_err, signal, target)))
 
-    hass.data[DATA_DISPATCHER].setdefault(signal, []).append(job)
+    # Listeners are kept in insertion order with whether they run inline
+    listeners: Dict[HassJob, bool] = hass.data[DATA_DISPATCHER].setdefault(signal, {})
+    listeners[job] = inline and job.job_type == HassJobType.Callback
 
     @callback
     def async_remove_dispatcher() -> None:
         """Remove signal listener."""
         try:
-            hass.data[DATA_DISPATCHER][signal].remove(job)
-        except (KeyError, ValueError):
-            # KeyError is key target listener did not exist
-            # ValueError if listener did not exist within signal
+            del hass.data[DATA_DISPATCHER][signal][job]
+        except KeyError:
+            # KeyError if the signal or the listener did not exist
             _LOGGER.warning("Unable to remove unknown dispatcher %s", target)
 
     return async_remove_dispatcher
@@ -74,6 +84,14 @@ def dispatcher_send(hass: HomeAssistantType, signal: str, *args: Any) -> None:
     hass.loop.call_soon_threadsafe(async_dispatcher_send, hass, signal, *args)
 
 
+@bind_hass
+def dispatcher_send_many(
+    hass: HomeAssistantType, sends: Iterable[Tuple[str, Sequence[Any]]]
+) -> None:
+    """Send many signals with their data in one event loop iteration."""
+    hass.loop.call_soon_threadsafe(async_dispatcher_send_many, hass, list(sends))
+
+
 @callback
 @bind_hass
 def async_dispatcher_send(hass: HomeAssistantType, signal: str, *args: Any) -> None:
@@ -81,7 +99,32 @@ def async_dispatcher_send(hass: HomeAssistantType, signal: str, *args: Any) -> N
 
     This method must be run in the event loop.
     """
-    target_list = hass.data.get(DATA_DISPATCHER, {}).get(signal, [])
+    listeners = hass.data.get(DATA_DISPATCHER, {}).get(signal)
+    if not listeners:
+        return
+
+    depth = hass.data.get(DATA_DISPATCHER_DEPTH, 0)
+    run_inline = depth < EAGER_CALLBACK_MAX_DEPTH
+    hass.data[DATA_DISPATCHER_DEPTH] = depth + 1
+    try:
+        # Listeners may connect or disconnect while the signal is sent
+        for job, inline in list(listeners.items()):
+            if inline and run_inline:
+                job.target(*args)
+            else:
+                hass.async_add_hass_job(job, *args)
+    finally:
+        hass.data[DATA_DISPATCHER_DEPTH] = depth
+
 
-    for job in target_list:
-        hass.async_add_hass_job(job, *args)
+@callback
+@bind_hass
+def async_dispatcher_send_many(
+    hass: HomeAssistantType, sends: Iterable[Tuple[str, Sequence[Any]]]
+) -> None:
+    """Send many signals with their data.
+
+    This method must be run in the event loop.
+    """
+    for signal, args in sends:
+        async_dispatcher_send(hass, signal, *args)
@@ -8,6 +8,7 @@ registered. Registering a new entity while a timer is in progress resets the
 timer.
 """
 from collections import OrderedDict
+from functools import partial
 import logging
 from typing import (
     TYPE_CHECKING,
@@ -154,7 +155,9 @@ class EntityRegistry:
         self.hass = hass
         self.entities: Dict[str, RegistryEntry]
         self._index: Dict[Tuple[str, str, str], str] = {}
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.JournaledStore(
+            STORAGE_VERSION, STORAGE_KEY, collections={"entities": "entity_id"}
+        )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
         )
@@ -302,7 +305,7 @@ class EntityRegistry:
         )
         self._register_entry(entity)
         _LOGGER.info("Registered new %s.%s entity: %s", domain, platform, entity_id)
-        self.async_schedule_save()
+        self.async_schedule_save(entity_id)
 
         self.hass.bus.async_fire(
             EVENT_ENTITY_REGISTRY_UPDATED, {"action": "create", "entity_id": entity_id}
@@ -317,7 +320,7 @@ class EntityRegistry:
         self.hass.bus.async_fire(
             EVENT_ENTITY_REGISTRY_UPDATED, {"action": "remove", "entity_id": entity_id}
         )
-        self.async_schedule_save()
+        self.async_schedule_save(entity_id)
 
     @callback
     def async_device_modified(self, event: Event) -> None:
@@ -493,7 +496,7 @@ class EntityRegistry:
         new = attr.evolve(old, **changes)
         self._register_entry(new)
 
-        self.async_schedule_save()
+        self.async_schedule_save(old.entity_id, entity_id)
 
         data = {"action": "update", "entity_id": entity_id, "changes": list(changes)}
 
@@ -546,38 +549,40 @@ class EntityRegistry:
         self._rebuild_index()
 
     @callback
-    def async_schedule_save(self) -> None:
-        """Schedule saving the entity registry."""
-        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+    def async_schedule_save(self, *entity_ids: str) -> None:
+        """Schedule saving the entity registry.
+
+        If entity ids are given, only the changes of those entries are saved.
+        """
+        if not entity_ids:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+            return
+
+        for entity_id in entity_ids:
+            self._store.async_delay_save_change(
+                "entities",
+                entity_id,
+                partial(self._entry_to_save, entity_id),
+                SAVE_DELAY,
+            )
 
     @callback
     def _data_to_save(self) -> Dict[str, Any]:
         """Return data of entity registry to store in a file."""
         data = {}
 
-        data["entities"] = [
-            {
-                "entity_id": entry.entity_id,
-                "config_entry_id": entry.config_entry_id,
-                "device_id": entry.device_id,
-                "area_id": entry.area_id,
-                "unique_id": entry.unique_id,
-                "platform": entry.platform,
-                "name": entry.name,
-                "icon": entry.icon,
-                "disabled_by": entry.disabled_by,
-                "capabilities": entry.capabilities,
-                "supported_features": entry.supported_features,
-                "device_class": entry.device_class,
-                "unit_of_measurement": entry.unit_of_measurement,
-                "original_name": entry.original_name,
-                "original_icon": entry.original_icon,
-            }
-            for entry in self.entities.values()
-        ]
+        data["entities"] = [_entry_as_dict(entry) for entry in self.entities.values()]
 
         return data
 
+    @callback
+    def _entry_to_save(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        """Return data of an entry to store, or None if it was removed."""
+        entry = self.entities.get(entity_id)
+        if entry is None:
+            return None
+        return _entry_as_dict(entry)
+
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
@@ -615,6 +620,27 @@ class EntityRegistry:
             self._add_index(entry)
 
 
+def _entry_as_dict(entry: RegistryEntry) -> Dict[str, Any]:
+    """Return the data of an entry to store in a file."""
+    return {
+        "entity_id": entry.entity_id,
+        "config_entry_id": entry.config_entry_id,
+        "device_id": entry.device_id,
+        "area_id": entry.area_id,
+        "unique_id": entry.unique_id,
+        "platform": entry.platform,
+        "name": entry.name,
+        "icon": entry.icon,
+        "disabled_by": entry.disabled_by,
+        "capabilities": entry.capabilities,
+        "supported_features": entry.supported_features,
+        "device_class": entry.device_class,
+        "unit_of_measurement": entry.unit_of_measurement,
+        "original_name": entry.original_name,
+        "original_icon": entry.original_icon,
+    }
+
+
 @callback
 def async_get(hass: HomeAssistantType) -> EntityRegistry:
     """Get entity registry."""
@@ -62,6 +62,8 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TRACK_TIME_PATTERN_LISTENERS = "track_time_pattern_listeners"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -1387,40 +1389,105 @@ def async_track_utc_time_change(
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
 
-    def calculate_next(now: datetime) -> datetime:
-        """Calculate and set the next time the trigger should fire."""
-        localized_now = dt_util.as_local(now) if local else now
-        return dt_util.find_next_time_expression_time(
-            localized_now, matching_seconds, matching_minutes, matching_hours
+    # Listeners of the same pattern share their timers
+    key = (
+        tuple(matching_seconds),
+        tuple(matching_minutes),
+        tuple(matching_hours),
+        local,
+    )
+    pattern_listeners = hass.data.setdefault(TRACK_TIME_PATTERN_LISTENERS, {})
+    listener = pattern_listeners.get(key)
+    if listener is None:
+        listener = pattern_listeners[key] = TimePatternListener(
+            hass, key, matching_seconds, matching_minutes, matching_hours, local
         )
 
-    time_listener: Optional[CALLBACK_TYPE] = None
+    return listener.async_add(job)
 
-    @callback
-    def pattern_time_change_listener(_: datetime) -> None:
-        """Listen for matching time_changed events."""
-        nonlocal time_listener
 
-        now = time_tracker_utcnow()
-        hass.async_run_hass_job(job, dt_util.as_local(now) if local else now)
+@attr.s
+class TimePatternListener:
+    """Helper class to fire the listeners of a time pattern together.
 
-        time_listener = async_track_point_in_utc_time(
-            hass,
-            pattern_time_change_listener,
-            calculate_next(now + timedelta(seconds=1)),
+    Listeners due at the same time are fired from a single timer and the next
+    time they are due is calculated once for all of them.
+    """
+
+    hass: HomeAssistant = attr.ib()
+    key: Tuple = attr.ib()
+    seconds: List[int] = attr.ib()
+    minutes: List[int] = attr.ib()
+    hours: List[int] = attr.ib()
+    local: bool = attr.ib()
+    _jobs: Dict[datetime, Dict[object, HassJob]] = attr.ib(factory=dict)
+    _unsub_timers: Dict[datetime, CALLBACK_TYPE] = attr.ib(factory=dict)
+    _fire_times: Dict[object, datetime] = attr.ib(factory=dict)
+
+    @callback
+    def async_add(self, job: HassJob) -> CALLBACK_TYPE:
+        """Add a listener and return a function to remove it."""
+        token = object()
+        self._async_schedule({token: job}, self._calculate_next(dt_util.utcnow()))
+
+        @callback
+        def unsub_pattern_time_change_listener() -> None:
+            """Remove the listener."""
+            fire_time = self._fire_times.pop(token, None)
+            if fire_time is None:
+                # Already removed
+                return
+            jobs = self._jobs[fire_time]
+            del jobs[token]
+            if jobs:
+                return
+            del self._jobs[fire_time]
+            self._unsub_timers.pop(fire_time)()
+            if not self._jobs:
+                self.hass.data[TRACK_TIME_PATTERN_LISTENERS].pop(self.key)
+
+        return unsub_pattern_time_change_listener
+
+    def _calculate_next(self, now: datetime) -> datetime:
+        """Calculate the next time the pattern matches."""
+        localized_now = dt_util.as_local(now) if self.local else now
+        return dt_util.as_utc(
+            dt_util.find_next_time_expression_time(
+                localized_now, self.seconds, self.minutes, self.hours
+            )
         )
 
-    time_listener = async_track_point_in_utc_time(
-        hass, pattern_time_change_listener, calculate_next(dt_util.utcnow())
-    )
+    @callback
+    def _async_schedule(self, jobs: Dict[object, HassJob], fire_time: datetime) -> None:
+        """Schedule listeners to fire at a time."""
+        scheduled = self._jobs.get(fire_time)
+        if scheduled is None:
+            scheduled = self._jobs[fire_time] = {}
+            self._unsub_timers[fire_time] = async_track_point_in_utc_time(
+                self.hass, ft.partial(self._async_fire, fire_time), fire_time
+            )
+        scheduled.update(jobs)
+        for token in jobs:
+            self._fire_times[token] = fire_time
 
     @callback
-    def unsub_pattern_time_change_listener() -> None:
-        """Cancel the time listener."""
-        assert time_listener is not None
-        time_listener()
+    def _async_fire(self, fire_time: datetime, _: datetime) -> None:
+        """Fire the listeners due at a time."""
+        jobs = self._jobs.pop(fire_time)
+        del self._unsub_timers[fire_time]
 
-    return unsub_pattern_time_change_listener
+        now = time_tracker_utcnow()
+        self._async_schedule(jobs, self._calculate_next(now + timedelta(seconds=1)))
+
+        job_now = dt_util.as_local(now) if self.local else now
+        for token, job in jobs.items():
+            # Listeners can be removed by the ones fired before them
+            if token not in self._fire_times:
+                continue
+            try:
+                self.hass.async_run_hass_job(job, job_now)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running time pattern listener %s", job)
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
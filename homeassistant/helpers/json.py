@@ -1,7 +1,34 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
 from datetime import datetime
 import json
-from typing import Any
+import math
+import re
+from types import MappingProxyType
+from typing import Any, Callable, Match, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects the JSON encoders do not handle.
+
+    Raises TypeError for other objects.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset, tuple)):
+        # Namedtuples are encoded as lists like other tuples
+        return list(obj)
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 class JSONEncoder(json.JSONEncoder):
@@ -12,11 +39,111 @@ class JSONEncoder(json.JSONEncoder):
 
         Hand other objects to the original method.
         """
-        if isinstance(o, datetime):
-            return o.isoformat()
-        if isinstance(o, set):
-            return list(o)
-        if hasattr(o, "as_dict"):
-            return o.as_dict()
-
-        return json.JSONEncoder.default(self, o)
+        try:
+            return json_encoder_default(o)
+        except TypeError:
+            return json.JSONEncoder.default(self, o)
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    """Replace NaN and infinite floats with None."""
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    return obj
+
+
+def _stdlib_dumps(
+    data: Any,
+    default: Optional[Callable[[Any], Any]],
+    pretty: bool,
+    ensure_ascii: bool = False,
+) -> str:
+    """Encode data with the JSON encoder of the standard library."""
+    kwargs: dict = {
+        "ensure_ascii": ensure_ascii,
+        "indent": 2 if pretty else None,
+        "separators": None if pretty else (",", ":"),
+    }
+    try:
+        return json.dumps(data, default=default, allow_nan=False, **kwargs)
+    except ValueError as err:
+        error = err
+
+    def finite_default(obj: Any) -> Any:
+        """Convert objects and replace their non finite floats."""
+        assert default is not None
+        return _replace_non_finite(default(obj))
+
+    try:
+        return json.dumps(
+            _replace_non_finite(data),
+            default=finite_default if default is not None else None,
+            allow_nan=False,
+            **kwargs,
+        )
+    except RecursionError:
+        # Replacing the floats of a circular reference never ends
+        raise error from None
+
+
+def _escape_non_ascii(match: Match) -> str:
+    """Escape a character like the stdlib encoder with ensure_ascii."""
+    code = ord(match.group())
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    code -= 0x10000
+    return f"\\u{0xD800 | (code >> 10):04x}\\u{0xDC00 | (code & 0x3FF):04x}"
+
+
+def json_bytes(
+    data: Any,
+    *,
+    default: Optional[Callable[[Any], Any]] = json_encoder_default,
+    pretty: bool = False,
+) -> bytes:
+    """Encode data as UTF-8 JSON with the fastest available encoder.
+
+    Objects the encoder does not handle natively are converted with default.
+    NaN and infinite floats are encoded as null. Raises TypeError if data
+    contains objects that can not be encoded and ValueError if it contains
+    circular references.
+    """
+    if orjson is not None:
+        # Dataclasses and datetimes are only encoded by default like the stdlib
+        # encoder does. json_encoder_default encodes datetimes like orjson.
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        if default is not json_encoder_default:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=default, option=option)
+        except TypeError:
+            # Integers of more than 64 bit are only handled by the stdlib
+            pass
+
+    return _stdlib_dumps(data, default, pretty).encode("utf-8")
+
+
+def json_dumps(
+    data: Any,
+    *,
+    default: Optional[Callable[[Any], Any]] = json_encoder_default,
+    pretty: bool = False,
+    ensure_ascii: bool = False,
+) -> str:
+    """Encode data as a JSON string with the fastest available encoder.
+
+    Non ASCII characters are escaped with ensure_ascii. See json_bytes.
+    """
+    if orjson is None:
+        return _stdlib_dumps(data, default, pretty, ensure_ascii)
+    result = json_bytes(data, default=default, pretty=pretty).decode("utf-8")
+    if ensure_ascii and not result.isascii():
+        # Non ASCII characters only occur in strings, where they can be escaped
+        result = _NON_ASCII.sub(_escape_non_ascii, result)
+    return result
@@ -0,0 +1,64 @@
+"""Reverse index of the entities and devices referenced by entities."""
+from typing import Dict, Iterable, List, Tuple
+
+from homeassistant.core import callback
+
+
+class ReferenceIndex:
+    """Map referenced entities and devices to the entities referencing them.
+
+    Used by integrations like automation and script to answer which of their
+    entities reference an entity or device without visiting all of them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the reference index."""
+        self._references: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+        # Dicts are used as ordered sets to keep the order entities were added
+        self._entity_index: Dict[str, Dict[str, None]] = {}
+        self._device_index: Dict[str, Dict[str, None]] = {}
+
+    @callback
+    def async_add(
+        self,
+        entity_id: str,
+        referenced_entities: Iterable[str],
+        referenced_devices: Iterable[str] = (),
+    ) -> None:
+        """Add or replace the references of an entity."""
+        self.async_remove(entity_id)
+
+        entities = tuple(referenced_entities)
+        devices = tuple(referenced_devices)
+        self._references[entity_id] = (entities, devices)
+
+        for referenced in entities:
+            self._entity_index.setdefault(referenced, {})[entity_id] = None
+        for referenced in devices:
+            self._device_index.setdefault(referenced, {})[entity_id] = None
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Remove the references of an entity."""
+        references = self._references.pop(entity_id, None)
+        if references is None:
+            return
+
+        for index, referenced_ids in zip(
+            (self._entity_index, self._device_index), references
+        ):
+            for referenced in referenced_ids:
+                referencing = index[referenced]
+                referencing.pop(entity_id, None)
+                if not referencing:
+                    del index[referenced]
+
+    @callback
+    def async_referencing_entity(self, entity_id: str) -> List[str]:
+        """Return the entities that reference an entity."""
+        return list(self._entity_index.get(entity_id, ()))
+
+    @callback
+    def async_referencing_device(self, device_id: str) -> List[str]:
+        """Return the entities that reference a device."""
+        return list(self._device_index.get(device_id, ()))
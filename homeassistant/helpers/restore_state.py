@@ -6,9 +6,15 @@ from datetime import datetime, timedelta
 import logging
 from typing import Any, Dict, List, Optional, Set, cast
 
-from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+)
 from homeassistant.core import (
+    CALLBACK_TYPE,
     CoreState,
+    Event,
     HomeAssistant,
     State,
     callback,
@@ -17,10 +23,10 @@ from homeassistant.core import (
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry
 from homeassistant.helpers.entity import Entity
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.singleton import singleton
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers.storage import JournaledStore
 import homeassistant.util.dt as dt_util
 
 DATA_RESTORE_STATE_TASK = "restore_state_task"
@@ -28,10 +34,17 @@ DATA_RESTORE_STATE_TASK = "restore_state_task"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
 
-# How long between periodically saving the current states to disk
+# How long between periodically saving the changed states to disk. The
+# interval adapts to the number of changes found by the previous dump.
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
+MIN_STATE_DUMP_INTERVAL = timedelta(minutes=5)
+MAX_STATE_DUMP_INTERVAL = timedelta(hours=1)
+STATE_DUMP_TARGET_CHANGES = 500
+
+# How often the last seen time of an unchanged entity is saved again
+STATE_REFRESH_INTERVAL = timedelta(days=1)
 
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
@@ -60,6 +73,27 @@ class StoredState:
         return cls(State.from_dict(json_dict["state"]), last_seen)
 
 
+class RestoreStateStore(JournaledStore):
+    """Store the stored states, journaling the changed ones."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the restore state store."""
+        super().__init__(
+            hass,
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            collections={"states": lambda item: item["state"]["entity_id"]},
+            encoder=JSONEncoder,
+        )
+
+    async def _async_migrate_func(self, old_version: int, old_data: Any) -> Dict:
+        """Migrate to the new version."""
+        if old_version == 1:
+            # Version 1 stored the list of states
+            return {"states": old_data}
+        raise NotImplementedError
+
+
 class RestoreStateData:
     """Helper class for managing the helper saved data."""
 
@@ -73,18 +107,18 @@ class RestoreStateData:
             data = cls(hass)
 
             try:
-                stored_states = await data.store.async_load()
+                stored = await data.store.async_load()
             except HomeAssistantError as exc:
                 _LOGGER.error("Error loading last states", exc_info=exc)
-                stored_states = None
+                stored = None
 
-            if stored_states is None:
+            if stored is None:
                 _LOGGER.debug("Not creating cache - no saved states found")
                 data.last_states = {}
             else:
                 data.last_states = {
                     item["state"]["entity_id"]: StoredState.from_dict(item)
-                    for item in stored_states
+                    for item in stored["states"]
                     if valid_entity_id(item["state"]["entity_id"])
                 }
                 _LOGGER.debug("Created cache with %s", list(data.last_states))
@@ -103,11 +137,15 @@ class RestoreStateData:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
-        self.store: Store = Store(
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
-        )
+        self.store: RestoreStateStore = RestoreStateStore(hass)
         self.last_states: Dict[str, StoredState] = {}
         self.entity_ids: Set[str] = set()
+        # Entities whose state may differ from the one last saved
+        self._dirty: Set[str] = set()
+        # When the saved states were last seen
+        self._stored_last_seen: Dict[str, datetime] = {}
+        self._dump_interval = STATE_DUMP_INTERVAL
+        self._unsub_dump: Optional[CALLBACK_TYPE] = None
 
     @callback
     def async_get_stored_states(self) -> List[StoredState]:
@@ -154,38 +192,142 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        stored_states = self.async_get_stored_states()
+        self._dirty = set()
+        self._stored_last_seen = {
+            stored_state.state.entity_id: stored_state.last_seen
+            for stored_state in stored_states
+        }
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                {"states": [stored_state.as_dict() for stored_state in stored_states]}
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
+    @callback
+    def async_dump_changed_states(self) -> int:
+        """Save the states that changed since the last dump to storage.
+
+        States that did not change are saved again once a day to keep their
+        last seen time from expiring. Returns the number of saved changes.
+        """
+        now = dt_util.utcnow()
+        refresh_time = now - STATE_REFRESH_INTERVAL
+        entity_ids = self._dirty | {
+            entity_id
+            for entity_id, last_seen in self._stored_last_seen.items()
+            if last_seen < refresh_time
+        }
+        self._dirty = set()
+
+        changes = 0
+        for entity_id in entity_ids:
+            stored_state = self._async_get_stored_state(entity_id, now)
+            last_seen = None if stored_state is None else stored_state.last_seen
+            if last_seen == self._stored_last_seen.get(entity_id):
+                continue
+
+            changes += 1
+            if stored_state is None:
+                del self._stored_last_seen[entity_id]
+                item = None
+            else:
+                self._stored_last_seen[entity_id] = stored_state.last_seen
+                item = stored_state.as_dict()
+            self.store.async_delay_save_change(
+                "states", entity_id, lambda item=item: item
+            )
+
+        _LOGGER.debug("Dumping %d changed states", changes)
+        return changes
+
+    @callback
+    def _async_get_stored_state(
+        self, entity_id: str, now: datetime
+    ) -> Optional[StoredState]:
+        """Get the state of an entity which should be stored, if any."""
+        state = self.hass.states.get(entity_id)
+        if state is not None and not state.attributes.get(
+            entity_registry.ATTR_RESTORED
+        ):
+            if entity_id in self.entity_ids:
+                return StoredState(state, now)
+            # Backed by an entity which does not restore its state
+            return None
+
+        stored_state = self.last_states.get(entity_id)
+        if stored_state is None or stored_state.last_seen < now - STATE_EXPIRATION:
+            return None
+        return stored_state
+
+    @callback
+    def _async_schedule_dump(self) -> None:
+        """Schedule the next dump of the changed states."""
+
+        @callback
+        def _async_dump_changed_states(_: Any) -> None:
+            changes = self.async_dump_changed_states()
+
+            # Dump less often when many states change, so a dump covers more
+            # changes, and more often when few do.
+            if changes > STATE_DUMP_TARGET_CHANGES:
+                self._dump_interval = min(
+                    self._dump_interval * 2, MAX_STATE_DUMP_INTERVAL
+                )
+            elif changes < STATE_DUMP_TARGET_CHANGES / 4:
+                self._dump_interval = max(
+                    self._dump_interval / 2, MIN_STATE_DUMP_INTERVAL
+                )
+            self._async_schedule_dump()
+
+        self._unsub_dump = async_call_later(
+            self.hass,
+            self._dump_interval.total_seconds(),
+            _async_dump_changed_states,
+        )
+
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
 
-        async def _async_dump_states(*_: Any) -> None:
-            await self.async_dump_states()
+        @callback
+        def _async_state_changed(event: Event) -> None:
+            """Mark restorable entities as changed."""
+            entity_id = event.data["entity_id"]
+            if entity_id in self.entity_ids:
+                self._dirty.add(entity_id)
+
+        @callback
+        def _async_stop(_: Any) -> None:
+            """Dump the changed states when stopping hass."""
+            unsub_state_changed()
+            if self._unsub_dump is not None:
+                self._unsub_dump()
+                self._unsub_dump = None
+            self.async_dump_changed_states()
+
+        unsub_state_changed = self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, _async_state_changed
+        )
 
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
-        self.hass.async_create_task(_async_dump_states())
+        self.hass.async_create_task(self.async_dump_states())
 
-        # Dump states periodically
-        async_track_time_interval(self.hass, _async_dump_states, STATE_DUMP_INTERVAL)
+        # Dump changed states periodically
+        self._async_schedule_dump()
 
-        # Dump states when stopping hass
-        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_dump_states)
+        # Dump changed states when stopping hass, the store writes them out
+        # before it is shut down.
+        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
 
     @callback
     def async_restore_entity_added(self, entity_id: str) -> None:
         """Store this entity's state when hass is shutdown."""
         self.entity_ids.add(entity_id)
+        self._dirty.add(entity_id)
 
     @callback
     def async_restore_entity_removed(self, entity_id: str) -> None:
@@ -202,6 +344,7 @@ class RestoreStateData:
             self.last_states[entity_id] = StoredState(state, dt_util.utcnow())
 
         self.entity_ids.remove(entity_id)
+        self._dirty.add(entity_id)
 
 
 def _encode(value: Any) -> Any:
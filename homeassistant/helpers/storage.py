@@ -1,13 +1,20 @@
 """Helper to help store data."""
 import asyncio
+from functools import partial
+import json
 from json import JSONEncoder
 import logging
+from operator import itemgetter
 import os
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import (
+    JSONEncoder as HomeAssistantJSONEncoder,
+    json_dumps,
+)
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 
@@ -15,6 +22,9 @@ from homeassistant.util import json as json_util
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_SEQ_KEY = "journal_seq"
+DEFAULT_JOURNAL_COMPACT_SIZE = 1024 * 1024
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -121,9 +131,7 @@ class Store:
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._load_data, self.path)
 
             if data == {}:
                 return None
@@ -205,24 +213,29 @@ class Store:
         async with self._write_lock:
             self._async_cleanup_delay_listener()
             self._async_cleanup_final_write_listener()
+            await self._async_write_pending_data()
 
-            if self._data is None:
-                # Another write already consumed the data
-                return
+    async def _async_write_pending_data(self):
+        """Write the pending data, the write lock must be held."""
+        if self._data is None:
+            # Another write already consumed the data
+            return
 
-            data = self._data
+        data = self._data
 
-            if "data_func" in data:
-                data["data"] = data.pop("data_func")()
+        if "data_func" in data:
+            data["data"] = data.pop("data_func")()
 
-            self._data = None
+        self._data = None
 
-            try:
-                await self.hass.async_add_executor_job(
-                    self._write_data, self.path, data
-                )
-            except (json_util.SerializationError, json_util.WriteError) as err:
-                _LOGGER.error("Error writing config for %s: %s", self.key, err)
+        try:
+            await self.hass.async_add_executor_job(self._write_data, self.path, data)
+        except (json_util.SerializationError, json_util.WriteError) as err:
+            _LOGGER.error("Error writing config for %s: %s", self.key, err)
+
+    def _load_data(self, path: str) -> Dict:
+        """Load the data."""
+        return json_util.load_json(path)
 
     def _write_data(self, path: str, data: Dict) -> None:
         """Write the data."""
@@ -230,7 +243,21 @@ class Store:
             os.makedirs(os.path.dirname(path))
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+        json_util.save_json(
+            path, data, self._private, dump=partial(self._json_dumps, pretty=True)
+        )
+
+    def _json_dumps(self, data: Any, pretty: bool = False) -> str:
+        """Encode data as JSON.
+
+        The fast encoder is used unless the store has a custom encoder. Without
+        an encoder only JSON types are accepted, like with json.dumps.
+        """
+        if self._encoder is None:
+            return json_dumps(data, default=None, pretty=pretty)
+        if self._encoder is HomeAssistantJSONEncoder:
+            return json_dumps(data, pretty=pretty)
+        return json.dumps(data, cls=self._encoder, indent=4 if pretty else None)
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
@@ -245,3 +272,235 @@ class Store:
             await self.hass.async_add_executor_job(os.unlink, self.path)
         except FileNotFoundError:
             pass
+
+
+@bind_hass
+class JournaledStore(Store):
+    """Store that saves changes of single items to a journal.
+
+    The stored data is a dict of collections, each a list of dicts identified
+    by a field of the items or by a function returning their id. Changed items
+    are appended to a journal next to the snapshot instead of rewriting the
+    whole file. The journal is replayed on load and compacted into the
+    snapshot once it grows past compact_size.
+    Saving the full data still writes a snapshot and clears the journal.
+    Journal records are numbered and snapshots store the number of the last
+    record they include, so records already in the snapshot are skipped if
+    the journal could not be cleared.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        version: int,
+        key: str,
+        private: bool = False,
+        *,
+        collections: Dict[str, Union[str, Callable[[Dict], str]]],
+        compact_size: int = DEFAULT_JOURNAL_COMPACT_SIZE,
+        encoder: Optional[Type[JSONEncoder]] = None,
+    ):
+        """Initialize journaled storage class.
+
+        Collections maps the collection names to the field identifying their
+        items, or to a function returning the id of an item.
+        """
+        super().__init__(hass, version, key, private, encoder=encoder)
+        self.collections = collections
+        self.compact_size = compact_size
+        self._changes: Dict[Tuple[str, str], Callable[[], Optional[Dict]]] = {}
+        self._loaded_version: Optional[int] = None
+        # Number of the last journal record, None until the files are read
+        self._journal_seq: Optional[int] = None
+
+    @callback
+    def async_delay_save_change(
+        self,
+        collection: str,
+        item_id: str,
+        item_func: Callable[[], Optional[Dict]],
+        delay: float = 0,
+    ) -> None:
+        """Save the change of an item with an optional delay.
+
+        The item_func returns the item to store, or None if it was removed.
+        """
+        if self._data is None:
+            # A pending full save already includes the change
+            self._changes[(collection, item_id)] = item_func
+
+        self._async_cleanup_delay_listener()
+        self._async_ensure_final_write_listener()
+
+        if self.hass.state == CoreState.stopping:
+            return
+
+        self._unsub_delay_listener = async_call_later(
+            self.hass, delay, self._async_callback_delayed_write
+        )
+
+    async def _async_load_data(self):
+        """Load the data."""
+        if self._changes:
+            await self._async_handle_write_data()
+
+        self._loaded_version = None if self._data is None else self._data["version"]
+        stored = await super()._async_load_data()
+
+        if stored is not None and self._loaded_version not in (None, self.version):
+            # Changes are journaled in the new version, so they can not be
+            # replayed on top of a snapshot that still needs to be migrated.
+            await self.async_save(stored)
+
+        return stored
+
+    async def _async_write_pending_data(self):
+        """Write the pending data or changes, the write lock must be held."""
+        if self._data is not None:
+            self._changes = {}
+            await super()._async_write_pending_data()
+            return
+
+        if not self._changes:
+            return
+
+        changes, self._changes = self._changes, {}
+        records = [
+            [collection, item_id, item_func()]
+            for (collection, item_id), item_func in changes.items()
+        ]
+
+        try:
+            await self.hass.async_add_executor_job(
+                self._write_journal, self.path, records
+            )
+        except (json_util.SerializationError, json_util.WriteError) as err:
+            _LOGGER.error("Error writing journal for %s: %s", self.key, err)
+
+    def _load_data(self, path: str) -> Dict:
+        """Load the snapshot and replay the journal."""
+        data = super()._load_data(path)
+        self._loaded_version = data.get("version")
+        self._journal_seq = max(self._journal_seq or 0, data.get(JOURNAL_SEQ_KEY, 0))
+
+        try:
+            with open(f"{path}{JOURNAL_SUFFIX}", encoding="utf-8") as journal:
+                lines = journal.readlines()
+        except FileNotFoundError:
+            return data
+
+        snapshot_seq = data.get(JOURNAL_SEQ_KEY, 0)
+        journal_seq = snapshot_seq
+        records = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                seq, *record = json.loads(line)
+            except ValueError:
+                # An interrupted write leaves an incomplete record
+                _LOGGER.warning("Ignoring invalid record in journal of %s", self.key)
+                continue
+            journal_seq = max(journal_seq, seq)
+            # Records up to the sequence number of the snapshot are already
+            # included in it
+            if seq > snapshot_seq:
+                records.append(record)
+        self._journal_seq = max(self._journal_seq or 0, journal_seq)
+
+        if not data:
+            data = {
+                "version": self.version,
+                "key": self.key,
+                "data": {collection: [] for collection in self.collections},
+            }
+        _apply_journal_records(data["data"], self.collections, records)
+        return data
+
+    def _write_data(self, path: str, data: Dict) -> None:
+        """Write the snapshot and clear the journal."""
+        if self._journal_seq is None:
+            self._load_data(path)
+        data[JOURNAL_SEQ_KEY] = self._journal_seq
+        super()._write_data(path, data)
+
+        try:
+            os.unlink(f"{path}{JOURNAL_SUFFIX}")
+        except FileNotFoundError:
+            pass
+
+    async def async_remove(self):
+        """Remove all data."""
+        self._changes = {}
+        await super().async_remove()
+
+        try:
+            await self.hass.async_add_executor_job(
+                os.unlink, f"{self.path}{JOURNAL_SUFFIX}"
+            )
+        except FileNotFoundError:
+            pass
+
+    def _write_journal(self, path: str, records: List[List]) -> None:
+        """Append records to the journal, compacting it if it grew too large."""
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+
+        if self._journal_seq is None:
+            self._load_data(path)
+        assert self._journal_seq is not None
+        seq = self._journal_seq
+
+        try:
+            # Records start with a newline, so a record that was cut off by an
+            # interrupted write can not run into the next one.
+            lines = "".join(
+                f"\n{self._json_dumps([seq + index, *record])}"
+                for index, record in enumerate(records, 1)
+            )
+        except TypeError as error:
+            raise json_util.SerializationError(
+                f"Failed to serialize to JSON: {path}. Bad data: {records}"
+            ) from error
+
+        journal_path = f"{path}{JOURNAL_SUFFIX}"
+        _LOGGER.debug("Writing %d changes for %s to %s", len(records), self.key, path)
+        try:
+            fdesc = os.open(
+                journal_path,
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                0o600 if self._private else 0o644,
+            )
+            with os.fdopen(fdesc, "w", encoding="utf-8") as journal:
+                journal.write(lines)
+                journal.flush()
+                size = os.fstat(journal.fileno()).st_size
+        except OSError as error:
+            raise json_util.WriteError(error) from error
+        self._journal_seq = seq + len(records)
+
+        if size > self.compact_size:
+            _LOGGER.debug("Compacting journal of %s", self.key)
+            self._write_data(path, self._load_data(path))
+
+
+def _apply_journal_records(
+    data: Dict[str, List[Dict]],
+    collections: Dict[str, Union[str, Callable[[Dict], str]]],
+    records: Iterable[List],
+) -> None:
+    """Apply journal records to the collections of stored data."""
+    items: Dict[str, Dict[str, Dict]] = {}
+    for collection, id_key in collections.items():
+        get_id = id_key if callable(id_key) else itemgetter(id_key)
+        items[collection] = {get_id(item): item for item in data.get(collection, [])}
+
+    for collection, item_id, item in records:
+        if item is None:
+            items[collection].pop(item_id, None)
+        else:
+            # Updates keep the position of the item, new items are appended
+            items[collection][item_id] = item
+
+    for collection, collection_items in items.items():
+        data[collection] = list(collection_items.values())
@@ -46,6 +46,8 @@ _LOGGER = logging.getLogger(__name__)
 _SENTINEL = object()
 DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+_INVALID_JSON = object()
+
 _RENDER_INFO = "template.render_info"
 _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
@@ -274,6 +276,30 @@ class RenderInfo:
             self.filter = _false
 
 
+class JSONValueStr(str):
+    """String that parses itself as JSON at most once.
+
+    Values rendered by several templates, such as MQTT payloads, can use
+    this class to share the parsed value_json between them. The parsed
+    value is shared as well and must not be modified.
+    """
+
+    @property
+    def json(self) -> Any:
+        """Return the string parsed as JSON, raise ValueError if invalid."""
+        try:
+            value = self.__dict__["_json"]
+        except KeyError:
+            try:
+                value = json.loads(self)
+            except ValueError:
+                value = _INVALID_JSON
+            self.__dict__["_json"] = value
+        if value is _INVALID_JSON:
+            raise ValueError("Value is not valid JSON")
+        return value
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -518,7 +544,10 @@ class Template:
         variables["value"] = value
 
         try:
-            variables["value_json"] = json.loads(value)
+            if isinstance(value, JSONValueStr):
+                variables["value_json"] = value.json
+            else:
+                variables["value_json"] = json.loads(value)
         except (ValueError, TypeError):
             pass
 
@@ -2,8 +2,10 @@
 import asyncio
 from collections import ChainMap
 import logging
+import os
 from typing import Any, Dict, List, Optional, Set
 
+from homeassistant.const import __version__
 from homeassistant.core import callback
 from homeassistant.loader import (
     MAX_LOAD_CONCURRENTLY,
@@ -15,14 +17,20 @@ from homeassistant.loader import (
 from homeassistant.util.async_ import gather_with_concurrency
 from homeassistant.util.json import load_json
 
+from .storage import Store
 from .typing import HomeAssistantType
 
 _LOGGER = logging.getLogger(__name__)
 
 TRANSLATION_LOAD_LOCK = "translation_load_lock"
 TRANSLATION_FLATTEN_CACHE = "translation_flatten_cache"
+TRANSLATION_BUNDLES = "translation_bundles"
 LOCALE_EN = "en"
 
+STORAGE_KEY = "core.translations"
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
 
 def recursive_flatten(prefix: Any, data: Dict) -> Dict[str, Any]:
     """Return a flattened representation of dict data."""
@@ -89,6 +97,79 @@ def load_translations_files(
     return loaded
 
 
+def _file_signatures(paths: Dict[str, str]) -> Dict[str, Optional[List[int]]]:
+    """Return modification time and size of translation files.
+
+    Files that do not exist get None as signature.
+    """
+    signatures: Dict[str, Optional[List[int]]] = {}
+    for component, path in paths.items():
+        try:
+            stat = os.stat(path)
+        except OSError:
+            signatures[component] = None
+        else:
+            signatures[component] = [stat.st_mtime_ns, stat.st_size]
+    return signatures
+
+
+class _TranslationBundle:
+    """Loaded translations of a language, persisted between runs.
+
+    Each component is stored together with the signature of its translation
+    file so it is only read from disk again once that file has changed.
+    """
+
+    def __init__(self, hass: HomeAssistantType, language: str) -> None:
+        """Initialize the bundle."""
+        self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{language}")
+        self._components: Dict[str, Dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the bundle, discarding bundles of other versions."""
+        data = await self._store.async_load()
+
+        if data is not None and data.get("version") == __version__:
+            self._components = data["components"]
+
+    @callback
+    def async_get(self, component: str, signature: List[Any]) -> Optional[Dict]:
+        """Return the translations of a component if its file is unchanged."""
+        entry = self._components.get(component)
+        if entry is None or entry["signature"] != signature:
+            return None
+        return entry["translations"]  # type: ignore
+
+    @callback
+    def async_update(self, translations: Dict[str, Any], signatures: Dict) -> None:
+        """Update the bundle with translations loaded from disk."""
+        for component, translation in translations.items():
+            self._components[component] = {
+                "signature": signatures[component],
+                "translations": translation,
+            }
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return data of the bundle to store in a file."""
+        return {"version": __version__, "components": self._components}
+
+
+async def _async_get_bundle(
+    hass: HomeAssistantType, language: str
+) -> _TranslationBundle:
+    """Return the translation bundle of a language."""
+    bundles: Dict[str, _TranslationBundle] = hass.data.setdefault(
+        TRANSLATION_BUNDLES, {}
+    )
+    bundle = bundles.get(language)
+    if bundle is None:
+        bundle = bundles[language] = _TranslationBundle(hass, language)
+        await bundle.async_load()
+    return bundle
+
+
 def _merge_resources(
     translation_strings: Dict[str, Dict[str, Any]],
     components: Set[str],
@@ -179,6 +260,26 @@ async def async_get_component_strings(
     if not files_to_load:
         return translations
 
+    # Skip files that have not changed since they were added to the bundle
+    bundle = await _async_get_bundle(hass, language)
+    signatures_job = hass.async_add_executor_job(_file_signatures, files_to_load)
+    assert signatures_job is not None
+    signatures: Dict[str, Any] = await signatures_job
+
+    for loaded in list(files_to_load):
+        # The integration name is used as title if it is missing
+        signatures[loaded] = [
+            signatures[loaded],
+            integrations[loaded.split(".")[-1]].name,
+        ]
+        bundled = bundle.async_get(loaded, signatures[loaded])
+        if bundled is not None:
+            translations[loaded] = bundled
+            del files_to_load[loaded]
+
+    if not files_to_load:
+        return translations
+
     # Load files
     load_translations_job = hass.async_add_executor_job(
         load_translations_files, files_to_load
@@ -194,6 +295,7 @@ async def async_get_component_strings(
         if "title" not in loaded_translation:
             loaded_translation["title"] = integrations[loaded].name
 
+    bundle.async_update(loaded_translations, signatures)
     translations.update(loaded_translations)
 
     return translations
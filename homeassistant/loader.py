@@ -13,15 +13,18 @@ import json
 import logging
 import pathlib
 import sys
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
+    Tuple,
     TypedDict,
     TypeVar,
     Union,
@@ -49,6 +52,7 @@ _LOGGER = logging.getLogger(__name__)
 
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
+DATA_IMPORT_TIMES = "integrations_import_times"
 DATA_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
@@ -345,6 +349,12 @@ class Integration:
         self.manifest = manifest
         manifest["is_built_in"] = self.is_built_in
 
+        # Imports running in the executor, keyed by platform name or None for
+        # the component itself. Ensures every module is imported by one job.
+        self._import_futures: Dict[
+            Optional[str], asyncio.Future[Optional[Exception]]
+        ] = {}
+
         if self.dependencies:
             self._all_dependencies_resolved: Optional[bool] = None
             self._all_dependencies: Optional[Set[str]] = None
@@ -503,6 +513,100 @@ class Integration:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
 
+    async def async_get_component(self) -> ModuleType:
+        """Return the component, importing it in the executor if needed."""
+        cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        if self.domain not in cache:
+            error = (await self._async_import([None]))[None]
+            if error is not None:
+                raise error
+        return cache[self.domain]  # type: ignore
+
+    async def async_get_platform(self, platform_name: str) -> ModuleType:
+        """Return a platform, importing it in the executor if needed."""
+        cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        full_name = f"{self.domain}.{platform_name}"
+        if full_name not in cache:
+            error = (await self._async_import([platform_name]))[platform_name]
+            if error is not None:
+                raise error
+        return cache[full_name]  # type: ignore
+
+    async def async_prefetch_platforms(self, platform_names: Iterable[str]) -> None:
+        """Import the component and platforms in the executor ahead of use.
+
+        Errors are not raised here, they are raised again when the platform
+        is requested.
+        """
+        cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        to_import: List[Optional[str]] = [
+            name for name in platform_names if f"{self.domain}.{name}" not in cache
+        ]
+        if self.domain not in cache:
+            to_import.insert(0, None)
+        if to_import:
+            await self._async_import(to_import)
+
+    async def _async_import(
+        self, names: List[Optional[str]]
+    ) -> Dict[Optional[str], Optional[Exception]]:
+        """Import the component (None) and platforms in a single executor job.
+
+        Modules that are already being imported are waited for instead of
+        being imported a second time.
+        """
+        pending = {
+            name: self._import_futures[name]
+            for name in names
+            if name in self._import_futures
+        }
+        to_import = [name for name in names if name not in pending]
+
+        if to_import:
+            futures = {name: self.hass.loop.create_future() for name in to_import}
+            self._import_futures.update(futures)
+            try:
+                errors, elapsed = await self.hass.async_add_executor_job(
+                    self._import_modules, to_import
+                )
+            except BaseException:
+                # Do not leave other callers waiting on a cancelled import
+                for future in futures.values():
+                    future.set_result(
+                        ImportError(f"Import of {self.domain} was cancelled")
+                    )
+                raise
+            finally:
+                for name in to_import:
+                    self._import_futures.pop(name, None)
+
+            import_times = self.hass.data.setdefault(DATA_IMPORT_TIMES, {})
+            import_times[self.domain] = import_times.get(self.domain, 0) + elapsed
+            for name, future in futures.items():
+                future.set_result(errors.get(name))
+            pending.update(futures)
+
+        return {name: await future for name, future in pending.items()}
+
+    def _import_modules(
+        self, names: List[Optional[str]]
+    ) -> Tuple[Dict[Optional[str], Exception], float]:
+        """Import the component and platforms.
+
+        This method must be run in the executor.
+        """
+        errors: Dict[Optional[str], Exception] = {}
+        start = timer()
+        for name in names:
+            try:
+                if name is None:
+                    self.get_component()
+                else:
+                    self.get_platform(name)
+            except Exception as err:  # pylint: disable=broad-except
+                errors[name] = err
+        return errors, timer() - start
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
@@ -5,6 +5,7 @@ from typing import Any, Dict, Iterable, List, Optional, Set, Union, cast
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.loader import Integration, IntegrationNotFound, async_get_integration
 import homeassistant.util.package as pkg_util
@@ -15,6 +16,9 @@ DATA_PIP_LOCK = "pip_lock"
 DATA_PKG_CACHE = "pkg_cache"
 DATA_INTEGRATIONS_WITH_REQS = "integrations_with_reqs"
 CONSTRAINT_FILE = "package_constraints.txt"
+STORAGE_KEY = "core.requirements"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
 DISCOVERY_INTEGRATIONS: Dict[str, Iterable[str]] = {
     "dhcp": ("dhcp",),
     "mqtt": ("mqtt",),
@@ -33,6 +37,55 @@ class RequirementsNotFound(HomeAssistantError):
         self.requirements = requirements
 
 
+class RequirementsCache:
+    """Remember which requirements are satisfied by the installed packages.
+
+    The cache is persisted together with a fingerprint of the package
+    directories and is discarded as soon as that fingerprint changes. A cache
+    created without persist is neither loaded nor saved.
+    """
+
+    def __init__(self, hass: HomeAssistant, persist: bool = True) -> None:
+        """Initialize the requirements cache."""
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._persist = persist
+        self._fingerprint: Optional[str] = None
+        self._satisfied: Set[str] = set()
+
+    async def async_load(self) -> None:
+        """Load the cache and drop it if the environment has changed."""
+        if not self._persist:
+            return
+        hass = self._store.hass
+        self._fingerprint = await hass.async_add_executor_job(
+            pkg_util.environment_fingerprint
+        )
+        data = await self._store.async_load()
+
+        if data is not None and data.get("fingerprint") == self._fingerprint:
+            self._satisfied = set(data["requirements"])
+
+    def is_satisfied(self, requirement: str) -> bool:
+        """Return if a requirement is known to be satisfied."""
+        if requirement in self._satisfied:
+            return True
+
+        if not pkg_util.is_installed(requirement):
+            return False
+
+        self._satisfied.add(requirement)
+        if self._persist:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return True
+
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return data of the cache to store in a file."""
+        return {
+            "fingerprint": self._fingerprint,
+            "requirements": sorted(self._satisfied),
+        }
+
+
 async def async_get_integration_with_requirements(
     hass: HomeAssistant, domain: str, done: Optional[Set[str]] = None
 ) -> Integration:
@@ -122,8 +175,13 @@ async def async_process_requirements(
     kwargs = pip_kwargs(hass.config.config_dir)
 
     async with pip_lock:
+        pkg_cache = hass.data.get(DATA_PKG_CACHE)
+        if pkg_cache is None:
+            pkg_cache = hass.data[DATA_PKG_CACHE] = RequirementsCache(hass)
+            await pkg_cache.async_load()
+
         for req in requirements:
-            if pkg_util.is_installed(req):
+            if pkg_cache.is_satisfied(req):
                 continue
 
             def _install(req: str, kwargs: Dict[str, Any]) -> bool:
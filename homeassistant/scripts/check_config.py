@@ -9,7 +9,7 @@ import os
 from typing import Any, Callable, Dict, List, Tuple
 from unittest.mock import patch
 
-from homeassistant import bootstrap, core
+from homeassistant import bootstrap, core, requirements
 from homeassistant.config import get_default_config_dir
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.check_config import async_check_ha_config_file
@@ -158,10 +158,10 @@ def check(config_dir, secrets=False):
     }
 
     # pylint: disable=possibly-unused-variable
-    def mock_load(filename):
+    def mock_load(filename, parse_cache=None):
         """Mock hass.util.load_yaml to save config file names."""
         res["yaml_files"][filename] = True
-        return MOCKS["load"][1](filename)
+        return MOCKS["load"][1](filename, parse_cache)
 
     # pylint: disable=possibly-unused-variable
     def mock_secrets(ldr, node):
@@ -224,6 +224,10 @@ async def async_check_config(config_dir):
     """Check the HA config."""
     hass = core.HomeAssistant()
     hass.config.config_dir = config_dir
+    # Checking the config must not write to the config dir
+    hass.data[requirements.DATA_PKG_CACHE] = requirements.RequirementsCache(
+        hass, persist=False
+    )
     components = await async_check_ha_config_file(hass)
     await hass.async_stop(force=True)
     return components
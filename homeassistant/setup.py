@@ -163,7 +163,7 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", integration.documentation)
         return False
@@ -171,6 +171,16 @@ async def _async_setup_component(
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
 
+    # Import the platforms the config entries will forward to while the
+    # config is processed and the component is set up.
+    platforms = getattr(component, "PLATFORMS", None)
+    if (
+        isinstance(platforms, (list, tuple, set))
+        and all(isinstance(platform, str) for platform in platforms)
+        and hass.config_entries.async_entries(domain)
+    ):
+        hass.async_create_task(integration.async_prefetch_platforms(platforms))
+
     processed_config = await conf_util.async_process_component_config(
         hass, config, integration
     )
@@ -295,7 +305,7 @@ async def async_prepare_setup_platform(
         return None
 
     try:
-        platform = integration.get_platform(domain)
+        platform = await integration.async_get_platform(domain)
     except ImportError as exc:
         log_error(f"Platform not found ({exc}).")
         return None
@@ -308,7 +318,7 @@ async def async_prepare_setup_platform(
     # If the integration is not set up yet, and can be set up, set it up.
     if integration.domain not in hass.config.components:
         try:
-            component = integration.get_component()
+            component = await integration.async_get_component()
         except ImportError as exc:
             log_error(f"Unable to import the component ({exc}).")
             return None
@@ -1,5 +1,6 @@
 """Helpers to install PyPi packages."""
 import asyncio
+import hashlib
 from importlib.metadata import PackageNotFoundError, version
 import logging
 import os
@@ -9,8 +10,6 @@ import sys
 from typing import Optional
 from urllib.parse import urlparse
 
-import pkg_resources
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -33,6 +32,10 @@ def is_installed(package: str) -> bool:
     Returns True when the requirement is met.
     Returns False when the package is not installed or doesn't meet req.
     """
+    # Importing pkg_resources scans the whole working set, only pay for it
+    # when a requirement actually has to be checked.
+    import pkg_resources  # pylint: disable=import-outside-toplevel
+
     try:
         req = pkg_resources.Requirement.parse(package)
     except ValueError:
@@ -46,6 +49,23 @@ def is_installed(package: str) -> bool:
         return False
 
 
+def environment_fingerprint() -> str:
+    """Return a fingerprint of the locations packages are imported from.
+
+    Installing, upgrading or removing a package touches the directory it
+    lives in, so any change to the installed packages changes the fingerprint.
+    """
+    parts = [sys.executable, sys.version]
+    for path in sys.path:
+        if not path:
+            continue
+        try:
+            parts.append(f"{path}:{os.stat(path).st_mtime_ns}")
+        except OSError:
+            continue
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
 def install_package(
     package: str,
     upgrade: bool = True,
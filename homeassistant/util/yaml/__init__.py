@@ -2,7 +2,7 @@
 from .const import SECRET_YAML
 from .dumper import dump, save_yaml
 from .input import UndefinedSubstitution, extract_inputs, substitute
-from .loader import clear_secret_cache, load_yaml, parse_yaml, secret_yaml
+from .loader import ParseCache, clear_secret_cache, load_yaml, parse_yaml, secret_yaml
 from .objects import Input
 
 __all__ = [
@@ -12,6 +12,7 @@ __all__ = [
     "save_yaml",
     "clear_secret_cache",
     "load_yaml",
+    "ParseCache",
     "secret_yaml",
     "parse_yaml",
     "UndefinedSubstitution",
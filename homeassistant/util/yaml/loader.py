@@ -1,13 +1,31 @@
 """Custom loader."""
 from collections import OrderedDict
+from datetime import date, datetime
 import fnmatch
+import hashlib
+import json
 import logging
 import os
 import sys
-from typing import Dict, Iterator, List, TextIO, TypeVar, Union, overload
+import tempfile
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
 import yaml
 
+from homeassistant.const import __version__
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import SECRET_YAML
@@ -18,9 +36,29 @@ from .objects import Input, NodeListClass, NodeStrClass
 JSON_TYPE = Union[List, Dict, str]  # pylint: disable=invalid-name
 DICT_T = TypeVar("DICT_T", bound=Dict)  # pylint: disable=invalid-name
 
+try:
+    FastestAvailableSafeLoader = yaml.CSafeLoader
+except AttributeError:  # pragma: no cover
+    FastestAvailableSafeLoader = yaml.SafeLoader  # type: ignore
+
 _LOGGER = logging.getLogger(__name__)
 __SECRET_CACHE: Dict[str, JSON_TYPE] = {}
 
+# Files changed less than this long ago are not cached, a second change within
+# the resolution of the file system timestamps would go unnoticed otherwise.
+PARSE_CACHE_RACY_WINDOW = 2
+PARSE_CACHE_VERSION = 3
+
+_LOCAL = threading.local()
+
+DependencyKey = Tuple[str, str]
+# Values of !secret and !env_var tags are not persisted, the cache stores
+# ("secret", file name, secret name) or ("env", tag value) placeholders.
+DeferredValue = Tuple[str, ...]
+# Warnings logged while parsing a file are kept as [message, *args] and logged
+# again when the cached result is used.
+CacheEntry = Tuple[Dict[DependencyKey, Any], Any, List[List[Any]]]
+
 
 def clear_secret_cache() -> None:
     """Clear the secret cache.
@@ -30,19 +68,338 @@ def clear_secret_cache() -> None:
     __SECRET_CACHE.clear()
 
 
-class SafeLineLoader(yaml.SafeLoader):
-    """Loader class that keeps track of line numbers."""
+class SafeLineLoader(FastestAvailableSafeLoader):  # type: ignore
+    """Loader class that keeps track of the file being loaded.
 
-    def compose_node(self, parent: yaml.nodes.Node, index: int) -> yaml.nodes.Node:
-        """Annotate a node with the first line it was seen."""
-        last_line: int = self.line
-        node: yaml.nodes.Node = super().compose_node(parent, index)
-        node.__line__ = last_line + 1  # type: ignore
-        return node
+    Line numbers are taken from the start mark of each node, which both the
+    C and the pure Python parser provide.
+    """
 
+    def __init__(self, stream: Union[str, TextIO]) -> None:
+        """Initialize the loader."""
+        super().__init__(stream)
+        self.name = getattr(stream, "name", "<unicode string>")
+        self.stream = stream
 
-def load_yaml(fname: str) -> JSON_TYPE:
-    """Load a YAML file."""
+
+def _path_signature(path: str) -> Optional[Tuple[int, int]]:
+    """Return modification time and size of a path, None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _dependency_signature(key: DependencyKey) -> Any:
+    """Return the current signature of a dependency of a parsed file."""
+    kind, name = key
+    if kind == "env":
+        value = os.environ.get(name)
+        if value is None:
+            return None
+        return hashlib.sha256(value.encode("utf-8")).hexdigest()
+    return _path_signature(name)
+
+
+def _record_dependency(key: DependencyKey, signature: Any) -> None:
+    """Record a dependency for all files that are currently being parsed."""
+    for dependencies, _, _ in getattr(_LOCAL, "parsing", ()):
+        dependencies[key] = signature
+
+
+def _record_deferred(value: Any, placeholder: DeferredValue) -> None:
+    """Record a value that must not be persisted for all files being parsed."""
+    for _, deferred, _ in getattr(_LOCAL, "parsing", ()):
+        deferred[id(value)] = (value, placeholder)
+
+
+def _warn(msg: str, *args: Any) -> None:
+    """Log a warning and record it for the files being parsed."""
+    _LOGGER.warning(msg, *args)
+    for _, _, warnings in getattr(_LOCAL, "parsing", ()):
+        warnings.append([msg, *args])
+
+
+def _resolve_deferred(placeholder: DeferredValue) -> Any:
+    """Return the current value of a placeholder."""
+    if placeholder[0] == "secret":
+        value = _resolve_secret(placeholder[1], placeholder[2])
+    else:
+        value = _resolve_env_var(placeholder[1])
+    _record_deferred(value, placeholder)
+    return value
+
+
+def _encode_node(obj: Any, deferred: Dict[int, Tuple[Any, DeferredValue]]) -> Any:
+    """Encode a parsed value as JSON, keeping the file references.
+
+    Raises TypeError for values that can not be encoded.
+    """
+    entry = deferred.get(id(obj))
+    if entry is not None and entry[0] is obj:
+        return ["deferred", *entry[1]]
+    if obj is None or isinstance(obj, (bool, int, float)):
+        return obj
+    if isinstance(obj, NodeStrClass):
+        return ["str", *_encode_reference(obj), str(obj)]
+    if isinstance(obj, str):
+        return obj
+    if isinstance(obj, dict):
+        return [
+            "dict",
+            *_encode_reference(obj),
+            [
+                [_encode_node(key, deferred), _encode_node(value, deferred)]
+                for key, value in obj.items()
+            ],
+        ]
+    if isinstance(obj, list):
+        return [
+            "list",
+            *_encode_reference(obj),
+            [_encode_node(value, deferred) for value in obj],
+        ]
+    if isinstance(obj, datetime):
+        return ["datetime", obj.isoformat()]
+    if isinstance(obj, date):
+        return ["date", obj.isoformat()]
+    if isinstance(obj, Input):
+        return ["input", obj.name]
+    raise TypeError(f"Unable to cache value of type {type(obj).__name__}")
+
+
+def _encode_reference(obj: Any) -> Tuple[Optional[str], Optional[int]]:
+    """Return the file reference information of an object."""
+    return (getattr(obj, "__config_file__", None), getattr(obj, "__line__", None))
+
+
+def _decode_node(data: Any) -> Any:
+    """Decode a value encoded by _encode_node."""
+    if not isinstance(data, list):
+        return data
+
+    kind = data[0]
+    if kind == "deferred":
+        return _resolve_deferred(tuple(data[1:]))
+    if kind == "datetime":
+        return datetime.fromisoformat(data[1])
+    if kind == "date":
+        return date.fromisoformat(data[1])
+    if kind == "input":
+        return Input(data[1])
+
+    _, config_file, line, value = data
+    if kind == "str":
+        obj: Any = NodeStrClass(value)
+    elif kind == "dict":
+        obj = OrderedDict(
+            (_decode_node(key), _decode_node(item)) for key, item in value
+        )
+    else:
+        obj = NodeListClass(_decode_node(item) for item in value)
+    if config_file is not None:
+        setattr(obj, "__config_file__", config_file)
+        setattr(obj, "__line__", line)
+    return obj
+
+
+class ParseCache:
+    """Cache of parsed YAML files that is persisted between runs.
+
+    Each entry remembers the signature of every file, directory and
+    environment variable that went into the result and is only reused
+    while none of them has changed. Secrets and environment variables are
+    stored as placeholders and resolved again when an entry is used.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the parse cache."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, CacheEntry]] = None
+        self._used: Dict[str, CacheEntry] = {}
+        self._dirty = False
+
+    def _load(self) -> None:
+        """Load the persisted entries."""
+        self._entries = {}
+        try:
+            with open(self.path, encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+            if data["version"] != [PARSE_CACHE_VERSION, __version__]:
+                return
+            entries = {
+                fname: (
+                    {
+                        (kind, name): (
+                            tuple(signature)
+                            if isinstance(signature, list)
+                            else signature
+                        )
+                        for kind, name, signature in dependencies
+                    },
+                    value,
+                    warnings,
+                )
+                for fname, (dependencies, value, warnings) in data["entries"].items()
+            }
+        except FileNotFoundError:
+            return
+        except (ValueError, KeyError, TypeError) as err:
+            _LOGGER.debug("Ignoring YAML parse cache %s: %s", self.path, err)
+            return
+
+        self._entries = entries
+
+    def _lookup(self, fname: str) -> Optional[CacheEntry]:
+        """Return the entry for a file if all its dependencies are unchanged."""
+        with self._lock:
+            if self._entries is None:
+                self._load()
+            assert self._entries is not None
+            entry = self._entries.get(fname)
+
+        if entry is None or any(
+            _dependency_signature(key) != signature
+            for key, signature in entry[0].items()
+        ):
+            return None
+
+        with self._lock:
+            self._used[fname] = entry
+        return entry
+
+    def _store(
+        self,
+        fname: str,
+        dependencies: Dict[DependencyKey, Any],
+        deferred: Dict[int, Tuple[Any, DeferredValue]],
+        warnings: List[List[Any]],
+        result: JSON_TYPE,
+    ) -> None:
+        """Store the result of parsing a file."""
+        racy_after = time.time_ns() - PARSE_CACHE_RACY_WINDOW * 1_000_000_000
+        if any(
+            isinstance(signature, tuple) and signature[0] > racy_after
+            for key, signature in dependencies.items()
+            if key[0] == "path"
+        ):
+            return
+
+        try:
+            data = _encode_node(result, deferred)
+        except TypeError:
+            return
+
+        with self._lock:
+            assert self._entries is not None
+            self._entries[fname] = self._used[fname] = (dependencies, data, warnings)
+            self._dirty = True
+
+    def load_yaml(self, fname: str) -> JSON_TYPE:
+        """Load a YAML file, reusing the cached result if it is still valid."""
+        if os.path.basename(fname) == SECRET_YAML:
+            return _load_yaml_file(fname)
+
+        entry = self._lookup(fname)
+        if entry is not None:
+            for key, signature in entry[0].items():
+                _record_dependency(key, signature)
+            for msg, *args in entry[2]:
+                _LOGGER.warning(msg, *args)
+            return _decode_node(entry[1])
+
+        dependencies: Dict[DependencyKey, Any] = {
+            ("path", fname): _path_signature(fname)
+        }
+        deferred: Dict[int, Tuple[Any, DeferredValue]] = {}
+        warnings: List[List[Any]] = []
+        parsing = _LOCAL.__dict__.setdefault("parsing", [])
+        parsing.append((dependencies, deferred, warnings))
+        try:
+            result = _load_yaml_file(fname)
+        finally:
+            parsing.pop()
+
+        for key, signature in dependencies.items():
+            _record_dependency(key, signature)
+
+        if dependencies[("path", fname)] is not None:
+            self._store(fname, dependencies, deferred, warnings, result)
+        return result
+
+    def save(self) -> None:
+        """Persist the entries used since the last save.
+
+        Call this once the configuration is loaded, entries of files that are
+        no longer part of the configuration are dropped. Not async friendly.
+        """
+        with self._lock:
+            used, self._used = self._used, {}
+            if self._entries is None or (
+                not self._dirty and used.keys() == self._entries.keys()
+            ):
+                return
+            self._entries = dict(used)
+            data = json.dumps(
+                {
+                    "version": [PARSE_CACHE_VERSION, __version__],
+                    "entries": {
+                        fname: [
+                            [
+                                [kind, name, signature]
+                                for (kind, name), signature in dependencies.items()
+                            ],
+                            value,
+                            warnings,
+                        ]
+                        for fname, (dependencies, value, warnings) in used.items()
+                    },
+                }
+            )
+            self._dirty = False
+
+        tmp_filename = ""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # Modern versions of Python tempfile create this file with mode 0o600
+            with tempfile.NamedTemporaryFile(
+                mode="w", encoding="utf-8", dir=os.path.dirname(self.path), delete=False
+            ) as fdesc:
+                fdesc.write(data)
+                tmp_filename = fdesc.name
+            os.replace(tmp_filename, self.path)
+        except OSError as err:
+            _LOGGER.warning("Unable to save YAML parse cache %s: %s", self.path, err)
+        finally:
+            if os.path.exists(tmp_filename):
+                try:
+                    os.remove(tmp_filename)
+                except OSError as err:
+                    _LOGGER.error("YAML parse cache cleanup failed: %s", err)
+
+
+def load_yaml(fname: str, parse_cache: Optional[ParseCache] = None) -> JSON_TYPE:
+    """Load a YAML file.
+
+    When a parse cache is passed in, it is also used for all included files.
+    """
+    if parse_cache is None:
+        parse_cache = getattr(_LOCAL, "parse_cache", None)
+        if parse_cache is None:
+            return _load_yaml_file(fname)
+
+    previous = getattr(_LOCAL, "parse_cache", None)
+    _LOCAL.parse_cache = parse_cache
+    try:
+        return parse_cache.load_yaml(fname)
+    finally:
+        _LOCAL.parse_cache = previous
+
+
+def _load_yaml_file(fname: str) -> JSON_TYPE:
+    """Parse a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file)
@@ -117,7 +474,9 @@ def _is_file_valid(name: str) -> bool:
 
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
+    _record_dependency(("path", directory), _path_signature(directory))
     for root, dirs, files in os.walk(directory, topdown=True):
+        _record_dependency(("path", root), _path_signature(root))
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
@@ -201,10 +560,10 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
 
         if key in seen:
             fname = getattr(loader.stream, "name", "")
-            _LOGGER.warning(
+            _warn(
                 'YAML file %s contains duplicate key "%s". Check lines %d and %d',
                 fname,
-                key,
+                str(key),
                 seen[key],
                 line,
             )
@@ -221,15 +580,23 @@ def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
 
 def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
-    args = node.value.split()
+    value = _resolve_env_var(node.value)
+    _record_deferred(value, ("env", node.value))
+    return value
+
+
+def _resolve_env_var(tag_value: str) -> str:
+    """Return the value of an environment variable tag."""
+    args = tag_value.split()
+    _record_dependency(("env", args[0]), _dependency_signature(("env", args[0])))
 
     # Check for a default value
     if len(args) > 1:
         return os.getenv(args[0], " ".join(args[1:]))
     if args[0] in os.environ:
         return os.environ[args[0]]
-    _LOGGER.error("Environment variable %s not defined", node.value)
-    raise HomeAssistantError(node.value)
+    _LOGGER.error("Environment variable %s not defined", tag_value)
+    raise HomeAssistantError(tag_value)
 
 
 def _load_secret_yaml(secret_path: str) -> JSON_TYPE:
@@ -266,17 +633,26 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
         raise HomeAssistantError(
             "secrets.yaml: attempt to load secret from within secrets file"
         )
-    secret_path = os.path.dirname(loader.name)
+    value = _resolve_secret(loader.name, node.value)
+    _record_deferred(value, ("secret", loader.name, node.value))
+    return value
+
+
+def _resolve_secret(fname: str, name: str) -> JSON_TYPE:
+    """Look up a secret for a file in the secrets files of its folders."""
+    secret_path = os.path.dirname(fname)
     while True:
+        secret_file = os.path.join(secret_path, SECRET_YAML)
+        _record_dependency(("path", secret_file), _path_signature(secret_file))
         secrets = _load_secret_yaml(secret_path)
 
-        if node.value in secrets:
+        if name in secrets:
             _LOGGER.debug(
                 "Secret %s retrieved from secrets.yaml in folder %s",
-                node.value,
+                name,
                 secret_path,
             )
-            return secrets[node.value]
+            return secrets[name]
 
         if secret_path == os.path.dirname(sys.path[0]):
             break  # sys.path[0] set to config/deps folder by bootstrap
@@ -285,7 +661,7 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
         if not os.path.exists(secret_path) or len(secret_path) < 5:
             break  # Somehow we got past the .homeassistant config folder
 
-    raise HomeAssistantError(f"Secret {node.value} not defined")
+    raise HomeAssistantError(f"Secret {name} not defined")
 
 
 yaml.SafeLoader.add_constructor("!include", _include_yaml)
@@ -304,3 +680,7 @@ yaml.SafeLoader.add_constructor(
     "!include_dir_merge_named", _include_dir_merge_named_yaml
 )
 yaml.SafeLoader.add_constructor("!input", Input.from_node)
+
+# Share the constructors so constructors that get replaced on the
+# SafeLoader, like the secret constructor of check_config, apply to both.
+SafeLineLoader.yaml_constructors = yaml.SafeLoader.yaml_constructors
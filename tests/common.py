@@ -985,6 +985,7 @@ def mock_storage(data=None):
 
     async def mock_async_load(store):
         """Mock version of load."""
+        mock_data = None
         if store._data is None:
             # No data to load
             if store.key not in data:
@@ -1000,6 +1001,9 @@ def mock_storage(data=None):
 
         # Route through original load so that we trigger migration
         loaded = await orig_load(store)
+        if mock_data is not None and store._data is mock_data:
+            # The loaded data is not a pending write
+            store._data = None
         _LOGGER.info("Loading data for %s: %s", store.key, loaded)
         return loaded
 
@@ -1009,6 +1013,21 @@ def mock_storage(data=None):
         # To ensure that the data can be serialized
         data[store.key] = json.loads(json.dumps(data_to_write, cls=store._encoder))
 
+    def mock_write_journal(store, path, records):
+        """Mock version of write journal."""
+        _LOGGER.info("Writing changes to %s: %s", store.key, records)
+        stored = data.setdefault(
+            store.key,
+            {
+                "version": store.version,
+                "key": store.key,
+                "data": {collection: [] for collection in store.collections},
+            },
+        )
+        # To ensure that the data can be serialized
+        records = json.loads(json.dumps(records, cls=store._encoder))
+        storage._apply_journal_records(stored["data"], store.collections, records)
+
     async def mock_remove(store):
         """Remove data."""
         data.pop(store.key, None)
@@ -1021,6 +1040,10 @@ def mock_storage(data=None):
         "homeassistant.helpers.storage.Store._write_data",
         side_effect=mock_write_data,
         autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.JournaledStore._write_journal",
+        side_effect=mock_write_journal,
+        autospec=True,
     ), patch(
         "homeassistant.helpers.storage.Store.async_remove",
         side_effect=mock_remove,
@@ -1031,7 +1054,7 @@ def mock_storage(data=None):
 
 async def flush_store(store):
     """Make sure all delayed writes of a store are written."""
-    if store._data is None:
+    if store._data is None and not getattr(store, "_changes", None):
         return
 
     store._async_cleanup_final_write_listener()
@@ -673,10 +673,13 @@ async def test_automation_stops(hass, calls, service):
             blocking=True,
         )
     else:
+        changed_config = {
+            automation.DOMAIN: {**config[automation.DOMAIN], "description": "changed"}
+        }
         with patch(
             "homeassistant.config.load_yaml_config_file",
             autospec=True,
-            return_value=config,
+            return_value=changed_config,
         ):
             await hass.services.async_call(
                 automation.DOMAIN, SERVICE_RELOAD, blocking=True
@@ -688,6 +691,74 @@ async def test_automation_stops(hass, calls, service):
     assert len(calls) == (1 if service == "turn_off_no_stop" else 0)
 
 
+async def test_reload_keeps_unchanged_automations(hass, calls):
+    """Test reloading only replaces the automations that changed."""
+    test_entity = "test.entity"
+    unchanged = {
+        "alias": "unchanged",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [
+            {"event": "running"},
+            {"wait_template": "{{ is_state('test.entity', 'goodbye') }}"},
+            {"service": "test.automation"},
+        ],
+    }
+    changed = {
+        "alias": "changed",
+        "trigger": {"platform": "event", "event_type": "other_event"},
+        "action": {"service": "test.automation"},
+    }
+    removed = {
+        "alias": "removed",
+        "trigger": {"platform": "event", "event_type": "other_event"},
+        "action": {"service": "test.automation"},
+    }
+    assert await async_setup_component(
+        hass, automation.DOMAIN, {automation.DOMAIN: [unchanged, changed, removed]}
+    )
+    component = hass.data[automation.DOMAIN]
+    unchanged_entity = component.get_entity("automation.unchanged")
+    changed_entity = component.get_entity("automation.changed")
+
+    running = asyncio.Event()
+
+    @callback
+    def running_cb(event):
+        running.set()
+
+    hass.bus.async_listen_once("running", running_cb)
+    hass.states.async_set(test_entity, "hello")
+
+    hass.bus.async_fire("test_event")
+    await running.wait()
+
+    new_config = {
+        automation.DOMAIN: [
+            unchanged,
+            {**changed, "trigger": {"platform": "event", "event_type": "test_event"}},
+        ]
+    }
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=new_config,
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert component.get_entity("automation.unchanged") is unchanged_entity
+    assert component.get_entity("automation.changed") is not changed_entity
+    assert hass.states.get("automation.removed") is None
+
+    hass.states.async_set(test_entity, "goodbye")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    # Both the unchanged and the replaced automation listen to test_event now
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+
 async def test_automation_restore_state(hass):
     """Ensure states are restored on startup."""
     time = dt_util.utcnow()
@@ -414,6 +414,10 @@ async def test_see_state(hass, yaml_devices):
 
     common.async_see(hass, **params)
     await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=legacy.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
 
     config = await legacy.async_load_config(yaml_devices, hass, timedelta(seconds=0))
     assert len(config) == 1
@@ -504,6 +508,93 @@ async def test_see_passive_zone_state(hass, mock_device_tracker_conf):
     assert attrs.get("source_type") == device_tracker.SOURCE_TYPE_ROUTER
 
 
+async def test_known_devices_store(hass, hass_storage, yaml_devices):
+    """Test known devices are migrated to and loaded from storage."""
+    with open(yaml_devices, "w") as out:
+        out.write("# Phones\ndev1:\n  name: Dev 1\n  mac: aa:bb\n  track: true\n")
+
+    known_devices = legacy.KnownDevices(hass, yaml_devices, timedelta(seconds=180))
+    devices = await known_devices.async_load()
+    assert [(dev.dev_id, dev.mac, dev.track) for dev in devices] == [
+        ("dev1", "AA:BB", True)
+    ]
+    assert hass_storage[legacy.STORAGE_KEY]["data"]["devices"]["dev1"]["mac"] == "AA:BB"
+
+    known_devices.async_add_device(
+        legacy.Device(hass, timedelta(seconds=60), False, "dev2", "CC:DD")
+    )
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=legacy.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    exported = await legacy.async_load_config(yaml_devices, hass, timedelta(0))
+    # Only a consider_home differing from the default is exported
+    assert [(dev.dev_id, dev.consider_home) for dev in exported] == [
+        ("dev1", timedelta(0)),
+        ("dev2", timedelta(seconds=60)),
+    ]
+    # New devices are appended, the file is not rewritten
+    with open(yaml_devices) as fil:
+        assert fil.read().startswith(
+            "# Phones\ndev1:\n  name: Dev 1\n  mac: aa:bb\n  track: true\n\n"
+        )
+
+    # The YAML file is not parsed again while it is unchanged
+    known_devices = legacy.KnownDevices(hass, yaml_devices, timedelta(seconds=180))
+    with patch(
+        "homeassistant.components.device_tracker.legacy.async_load_config"
+    ) as mock_load:
+        devices = await known_devices.async_load()
+    assert not mock_load.called
+    assert [dev.dev_id for dev in devices] == ["dev1", "dev2"]
+
+    # Edits by hand are imported again
+    with open(yaml_devices, "w") as out:
+        out.write("dev3:\n  name: Dev 3\n")
+    known_devices = legacy.KnownDevices(hass, yaml_devices, timedelta(seconds=180))
+    devices = await known_devices.async_load()
+    assert [dev.dev_id for dev in devices] == ["dev3"]
+
+
+async def test_known_devices_export_interrupted(hass, hass_storage, yaml_devices):
+    """Test an interrupted export leaves known_devices.yaml intact."""
+    with open(yaml_devices, "w") as out:
+        out.write("dev1:\n  name: Dev 1\n")
+
+    known_devices = legacy.KnownDevices(hass, yaml_devices, timedelta(seconds=180))
+    await known_devices.async_load()
+    known_devices.async_add_device(
+        legacy.Device(hass, timedelta(seconds=180), False, "dev2", "CC:DD")
+    )
+    files = os.listdir(os.path.dirname(yaml_devices))
+
+    with patch(
+        "homeassistant.components.device_tracker.legacy.os.replace",
+        side_effect=OSError("No space left on device"),
+    ):
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=legacy.SAVE_DELAY)
+        )
+        await hass.async_block_till_done()
+
+    with open(yaml_devices) as fil:
+        assert fil.read() == "dev1:\n  name: Dev 1\n"
+    assert os.listdir(os.path.dirname(yaml_devices)) == files
+
+    # The device is exported with the next one
+    known_devices.async_add_device(
+        legacy.Device(hass, timedelta(seconds=180), False, "dev3", "EE:FF")
+    )
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=legacy.SAVE_DELAY * 2)
+    )
+    await hass.async_block_till_done()
+
+    exported = await legacy.async_load_config(yaml_devices, hass, timedelta(0))
+    assert [dev.dev_id for dev in exported] == ["dev1", "dev2", "dev3"]
+
+
 @patch("homeassistant.components.device_tracker.const.LOGGER.warning")
 async def test_see_failures(mock_warning, hass, mock_device_tracker_conf):
     """Test that the device tracker see failures."""
@@ -4,6 +4,8 @@ import unittest
 from unittest import mock
 from unittest.mock import patch
 
+import pytest
+
 import homeassistant.components.graphite as graphite
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_START,
@@ -92,10 +94,19 @@ class TestGraphite(unittest.TestCase):
     def test_event_listener(self):
         """Test the event listener."""
         with mock.patch.object(self.gf, "_queue") as mock_queue:
+            mock_queue.qsize.return_value = 0
             self.gf.event_listener("foo")
             assert mock_queue.put.call_count == 1
             assert mock_queue.put.call_args == mock.call("foo")
 
+    def test_event_listener_queue_full(self):
+        """Test events are dropped when the queue is full."""
+        with mock.patch.object(self.gf, "_queue") as mock_queue:
+            mock_queue.qsize.return_value = graphite.MAX_QUEUE_SIZE
+            self.gf.event_listener("foo")
+            assert mock_queue.put.call_count == 0
+            assert self.gf.dropped_events == 1
+
     @patch("time.time")
     def test_report_attributes(self, mock_time):
         """Test the reporting with attributes."""
@@ -110,10 +121,8 @@ class TestGraphite(unittest.TestCase):
         ]
 
         state = mock.MagicMock(state=0, attributes=attrs)
-        with mock.patch.object(self.gf, "_send_to_graphite") as mock_send:
-            self.gf._report_attributes("entity", state)
-            actual = mock_send.call_args_list[0][0][0].split("\n")
-            assert sorted(expected) == sorted(actual)
+        self.gf._report_attributes("entity", state)
+        assert sorted(expected) == sorted(self.gf._lines)
 
     @patch("time.time")
     def test_report_with_string_state(self, mock_time):
@@ -122,34 +131,29 @@ class TestGraphite(unittest.TestCase):
         expected = ["ha.entity.foo 1.000000 12345", "ha.entity.state 1.000000 12345"]
 
         state = mock.MagicMock(state="above_horizon", attributes={"foo": 1.0})
-        with mock.patch.object(self.gf, "_send_to_graphite") as mock_send:
-            self.gf._report_attributes("entity", state)
-            actual = mock_send.call_args_list[0][0][0].split("\n")
-            assert sorted(expected) == sorted(actual)
+        self.gf._report_attributes("entity", state)
+        assert sorted(expected) == sorted(self.gf._lines)
 
     @patch("time.time")
     def test_report_with_binary_state(self, mock_time):
         """Test the reporting with binary state."""
         mock_time.return_value = 12345
         state = ha.State("domain.entity", STATE_ON, {"foo": 1.0})
-        with mock.patch.object(self.gf, "_send_to_graphite") as mock_send:
-            self.gf._report_attributes("entity", state)
-            expected = [
-                "ha.entity.foo 1.000000 12345",
-                "ha.entity.state 1.000000 12345",
-            ]
-            actual = mock_send.call_args_list[0][0][0].split("\n")
-            assert sorted(expected) == sorted(actual)
+        self.gf._report_attributes("entity", state)
+        expected = [
+            "ha.entity.foo 1.000000 12345",
+            "ha.entity.state 1.000000 12345",
+        ]
+        assert sorted(expected) == sorted(self.gf._lines)
 
+        self.gf._lines = []
         state.state = STATE_OFF
-        with mock.patch.object(self.gf, "_send_to_graphite") as mock_send:
-            self.gf._report_attributes("entity", state)
-            expected = [
-                "ha.entity.foo 1.000000 12345",
-                "ha.entity.state 0.000000 12345",
-            ]
-            actual = mock_send.call_args_list[0][0][0].split("\n")
-            assert sorted(expected) == sorted(actual)
+        self.gf._report_attributes("entity", state)
+        expected = [
+            "ha.entity.foo 1.000000 12345",
+            "ha.entity.state 0.000000 12345",
+        ]
+        assert sorted(expected) == sorted(self.gf._lines)
 
     @patch("time.time")
     def test_send_to_graphite_errors(self, mock_time):
@@ -159,24 +163,55 @@ class TestGraphite(unittest.TestCase):
         with mock.patch.object(self.gf, "_send_to_graphite") as mock_send:
             mock_send.side_effect = socket.error
             self.gf._report_attributes("entity", state)
+            self.gf._flush()
+            assert mock_send.call_count == 1
+            assert self.gf.dropped_lines == 2
+
+            # Batches are dropped until it is time to reconnect
+            self.gf._report_attributes("entity", state)
+            self.gf._flush()
+            assert mock_send.call_count == 1
+            assert self.gf.dropped_lines == 4
+
+            self.gf._connect_failed_time -= graphite.RECONNECT_INTERVAL
             mock_send.side_effect = socket.gaierror
             self.gf._report_attributes("entity", state)
+            self.gf._flush()
+            assert mock_send.call_count == 2
+            assert self.gf.dropped_lines == 6
+
+            self.gf._connect_failed_time -= graphite.RECONNECT_INTERVAL
+            mock_send.side_effect = None
+            self.gf._report_attributes("entity", state)
+            self.gf._flush()
+            assert mock_send.call_count == 3
+            assert self.gf._connect_failed_time is None
+            assert self.gf.dropped_lines == 6
 
     @patch("socket.socket")
     def test_send_to_graphite(self, mock_socket):
         """Test the sending of data."""
-        self.gf._send_to_graphite("foo")
+        self.gf._send_to_graphite("foo\n")
+        self.gf._send_to_graphite("bar\n")
         assert mock_socket.call_count == 1
         assert mock_socket.call_args == mock.call(socket.AF_INET, socket.SOCK_STREAM)
         sock = mock_socket.return_value
         assert sock.connect.call_count == 1
         assert sock.connect.call_args == mock.call(("foo", 123))
-        assert sock.sendall.call_count == 1
-        assert sock.sendall.call_args == mock.call(b"foo")
-        assert sock.send.call_count == 1
-        assert sock.send.call_args == mock.call(b"\n")
+        assert sock.sendall.call_count == 2
+        assert sock.sendall.call_args_list == [mock.call(b"foo\n"), mock.call(b"bar\n")]
+        assert sock.close.call_count == 0
+
+        # Connect again after the connection failed
+        sock.sendall.side_effect = OSError
+        with pytest.raises(OSError):
+            self.gf._send_to_graphite("baz\n")
         assert sock.close.call_count == 1
-        assert sock.close.call_args == mock.call()
+
+        sock.sendall.side_effect = None
+        self.gf._send_to_graphite("baz\n")
+        assert mock_socket.call_count == 2
+        assert sock.connect.call_count == 2
 
     def test_run_stops(self):
         """Test the stops."""
@@ -188,6 +223,38 @@ class TestGraphite(unittest.TestCase):
             assert mock_queue.task_done.call_count == 1
             assert mock_queue.task_done.call_args == mock.call()
 
+    @patch("time.time")
+    def test_run_batches(self, mock_time):
+        """Test the lines of several events are sent in one batch."""
+        mock_time.return_value = 12345
+        self.gf._queue.put(
+            mock.MagicMock(
+                event_type=EVENT_STATE_CHANGED,
+                data={
+                    "entity_id": "entity",
+                    "new_state": ha.State("domain.entity", STATE_ON),
+                },
+            )
+        )
+        self.gf._queue.put(
+            mock.MagicMock(
+                event_type=EVENT_STATE_CHANGED,
+                data={
+                    "entity_id": "other",
+                    "new_state": ha.State("domain.other", STATE_OFF),
+                },
+            )
+        )
+        self.gf._queue.put(self.gf._quit_object)
+
+        with mock.patch.object(self.gf, "_send_to_graphite") as mock_send:
+            self.gf.run()
+
+        assert mock_send.call_count == 1
+        assert mock_send.call_args == mock.call(
+            "ha.entity.state 1.000000 12345\nha.other.state 0.000000 12345\n"
+        )
+
     def test_run(self):
         """Test the running."""
         runs = []
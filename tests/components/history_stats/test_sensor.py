@@ -258,6 +258,103 @@ class TestHistoryStatsSensor(unittest.TestCase):
         assert sensor3.state == 2
         assert sensor4.state == 50
 
+    def test_measure_incremental(self):
+        """Test state changes are folded in without querying the history again."""
+        self.init_recorder()
+        start_time = dt_util.utcnow().replace(microsecond=0) - timedelta(minutes=60)
+        t0 = start_time + timedelta(minutes=20)
+        t1 = t0 + timedelta(minutes=20)
+
+        # Start     t0        t1        Now
+        # |--20min--|--20min--|--20min--|
+        # |---off---|---on----|---off---|
+
+        fake_states = {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "on", last_changed=t0),
+                ha.State("binary_sensor.test_id", "off", last_changed=t1),
+            ]
+        }
+        config = {
+            "history": {},
+            "sensor": [
+                {
+                    "platform": "history_stats",
+                    "entity_id": "binary_sensor.test_id",
+                    "state": "on",
+                    "start": f"{{{{ {start_time.timestamp()} }}}}",
+                    "end": "{{ now() }}",
+                    "type": sensor_type,
+                    "name": sensor_type,
+                }
+                for sensor_type in ("time", "count")
+            ],
+        }
+
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            return_value=fake_states,
+        ) as mock_changes, patch(
+            "homeassistant.components.history.get_state", return_value=None
+        ):
+            assert setup_component(self.hass, "sensor", config)
+            self.hass.block_till_done()
+
+            assert self.hass.states.get("sensor.time").state == str(round(20 / 60, 2))
+            assert self.hass.states.get("sensor.count").state == "1"
+
+            self.hass.states.set("binary_sensor.test_id", "on")
+            self.hass.block_till_done()
+            assert self.hass.states.get("sensor.count").state == "2"
+
+            self.hass.states.set("binary_sensor.test_id", "off")
+            self.hass.block_till_done()
+            assert self.hass.states.get("sensor.time").state == str(round(20 / 60, 2))
+            assert self.hass.states.get("sensor.count").state == "2"
+
+        # Queried once for each sensor
+        assert len(mock_changes.mock_calls) == 2
+
+    def test_measure_start_moves_forward(self):
+        """Test changes before a later start are used as the initial state."""
+        start_time = dt_util.utcnow().replace(microsecond=0) - timedelta(hours=2)
+        t0 = start_time + timedelta(minutes=30)
+
+        # Start     t0                New start          Now
+        # |--30min--|------30min------|------60min------|
+        # |---off---|-------------------on--------------|
+
+        fake_states = {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "on", last_changed=t0),
+            ]
+        }
+
+        start = Template(f"{{{{ {start_time.timestamp()} }}}}", self.hass)
+        end = Template("{{ now() }}", self.hass)
+
+        sensor = HistoryStatsSensor(
+            self.hass, "binary_sensor.test_id", "on", start, end, None, "time", "Test"
+        )
+
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            return_value=fake_states,
+        ) as mock_changes, patch(
+            "homeassistant.components.history.get_state", return_value=None
+        ):
+            sensor.update()
+            assert sensor.state == 1.5
+            assert sensor.count == 1
+
+            new_start = start_time + timedelta(hours=1)
+            sensor._start = Template(f"{{{{ {new_start.timestamp()} }}}}", self.hass)
+            sensor.update()
+            assert sensor.state == 1.0
+            assert sensor.count == 0
+
+        assert len(mock_changes.mock_calls) == 1
+
     def test_wrong_date(self):
         """Test when start or end value is not a timestamp or a date."""
         good = Template("{{ now() }}", self.hass)
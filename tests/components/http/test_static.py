@@ -0,0 +1,202 @@
+"""Test static file handling for the HTTP component."""
+import gzip
+import os
+from unittest.mock import patch
+
+from aiohttp.hdrs import (
+    ACCEPT_ENCODING,
+    CONTENT_ENCODING,
+    CONTENT_TYPE,
+    ETAG,
+    IF_MODIFIED_SINCE,
+    IF_NONE_MATCH,
+    LAST_MODIFIED,
+    RANGE,
+    VARY,
+)
+import pytest
+
+from homeassistant.components.http.static import _lookup_static_file, _select_encoding
+from homeassistant.setup import async_setup_component
+
+
+@pytest.fixture
+async def static_client(hass, hass_client, tmp_path):
+    """Serve a static directory with precompressed files."""
+    (tmp_path / "app.js").write_text("console.log('hello');")
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(b"console.log('hello');"))
+    (tmp_path / "app.js.br").write_bytes(b"brotli")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "style.css").write_text("body {}")
+
+    assert await async_setup_component(hass, "http", {})
+    hass.http.register_static_path("/static", str(tmp_path))
+    await hass.async_block_till_done()
+
+    return await hass_client()
+
+
+async def test_serve_precompressed_variants(static_client):
+    """Test the precompressed variant accepted by the client is served."""
+    resp = await static_client.get(
+        "/static/app.js", headers={ACCEPT_ENCODING: "gzip, deflate"}
+    )
+    assert resp.status == 200
+    assert resp.headers[CONTENT_ENCODING] == "gzip"
+    assert resp.headers[VARY] == ACCEPT_ENCODING
+    assert await resp.text() == "console.log('hello');"
+
+    resp = await static_client.get(
+        "/static/app.js", headers={ACCEPT_ENCODING: "gzip;q=0, identity"}
+    )
+    assert resp.status == 200
+    assert CONTENT_ENCODING not in resp.headers
+    assert await resp.text() == "console.log('hello');"
+
+    # Precompressed files can still be requested directly
+    resp = await static_client.get("/static/app.js.gz", headers={ACCEPT_ENCODING: ""})
+    assert resp.status == 200
+    assert CONTENT_ENCODING not in resp.headers
+
+    resp = await static_client.get("/static/sub/style.css")
+    assert resp.status == 200
+    assert VARY not in resp.headers
+    assert resp.headers[CONTENT_TYPE] == "text/css"
+    assert await resp.text() == "body {}"
+
+
+def test_select_encoding():
+    """Test selecting the preferred precompressed variant."""
+    variants = {None: None, "gzip": None, "br": None}
+    assert _select_encoding("gzip, deflate, br", variants) == "br"
+    assert _select_encoding("br;q=0, gzip;q=0.5", variants) == "gzip"
+    assert _select_encoding("identity", variants) is None
+    assert _select_encoding("br", {None: None, "gzip": None}) is None
+
+
+async def test_etag(static_client):
+    """Test requests with a matching ETag are answered without a body."""
+    resp = await static_client.get(
+        "/static/app.js", headers={ACCEPT_ENCODING: "identity"}
+    )
+    etag = resp.headers[ETAG]
+
+    resp = await static_client.get(
+        "/static/app.js",
+        headers={ACCEPT_ENCODING: "identity", IF_NONE_MATCH: f'"other", {etag}'},
+    )
+    assert resp.status == 304
+    assert resp.headers[ETAG] == etag
+
+    # The gzip variant has its own ETag
+    resp = await static_client.get(
+        "/static/app.js", headers={ACCEPT_ENCODING: "gzip", IF_NONE_MATCH: etag}
+    )
+    assert resp.status == 200
+    assert resp.headers[ETAG] != etag
+
+
+async def test_served_from_index_and_memory(hass, static_client, tmp_path):
+    """Test indexed files are served without looking them up again."""
+    resp = await static_client.get("/static/sub/style.css")
+    assert await resp.text() == "body {}"
+
+    # Kept in memory
+    (tmp_path / "sub" / "style.css").write_text("body {} ")
+    with patch("pathlib.Path.resolve") as mock_resolve:
+        resp = await static_client.get("/static/sub/style.css")
+    assert not mock_resolve.called
+    assert await resp.text() == "body {}"
+
+    # Files added after indexing are looked up
+    (tmp_path / "new.txt").write_text("new")
+    resp = await static_client.get("/static/new.txt")
+    assert resp.status == 200
+    assert await resp.text() == "new"
+
+    resp = await static_client.get("/static/missing.txt")
+    assert resp.status == 404
+
+    resp = await static_client.get("/static/../test_static.py")
+    assert resp.status == 404
+
+
+async def test_conditional_and_range_requests(static_client):
+    """Test If-Modified-Since and Range requests of files served from memory."""
+    resp = await static_client.get("/static/sub/style.css")
+    last_modified = resp.headers[LAST_MODIFIED]
+
+    resp = await static_client.get(
+        "/static/sub/style.css", headers={IF_MODIFIED_SINCE: last_modified}
+    )
+    assert resp.status == 304
+
+    resp = await static_client.get(
+        "/static/sub/style.css", headers={RANGE: "bytes=0-3"}
+    )
+    assert resp.status == 206
+    assert await resp.text() == "body"
+
+
+async def test_large_file_variants(static_client):
+    """Test large files are served as the selected variant."""
+    with patch("homeassistant.components.http.static.MEMORY_CACHE_MAX_FILE_SIZE", 0):
+        resp = await static_client.get(
+            "/static/app.js", headers={ACCEPT_ENCODING: "gzip;q=0, identity"}
+        )
+        assert resp.status == 200
+        assert CONTENT_ENCODING not in resp.headers
+        assert await resp.text() == "console.log('hello');"
+        etag = resp.headers[ETAG]
+
+        resp = await static_client.get(
+            "/static/app.js", headers={ACCEPT_ENCODING: "gzip"}
+        )
+        assert resp.status == 200
+        assert resp.headers[CONTENT_ENCODING] == "gzip"
+        assert resp.headers[ETAG] != etag
+        assert await resp.text() == "console.log('hello');"
+
+
+async def test_variant_last_modified(static_client, tmp_path):
+    """Test Last-Modified and If-Modified-Since use the served variant."""
+    (tmp_path / "late.js").write_text("late")
+    (tmp_path / "late.js.gz").write_bytes(gzip.compress(b"late"))
+    os.utime(tmp_path / "late.js", (1000000000, 1000000000))
+    os.utime(tmp_path / "late.js.gz", (1000000100, 1000000100))
+
+    resp = await static_client.get(
+        "/static/late.js", headers={ACCEPT_ENCODING: "identity"}
+    )
+    last_modified = resp.headers[LAST_MODIFIED]
+    assert last_modified == "Sun, 09 Sep 2001 01:46:40 GMT"
+
+    resp = await static_client.get(
+        "/static/late.js",
+        headers={ACCEPT_ENCODING: "gzip", IF_MODIFIED_SINCE: last_modified},
+    )
+    assert resp.status == 200
+    assert resp.headers[LAST_MODIFIED] == "Sun, 09 Sep 2001 01:48:20 GMT"
+
+    resp = await static_client.get(
+        "/static/late.js",
+        headers={
+            ACCEPT_ENCODING: "gzip",
+            IF_MODIFIED_SINCE: resp.headers[LAST_MODIFIED],
+        },
+    )
+    assert resp.status == 304
+
+
+async def test_only_normalized_names_indexed(static_client):
+    """Test other spellings of a file name are looked up every time."""
+    with patch(
+        "homeassistant.components.http.static._lookup_static_file",
+        wraps=_lookup_static_file,
+    ) as mock_lookup:
+        for _ in range(2):
+            resp = await static_client.get("/static/sub//style.css")
+            assert resp.status == 200
+            assert await resp.text() == "body {}"
+
+    assert mock_lookup.call_count == 2
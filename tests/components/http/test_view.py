@@ -33,9 +33,30 @@ async def test_invalid_json(caplog):
     view = HomeAssistantView()
 
     with pytest.raises(HTTPInternalServerError):
-        view.json(float("NaN"))
+        view.json(object)
 
-    assert str(float("NaN")) in caplog.text
+    assert "Unable to serialize to JSON" in caplog.text
+
+
+async def test_circular_json(caplog):
+    """Test trying to return JSON with a circular reference."""
+    view = HomeAssistantView()
+    result = {}
+    result["result"] = result
+
+    with pytest.raises(HTTPInternalServerError):
+        view.json(result)
+
+    assert "Unable to serialize to JSON" in caplog.text
+
+
+async def test_non_finite_json():
+    """Test NaN and infinite floats are returned as null."""
+    view = HomeAssistantView()
+
+    response = view.json({"nan": float("NaN"), "inf": float("inf")})
+
+    assert response.body == b'{"nan":null,"inf":null}'
 
 
 async def test_handling_unauthorized(mock_request):
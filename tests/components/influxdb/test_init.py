@@ -1,8 +1,10 @@
 """The tests for the InfluxDB component."""
 from dataclasses import dataclass
 import datetime
+import os
 from unittest.mock import MagicMock, Mock, call, patch
 
+from influxdb.line_protocol import make_lines
 import pytest
 
 import homeassistant.components.influxdb as influxdb
@@ -45,6 +47,12 @@ def mock_batch_timeout(hass, monkeypatch):
     )
 
 
+@pytest.fixture(autouse=True)
+def mock_config_dir(hass, tmp_path):
+    """Keep the buffer of events that could not be written in a temporary dir."""
+    hass.config.config_dir = str(tmp_path)
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture(request):
     """Patch the InfluxDBClient object with mock for version under test."""
@@ -62,17 +70,34 @@ def get_mock_call_fixture(request):
     """Get version specific lambda to make write API call mock."""
 
     def v2_call(body, precision):
-        data = {"bucket": DEFAULT_BUCKET, "record": body}
+        data = {"bucket": DEFAULT_BUCKET, "record": _to_lines(body, precision)}
 
         if precision is not None:
             data["write_precision"] = precision
 
         return call(**data)
 
+    def v1_call(body, precision):
+        return call(
+            _to_lines(body, precision), time_precision=precision, protocol="line"
+        )
+
     if request.param == influxdb.API_VERSION_2:
         return lambda body, precision=None: v2_call(body, precision)
-    # pylint: disable=unnecessary-lambda
-    return lambda body, precision=None: call(body, time_precision=precision)
+    return lambda body, precision=None: v1_call(body, precision)
+
+
+def _to_lines(body, precision=None):
+    """Encode points the way the InfluxDB client does."""
+    for point in body:
+        # Numeric states and attributes are always written as floats
+        point["fields"] = {
+            key: float(value)
+            if isinstance(value, int) and not isinstance(value, bool)
+            else value
+            for key, value in point["fields"].items()
+        }
+    return make_lines({"points": body}, precision).splitlines()
 
 
 def _get_write_api_mock_v1(mock_influx_client):
@@ -1470,7 +1495,9 @@ async def test_event_listener_scheduled_write(
         handler_method(event)
         hass.data[influxdb.DOMAIN].block_till_done()
         assert not mock_sleep.called
-    assert write_api.call_count == 3
+    # The event that could not be written is written after the new one
+    assert write_api.call_count == 4
+    assert write_api.call_args_list[2] == write_api.call_args_list[3]
 
 
 @pytest.mark.parametrize(
@@ -1494,7 +1521,7 @@ async def test_event_listener_scheduled_write(
 async def test_event_listener_backlog_full(
     hass, mock_client, config_ext, get_write_api, get_mock_call
 ):
-    """Test the event listener drops old events when backlog gets full."""
+    """Test the event listener buffers old events when backlog gets full."""
     handler_method = await _setup(hass, mock_client, config_ext, get_write_api)
 
     state = MagicMock(
@@ -1519,6 +1546,266 @@ async def test_event_listener_backlog_full(
         hass.data[influxdb.DOMAIN].block_till_done()
 
         assert get_write_api(mock_client).call_count == 0
+        assert hass.data[influxdb.DOMAIN].spill.pending
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, get_mock_call",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_buffered_events(
+    hass, mock_client, config_ext, get_write_api, get_mock_call
+):
+    """Test events that could not be written are written once writes work."""
+    handler_method = await _setup(hass, mock_client, config_ext, get_write_api)
+
+    def make_event(entity):
+        state = MagicMock(
+            state=1,
+            domain="fake",
+            entity_id=f"fake.{entity}",
+            object_id=entity,
+            attributes={},
+        )
+        return MagicMock(data={"new_state": state}, time_fired=12345)
+
+    def make_body(entity):
+        return [
+            {
+                "measurement": f"fake.{entity}",
+                "tags": {"domain": "fake", "entity_id": entity},
+                "time": 12345,
+                "fields": {"value": 1},
+            }
+        ]
+
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = IOError("foo")
+    handler_method(make_event("first"))
+    hass.data[influxdb.DOMAIN].block_till_done()
+    assert write_api.call_count == 1
+    assert hass.data[influxdb.DOMAIN].spill.pending
+
+    write_api.side_effect = None
+    write_api.reset_mock()
+    handler_method(make_event("second"))
+    hass.data[influxdb.DOMAIN].block_till_done()
+    assert write_api.call_args_list == [
+        get_mock_call(make_body("second")),
+        get_mock_call(make_body("first")),
+    ]
+    assert not hass.data[influxdb.DOMAIN].spill.pending
+
+    write_api.reset_mock()
+    handler_method(make_event("third"))
+    hass.data[influxdb.DOMAIN].block_till_done()
+    assert write_api.call_args_list == [get_mock_call(make_body("third"))]
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, get_mock_call",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_buffered_events_batches(
+    hass, mock_client, config_ext, get_write_api, get_mock_call
+):
+    """Test buffered events are written one batch per successful write."""
+    handler_method = await _setup(hass, mock_client, config_ext, get_write_api)
+    instance = hass.data[influxdb.DOMAIN]
+
+    def make_event(entity):
+        state = MagicMock(
+            state=1,
+            domain="fake",
+            entity_id=f"fake.{entity}",
+            object_id=entity,
+            attributes={},
+        )
+        return MagicMock(data={"new_state": state}, time_fired=12345)
+
+    def make_body(entity):
+        return [
+            {
+                "measurement": f"fake.{entity}",
+                "tags": {"domain": "fake", "entity_id": entity},
+                "time": 12345,
+                "fields": {"value": 1},
+            }
+        ]
+
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = IOError("foo")
+    for entity in ("first", "second"):
+        handler_method(make_event(entity))
+        instance.block_till_done()
+    assert instance.metrics["write_errors"] == 2
+    assert instance.metrics["buffered_events"]
+
+    write_api.side_effect = None
+    with patch(f"{INFLUX_PATH}.SPILL_REPLAY_BATCH_SIZE", 1):
+        write_api.reset_mock()
+        handler_method(make_event("third"))
+        instance.block_till_done()
+        assert write_api.call_args_list == [
+            get_mock_call(make_body("third")),
+            get_mock_call(make_body("first")),
+        ]
+        assert instance.spill.pending
+
+        write_api.reset_mock()
+        handler_method(make_event("fourth"))
+        instance.block_till_done()
+        assert write_api.call_args_list == [
+            get_mock_call(make_body("fourth")),
+            get_mock_call(make_body("second")),
+        ]
+        assert not instance.spill.pending
+
+    metrics = instance.metrics
+    assert metrics["queue_depth"] == 0
+    assert metrics["write_errors"] == 0
+    assert metrics["dropped_events"] == 0
+    assert not metrics["buffered_events"]
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, get_mock_call",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_buffered_events_other_settings(
+    hass, mock_client, config_ext, get_write_api, get_mock_call
+):
+    """Test events buffered for other settings are discarded."""
+    spill_path = hass.config.path(".storage", influxdb.SPILL_FILE)
+    os.makedirs(os.path.dirname(spill_path))
+    with open(spill_path, "w") as spill:
+        spill.write('#{"precision": "h"}\nfake.first value=1 12345\n')
+
+    handler_method = await _setup(hass, mock_client, config_ext, get_write_api)
+    assert not os.path.exists(spill_path)
+    assert not hass.data[influxdb.DOMAIN].spill.pending
+
+    def make_event(entity):
+        state = MagicMock(
+            state=1,
+            domain="fake",
+            entity_id=f"fake.{entity}",
+            object_id=entity,
+            attributes={},
+        )
+        return MagicMock(data={"new_state": state}, time_fired=12345)
+
+    def make_body(entity):
+        return [
+            {
+                "measurement": f"fake.{entity}",
+                "tags": {"domain": "fake", "entity_id": entity},
+                "time": 12345,
+                "fields": {"value": 1},
+            }
+        ]
+
+    handler_method(make_event("second"))
+    hass.data[influxdb.DOMAIN].block_till_done()
+    write_api = get_write_api(mock_client)
+    assert write_api.call_args_list == [get_mock_call(make_body("second"))]
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, get_mock_call",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_queue_full(
+    hass, mock_client, config_ext, get_write_api, get_mock_call
+):
+    """Test the event listener drops events when the queue is full."""
+    handler_method = await _setup(hass, mock_client, config_ext, get_write_api)
+
+    state = MagicMock(
+        state=1,
+        domain="fake",
+        entity_id="entity.id",
+        object_id="entity",
+        attributes={},
+    )
+    event = MagicMock(data={"new_state": state}, time_fired=12345)
+
+    with patch(f"{INFLUX_PATH}.MAX_QUEUE_SIZE", 0):
+        handler_method(event)
+    hass.data[influxdb.DOMAIN].block_till_done()
+
+    assert get_write_api(mock_client).call_count == 0
+    assert hass.data[influxdb.DOMAIN].dropped_events == 1
+
+
+def test_event_to_line_time():
+    """Test the time of events is encoded in the configured precision."""
+    time_fired = datetime.datetime(
+        2021, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc
+    )
+    for precision, expected in (
+        (None, 1609556645678901000),
+        ("us", 1609556645678901),
+        ("ms", 1609556645678),
+        ("s", 1609556645),
+    ):
+        assert influxdb._encode_time(time_fired, precision) == expected
 
 
 @pytest.mark.parametrize(
@@ -11,7 +11,11 @@ import voluptuous as vol
 from homeassistant.components import logbook, recorder
 from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
-from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
+from homeassistant.components.recorder.models import (
+    States,
+    process_timestamp_to_utc_isoformat,
+)
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.const import (
     ATTR_DOMAIN,
@@ -307,6 +311,28 @@ def create_state_changed_event_from_old_new(
     return logbook.LazyEventPartialState(row)
 
 
+async def test_icon_from_stored_attributes(hass):
+    """Test the icon is extracted from attributes stored by the recorder."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    hass.states.async_set(
+        "light.kitchen", STATE_ON, {"brightness": 100, "icon": "mdi:security"}
+    )
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    def _fetch_attributes():
+        with session_scope(hass=hass) as session:
+            return session.query(States.attributes).one()[0]
+
+    event = create_state_changed_event_from_old_new(
+        "light.kitchen", dt_util.utcnow(), None, {"state": STATE_ON}
+    )
+    event._row.attributes = await hass.async_add_executor_job(_fetch_attributes)
+
+    assert event.attributes_icon == "mdi:security"
+
+
 async def test_logbook_view(hass, hass_client):
     """Test the logbook view."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -3,7 +3,7 @@ import asyncio
 from datetime import datetime, timedelta
 import json
 import ssl
-from unittest.mock import AsyncMock, MagicMock, call, mock_open, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, call, mock_open, patch
 
 import pytest
 import voluptuous as vol
@@ -19,7 +19,7 @@ from homeassistant.const import (
     TEMP_CELSIUS,
 )
 from homeassistant.core import callback
-from homeassistant.helpers import device_registry
+from homeassistant.helpers import device_registry, template
 from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
@@ -575,6 +575,123 @@ async def test_subscribe_special_characters(hass, mqtt_mock, calls, record_calls
     assert calls[0][0].payload == payload
 
 
+def test_subscription_trie_matching():
+    """Test the subscription trie matches topics like the MQTT spec."""
+    trie = mqtt.SubscriptionTrie()
+    subs = {
+        topic: mqtt.Subscription(topic, None)
+        for topic in (
+            "test-topic",
+            "test-topic/+/on",
+            "test-topic/#",
+            "+/+/on",
+            "#",
+            "$test-topic/#",
+            "+/$test",
+        )
+    }
+    for sub in subs.values():
+        trie.add(sub)
+
+    def match(topic):
+        return [sub.topic for sub in trie.match(topic)]
+
+    assert match("test-topic") == ["test-topic", "test-topic/#", "#"]
+    assert match("test-topic/bier/on") == [
+        "test-topic/+/on",
+        "test-topic/#",
+        "+/+/on",
+        "#",
+    ]
+    assert match("other/bier/off") == ["#"]
+    assert match("$test-topic/subtree/on") == ["$test-topic/#"]
+    assert match("$test-topic") == ["$test-topic/#"]
+    assert match("other/$test") == ["#", "+/$test"]
+
+    trie.remove(subs["#"])
+    trie.remove(subs["test-topic/+/on"])
+    assert match("other/bier/off") == []
+    assert match("test-topic/bier/on") == ["test-topic/#", "+/+/on"]
+    assert len(trie) == 5
+    assert subs["#"] not in trie
+    assert not trie.has_topic("#")
+    assert trie.has_topic("test-topic/#")
+    assert not trie.has_topic("test-topic/+")
+
+
+async def test_messages_from_network_thread_are_batched(hass, mqtt_mock):
+    """Test messages received on the paho thread are handled in batches."""
+    calls = []
+
+    @callback
+    def record(msg):
+        calls.append(msg.payload)
+
+    await mqtt.async_subscribe(hass, "test-topic/#", record)
+
+    with patch.object(hass.loop, "call_soon_threadsafe") as mock_threadsafe:
+        for idx in range(100):
+            mqtt_mock._mqtt_on_message(
+                None, None, mqtt.Message(f"test-topic/{idx}", b"%d" % idx, 0, False)
+            )
+
+    # Only the first message wakes up the event loop
+    assert len(mock_threadsafe.mock_calls) == 1
+    assert mqtt_mock.async_message_queue_info()["depth"] == 100
+
+    mock_threadsafe.mock_calls[0][1][0]()
+    while mqtt_mock.async_message_queue_info()["depth"]:
+        await asyncio.sleep(0)
+    await hass.async_block_till_done()
+
+    assert calls == [str(idx) for idx in range(100)]
+    info = mqtt_mock.async_message_queue_info()
+    assert info["depth"] == 0
+    assert info["max_depth"] == 100
+    assert info["messages"] == 100
+    # The batch size grows while there is a backlog
+    assert info["batches"] < 100 // mqtt.MIN_MESSAGE_BATCH
+    assert info["batch_size"] > mqtt.MIN_MESSAGE_BATCH
+
+
+async def test_subscribers_share_decoded_payload(hass, mqtt_mock):
+    """Test subscribers of a message share one decoded and parsed payload."""
+    payloads = []
+    rendered = []
+    tpl = template.Template("{{ value_json.temperature }}", hass)
+
+    @callback
+    def record(msg):
+        payloads.append(msg.payload)
+        rendered.append(tpl.async_render_with_possible_json_value(msg.payload))
+
+    await mqtt.async_subscribe(hass, "test-topic", record)
+    await mqtt.async_subscribe(hass, "test-topic", record)
+    await mqtt.async_subscribe(hass, "test-topic/#", record)
+
+    with patch(
+        "homeassistant.helpers.template.json.loads", wraps=json.loads
+    ) as mock_loads:
+        async_fire_mqtt_message(hass, "test-topic", '{"temperature": 21.5}')
+        await hass.async_block_till_done()
+
+    assert rendered == ["21.5", "21.5", "21.5"]
+    assert payloads[0] is payloads[1] is payloads[2]
+    assert len(mock_loads.mock_calls) == 1
+
+
+def test_receive_payload_json():
+    """Test the parsed JSON of a received payload is cached."""
+    payload = mqtt.models.ReceivePayload('{"temperature": 21.5}')
+    assert payload == '{"temperature": 21.5}'
+    assert payload.json == {"temperature": 21.5}
+    assert payload.json is payload.json
+
+    payload = mqtt.models.ReceivePayload("ON")
+    with pytest.raises(ValueError):
+        payload.json
+
+
 async def test_subscribe_same_topic(hass, mqtt_client_mock, mqtt_mock):
     """
     Test subscring to same topic twice and simulate retained messages.
@@ -1108,6 +1225,7 @@ async def test_mqtt_ws_get_device_debug_info(
             }
         ],
         "triggers": [],
+        "message_queue": ANY,
     }
     assert response["result"] == expected_result
 
@@ -1,10 +1,19 @@
 """The test for the ping binary_sensor platform."""
+import asyncio
 from os import path
+import time
 from unittest.mock import patch
 
+from icmplib import Host, ICMPReply, TimeoutExceeded
+import pytest
+
 from homeassistant import config as hass_config, setup
-from homeassistant.components.ping import DOMAIN
-from homeassistant.const import SERVICE_RELOAD
+from homeassistant.components.ping import DOMAIN, PingEngine
+from homeassistant.components.ping.binary_sensor import SCAN_INTERVAL
+from homeassistant.const import SERVICE_RELOAD, STATE_OFF, STATE_ON
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
 
 
 async def test_reload(hass):
@@ -48,5 +57,114 @@ async def test_reload(hass):
     assert hass.states.get("binary_sensor.test2")
 
 
+class MockICMPSocket:
+    """ICMP socket answering the requests to alive addresses."""
+
+    alive = {"10.0.0.1"}
+    sockets = []
+
+    def __init__(self, privileged=True):
+        """Initialize the socket."""
+        self.sent = []
+        self._replies = []
+        self.sockets.append(self)
+
+    def send(self, request):
+        """Send a request and queue its reply if the address is alive."""
+        request._time = time.time()
+        self.sent.append(request)
+        if request.destination in self.alive:
+            self._replies.append(
+                ICMPReply(
+                    request.destination,
+                    request.id,
+                    request.sequence,
+                    0,
+                    0,
+                    64,
+                    request.time + 0.002,
+                )
+            )
+
+    def receive(self, request=None, timeout=2):
+        """Return the next reply."""
+        if not self._replies:
+            raise TimeoutExceeded(timeout)
+        return self._replies.pop(0)
+
+    def close(self):
+        """Close the socket."""
+
+
+async def test_hosts_pinged_in_one_sweep(hass):
+    """Test all sensors are updated from a single sweep of the ping engine."""
+    MockICMPSocket.sockets = []
+
+    with patch("homeassistant.components.ping.icmp_ping"), patch(
+        "homeassistant.components.ping.ICMPv4Socket", MockICMPSocket
+    ):
+        await setup.async_setup_component(
+            hass,
+            "binary_sensor",
+            {
+                "binary_sensor": [
+                    {"platform": "ping", "name": "up", "host": "10.0.0.1"},
+                    {"platform": "ping", "name": "down", "host": "10.0.0.2"},
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+
+        assert len(MockICMPSocket.sockets) == 1
+        assert sorted(
+            {request.destination for request in MockICMPSocket.sockets[0].sent}
+        ) == ["10.0.0.1", "10.0.0.2"]
+        assert hass.states.get("binary_sensor.up").state == STATE_ON
+        assert hass.states.get("binary_sensor.up").attributes[
+            "round_trip_time_avg"
+        ] == pytest.approx(2)
+        assert hass.states.get("binary_sensor.down").state == STATE_OFF
+
+        async_fire_time_changed(hass, dt_util.utcnow() + SCAN_INTERVAL)
+        await hass.async_block_till_done()
+
+        assert len(MockICMPSocket.sockets) == 2
+
+
+async def test_sweep_skipped_while_running(hass):
+    """Test an interval sweep is skipped while the previous one is running."""
+    engine = PingEngine(hass, True)
+    results = []
+    unsub = engine.async_track_host("10.0.0.1", 1, SCAN_INTERVAL, results.append)
+    sweeps = [hass.loop.create_future()]
+
+    async def _ping_hosts(targets):
+        return await sweeps[-1]
+
+    with patch.object(engine, "async_ping_hosts", side_effect=_ping_hosts) as mock_ping:
+        # The sweeps are still running, waiting for them would block
+        async_fire_time_changed(hass, dt_util.utcnow() + SCAN_INTERVAL)
+        await asyncio.sleep(0)
+        async_fire_time_changed(hass, dt_util.utcnow() + SCAN_INTERVAL * 2)
+        await asyncio.sleep(0)
+
+        assert mock_ping.call_count == 1
+
+        host = Host("10.0.0.1", 1, 2, 3, 1, 1)
+        sweeps[-1].set_result([host])
+        await hass.async_block_till_done()
+        assert results == [host]
+
+        sweeps.append(hass.loop.create_future())
+        async_fire_time_changed(hass, dt_util.utcnow() + SCAN_INTERVAL * 3)
+        await asyncio.sleep(0)
+
+        assert mock_ping.call_count == 2
+        sweeps[-1].set_result([host])
+        await hass.async_block_till_done()
+
+    unsub()
+
+
 def _get_fixtures_base_path():
     return path.dirname(path.dirname(path.dirname(__file__)))
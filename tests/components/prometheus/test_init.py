@@ -15,6 +15,7 @@ from homeassistant.const import (
     DEVICE_CLASS_POWER,
     ENERGY_KILO_WATT_HOUR,
     EVENT_STATE_CHANGED,
+    TEMP_CELSIUS,
 )
 from homeassistant.core import split_entity_id
 from homeassistant.setup import async_setup_component
@@ -201,6 +202,58 @@ async def test_view(hass, hass_client):
     )
 
 
+async def test_view_collect_on_scrape(hass, hass_client):
+    """Test the gauges are generated from the states when scraped."""
+    assert await async_setup_component(
+        hass,
+        prometheus.DOMAIN,
+        {prometheus.DOMAIN: {"namespace": "scrape", "collect_on_scrape": True}},
+    )
+    hass.states.async_set(
+        "sensor.outside_temperature",
+        "15.6",
+        {"unit_of_measurement": TEMP_CELSIUS, "friendly_name": "Outside"},
+    )
+    await hass.async_block_till_done()
+    client = await hass_client()
+
+    resp = await client.get(prometheus.API_ENDPOINT)
+    assert resp.status == 200
+    body = (await resp.text()).split("\n")
+
+    assert (
+        'scrape_sensor_unit_c{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside"} 15.6' in body
+    )
+    assert (
+        'scrape_state_change_total{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside"} 1.0' in body
+    )
+
+    hass.states.async_set(
+        "sensor.outside_temperature",
+        "16.1",
+        {"unit_of_measurement": TEMP_CELSIUS, "friendly_name": "Outside"},
+    )
+    await hass.async_block_till_done()
+
+    resp = await client.get(prometheus.API_ENDPOINT)
+    body = (await resp.text()).split("\n")
+
+    assert (
+        'scrape_sensor_unit_c{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside"} 16.1' in body
+    )
+    assert (
+        'scrape_state_change_total{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside"} 2.0' in body
+    )
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture():
     """Mock the prometheus client."""
@@ -41,6 +41,19 @@ def test_from_event_to_db_state():
     assert state == States.from_event(event).to_native()
 
 
+def test_from_event_to_db_state_ascii_attributes():
+    """Test state attributes are stored with non ASCII characters escaped."""
+    state = ha.State("sensor.temperature", "18", {"icon": "\U0001f321"})
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+    )
+    dbstate = States.from_event(event)
+
+    assert dbstate.attributes == '{"icon":"\\ud83c\\udf21"}'
+    assert dbstate.to_native().attributes == state.attributes
+
+
 def test_from_event_to_delete_state():
     """Test converting deleting state event to db state."""
     event = ha.Event(
@@ -451,6 +451,74 @@ class TestStatisticsSensor(unittest.TestCase):
         )
 
 
+async def test_rolling_window_matches_full_recompute(hass):
+    """Test the incremental aggregates match a recompute over the window."""
+    values = [17, 20, 15.2, 5, 3.8, 9.2, 6.7, 14, 6, 0.1, 0.2, 0.3, -4.5, 1e6]
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": {
+                "platform": "statistics",
+                "name": "test",
+                "entity_id": "sensor.test_monitored",
+                "sampling_size": 4,
+                "precision": 6,
+            }
+        },
+    )
+    await hass.async_block_till_done()
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    for idx, value in enumerate(values):
+        hass.states.async_set("sensor.test_monitored", value)
+        await hass.async_block_till_done()
+
+        window = values[max(0, idx - 3) : idx + 1]
+        state = hass.states.get("sensor.test")
+        assert float(state.state) == round(statistics.mean(window), 6)
+        assert state.attributes["median"] == round(statistics.median(window), 6)
+        assert state.attributes["min_value"] == round(min(window), 6)
+        assert state.attributes["max_value"] == round(max(window), 6)
+        if len(window) > 1:
+            assert state.attributes["variance"] == round(statistics.variance(window), 6)
+            assert state.attributes["standard_deviation"] == round(
+                statistics.stdev(window), 6
+            )
+
+
+async def test_non_finite_values_ignored(hass, caplog):
+    """Test NaN and infinite values are ignored without breaking the sensor."""
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": {
+                "platform": "statistics",
+                "name": "test",
+                "entity_id": "sensor.test_monitored",
+                "sampling_size": 4,
+            }
+        },
+    )
+    await hass.async_block_till_done()
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    for value in (2, "nan", "inf", "-inf", 4, 6):
+        hass.states.async_set("sensor.test_monitored", value)
+        await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.test")
+    assert float(state.state) == 4
+    assert state.attributes["count"] == 3
+    assert state.attributes["min_value"] == 2
+    assert state.attributes["max_value"] == 6
+    assert "expected finite number and received nan" in caplog.text
+    assert "expected finite number and received inf" in caplog.text
+
+
 async def test_reload(hass):
     """Verify we can reload filter sensors."""
     await hass.async_add_executor_job(
@@ -283,6 +283,40 @@ class TestTrendBinarySensor:
         assert state.state == "on"
         assert state.attributes["sample_count"] == 3
 
+    def test_gradient_with_evicted_samples(self):
+        """Test the gradient stays exact while samples are evicted."""
+        assert setup.setup_component(
+            self.hass,
+            "binary_sensor",
+            {
+                "binary_sensor": {
+                    "platform": "trend",
+                    "sensors": {
+                        "test_trend_sensor": {
+                            "entity_id": "sensor.test_state",
+                            "max_samples": 5,
+                            "min_gradient": 1,
+                        }
+                    },
+                }
+            },
+        )
+        self.hass.block_till_done()
+
+        now = dt_util.utcnow()
+        for idx in range(50):
+            # Steep rise at first, then a gentle slope of 0.5 per second
+            value = 1000 + 1000 * idx if idx < 20 else 20000 + idx * 0.5
+            with patch("homeassistant.util.dt.utcnow", return_value=now):
+                self.hass.states.set("sensor.test_state", value)
+                self.hass.block_till_done()
+            now += timedelta(seconds=1)
+
+        state = self.hass.states.get("binary_sensor.test_trend_sensor")
+        assert state.state == "off"
+        assert state.attributes["sample_count"] == 5
+        assert abs(state.attributes["gradient"] - 0.5) < 1e-9
+
     def test_non_numeric(self):
         """Test up trend."""
         assert setup.setup_component(
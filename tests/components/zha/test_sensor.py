@@ -230,22 +230,24 @@ def core_rs(hass_storage):
         hass_storage[restore_state.STORAGE_KEY] = {
             "version": restore_state.STORAGE_VERSION,
             "key": restore_state.STORAGE_KEY,
-            "data": [
-                {
-                    "state": {
-                        "entity_id": entity_id,
-                        "state": str(state),
-                        "attributes": {ATTR_UNIT_OF_MEASUREMENT: uom},
-                        "last_changed": now,
-                        "last_updated": now,
-                        "context": {
-                            "id": "3c2243ff5f30447eb12e7348cfd5b8ff",
-                            "user_id": None,
+            "data": {
+                "states": [
+                    {
+                        "state": {
+                            "entity_id": entity_id,
+                            "state": str(state),
+                            "attributes": {ATTR_UNIT_OF_MEASUREMENT: uom},
+                            "last_changed": now,
+                            "last_updated": now,
+                            "context": {
+                                "id": "3c2243ff5f30447eb12e7348cfd5b8ff",
+                                "user_id": None,
+                            },
                         },
-                    },
-                    "last_seen": now,
-                }
-            ],
+                        "last_seen": now,
+                    }
+                ]
+            },
         }
         return
 
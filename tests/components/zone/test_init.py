@@ -11,6 +11,7 @@ from homeassistant.const import (
     ATTR_FRIENDLY_NAME,
     ATTR_ICON,
     ATTR_NAME,
+    EVENT_HOMEASSISTANT_STOP,
     SERVICE_RELOAD,
 )
 from homeassistant.core import Context
@@ -147,6 +148,81 @@ async def test_active_zone_skips_passive_zones_2(hass):
     assert "zone.active_zone" == active.entity_id
 
 
+async def test_active_zone_index(hass):
+    """Test the active zone follows zone changes and handles large zones."""
+    assert await setup.async_setup_component(hass, zone.DOMAIN, {})
+    hass.states.async_set(
+        "zone.near",
+        "zoning",
+        {"latitude": 32.880600, "longitude": -117.237561, "radius": 250},
+    )
+    hass.states.async_set(
+        "zone.far",
+        "zoning",
+        {"latitude": 33.880600, "longitude": -117.237561, "radius": 250},
+    )
+    hass.states.async_set(
+        "zone.region",
+        "zoning",
+        {"latitude": 33.380600, "longitude": -117.237561, "radius": 200000},
+    )
+
+    active = zone.async_active_zone(hass, 32.880600, -117.237561)
+    assert active.entity_id == "zone.near"
+
+    active = zone.async_active_zone(hass, 33.380600, -117.237561)
+    assert active.entity_id == "zone.region"
+
+    # A large accuracy radius reaches the far zone
+    active = zone.async_active_zone(hass, 33.870600, -117.237561, 100)
+    assert active.entity_id == "zone.region"
+    assert zone.async_active_zone(hass, 36.880600, -117.237561, 1000) is None
+    active = zone.async_active_zone(hass, 36.880600, -117.237561, 340000)
+    assert active.entity_id == "zone.far"
+
+    hass.states.async_set(
+        "zone.near",
+        "zoning",
+        {"latitude": 40.880600, "longitude": -117.237561, "radius": 250},
+    )
+    await hass.async_block_till_done()
+
+    active = zone.async_active_zone(hass, 32.880600, -117.237561)
+    assert active.entity_id == "zone.region"
+    active = zone.async_active_zone(hass, 40.880600, -117.237561)
+    assert active.entity_id == "zone.near"
+
+
+async def test_active_zone_index_zone_changes(hass, storage_setup):
+    """Test zone changes are reflected in the active zone right away."""
+    assert await storage_setup(items=[])
+    storage_collection = hass.data[DOMAIN]
+    latitude = 32.880600
+    longitude = -117.237561
+
+    assert zone.async_active_zone(hass, latitude, longitude) is None
+
+    item = await storage_collection.async_create_item(
+        {"name": "Office", "latitude": latitude, "longitude": longitude}
+    )
+    assert zone.async_active_zone(hass, latitude, longitude).entity_id == (
+        "zone.office"
+    )
+
+    await storage_collection.async_update_item(item["id"], {"latitude": latitude + 1})
+    assert zone.async_active_zone(hass, latitude, longitude) is None
+    assert zone.async_active_zone(hass, latitude + 1, longitude).entity_id == (
+        "zone.office"
+    )
+
+    await storage_collection.async_delete_item(item["id"])
+    assert zone.async_active_zone(hass, latitude + 1, longitude) is None
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert zone.DATA_ZONE_INDEX not in hass.data
+
+
 async def test_active_zone_prefers_smaller_zone_if_same_distance(hass):
     """Test zone size preferences."""
     latitude = 32.880600
@@ -212,8 +212,8 @@ def mock_device_tracker_conf():
     """Prevent device tracker from reading/writing data."""
     devices = []
 
-    async def mock_update_config(path, id, entity):
-        devices.append(entity)
+    async def mock_update_config(device):
+        devices.append(device)
 
     with patch(
         "homeassistant.components.device_tracker.legacy"
@@ -458,13 +458,9 @@ async def mqtt_mock(hass, mqtt_client_mock, mqtt_config):
     assert result
     await hass.async_block_till_done()
 
-    # Workaround: asynctest==0.13 fails on @functools.lru_cache
-    spec = dir(hass.data["mqtt"])
-    spec.remove("_matching_subscriptions")
-
     mqtt_component_mock = MagicMock(
         return_value=hass.data["mqtt"],
-        spec_set=spec,
+        spec_set=hass.data["mqtt"],
         wraps=hass.data["mqtt"],
     )
     mqtt_component_mock._mqttc = mqtt_client_mock
@@ -3,10 +3,13 @@ from functools import partial
 
 import pytest
 
-from homeassistant.core import callback
+from homeassistant.core import EAGER_CALLBACK_MAX_DEPTH, callback
 from homeassistant.helpers.dispatcher import (
+    DATA_DISPATCHER,
     async_dispatcher_connect,
     async_dispatcher_send,
+    async_dispatcher_send_many,
+    dispatcher_send_many,
 )
 
 
@@ -149,3 +152,115 @@ async def test_callback_exception_gets_logged(hass, caplog):
         f"Exception in functools.partial({bad_handler}) when dispatching 'test': ('bad',)"
         in caplog.text
     )
+
+
+async def test_callback_runs_inline(hass):
+    """Test callbacks connected inline run when the signal is sent."""
+    calls = []
+
+    @callback
+    def test_funct(data):
+        """Test function."""
+        calls.append(data)
+        unsub()
+
+    unsub = async_dispatcher_connect(hass, "test", test_funct, inline=True)
+    async_dispatcher_connect(hass, "test", test_funct, inline=True)
+    async_dispatcher_send(hass, "test", 3)
+
+    assert calls == [3, 3]
+
+    async_dispatcher_send(hass, "test", 4)
+
+    assert calls == [3, 3, 4]
+
+
+async def test_callback_scheduled_by_default(hass):
+    """Test callbacks are scheduled unless connected inline."""
+    calls = []
+
+    @callback
+    def test_funct(data):
+        """Test function."""
+        calls.append(data)
+
+    async_dispatcher_connect(hass, "test", test_funct)
+    async_dispatcher_send(hass, "test", 3)
+
+    assert calls == []
+
+    await hass.async_block_till_done()
+
+    assert calls == [3]
+
+
+async def test_callback_inline_depth(hass):
+    """Test signals sent by inline callbacks are scheduled once nested deep."""
+    calls = []
+
+    @callback
+    def test_funct(depth):
+        """Send the signal again."""
+        calls.append(depth)
+        async_dispatcher_send(hass, "test", depth + 1)
+
+    async_dispatcher_connect(hass, "test", test_funct, inline=True)
+    async_dispatcher_send(hass, "test", 1)
+
+    assert calls == list(range(1, EAGER_CALLBACK_MAX_DEPTH + 1))
+
+    hass.data[DATA_DISPATCHER].clear()
+    await hass.async_block_till_done()
+
+    assert calls == list(range(1, EAGER_CALLBACK_MAX_DEPTH + 2))
+
+
+@pytest.mark.no_fail_on_log_exception
+async def test_callback_exception_does_not_stop_dispatch(hass, caplog):
+    """Test an exception raised by a callback does not skip other listeners."""
+    calls = []
+
+    @callback
+    def bad_handler(*args):
+        """Record calls."""
+        raise Exception("This is a bad message callback")
+
+    @callback
+    def good_handler(data):
+        """Record calls."""
+        calls.append(data)
+
+    async_dispatcher_connect(hass, "test", bad_handler, inline=True)
+    async_dispatcher_connect(hass, "test", good_handler, inline=True)
+    async_dispatcher_send(hass, "test", "bad")
+
+    assert calls == ["bad"]
+    record = next(
+        record
+        for record in caplog.records
+        if "Exception in bad_handler when dispatching 'test'" in record.message
+    )
+    assert record.name == "homeassistant.util.logging"
+
+
+async def test_send_many(hass):
+    """Test sending many signals at once."""
+    calls = []
+
+    @callback
+    def test_funct(*args):
+        """Test function."""
+        calls.append(args)
+
+    async_dispatcher_connect(hass, "test1", test_funct, inline=True)
+    async_dispatcher_connect(hass, "test2", test_funct, inline=True)
+    async_dispatcher_send_many(hass, [("test1", (1,)), ("test2", (2, 3)), ("x", ())])
+
+    assert calls == [(1,), (2, 3)]
+
+    await hass.async_add_executor_job(
+        dispatcher_send_many, hass, [("test2", (4,)), ("test1", (5,))]
+    )
+    await hass.async_block_till_done()
+
+    assert calls == [(1,), (2, 3), (4,), (5,)]
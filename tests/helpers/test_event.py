@@ -15,6 +15,7 @@ from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TRACK_TIME_PATTERN_LISTENERS,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
@@ -2660,6 +2661,49 @@ async def test_async_track_time_change(hass):
     assert len(wildcard_runs) == 3
 
 
+async def test_periodic_tasks_share_timer(hass):
+    """Test listeners of the same pattern are fired from one timer."""
+    runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ), patch.object(hass.loop, "call_later", wraps=hass.loop.call_later) as call_later:
+        unsubs = [
+            async_track_utc_time_change(
+                hass, callback(lambda x, i=i: runs.append(i)), minute="/5", second=0
+            )
+            for i in range(3)
+        ]
+        assert call_later.call_count == 1
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert runs == [0, 1, 2]
+
+    unsubs[1]()
+    # Unsubscribing twice is allowed
+    unsubs[1]()
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert runs == [0, 1, 2, 0, 2]
+
+    unsubs[0]()
+    unsubs[2]()
+    assert not hass.data[TRACK_TIME_PATTERN_LISTENERS]
+    unsubs[2]()
+
+
 async def test_periodic_task_minute(hass):
     """Test periodic tasks per minute."""
     specific_runs = []
@@ -1,11 +1,26 @@
 """Test Home Assistant remote methods and classes."""
+from collections import namedtuple
+from dataclasses import dataclass
+import datetime
+import json
+from types import MappingProxyType
+from unittest.mock import patch
+
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers import json as json_helper
+from homeassistant.helpers.json import JSONEncoder, json_bytes, json_dumps
 from homeassistant.util import dt as dt_util
 
 
+@dataclass
+class Dataclass:
+    """Dataclass encoded natively by some encoders."""
+
+    value: int = 1
+
+
 def test_json_encoder(hass):
     """Test the JSON Encoder."""
     ha_json_enc = JSONEncoder()
@@ -19,3 +34,73 @@ def test_json_encoder(hass):
 
     now = dt_util.utcnow()
     assert ha_json_enc.default(now) == now.isoformat()
+
+
+@pytest.mark.parametrize("native", [True, False])
+def test_json_dumps(native):
+    """Test encoding Home Assistant objects with and without the native encoder."""
+    Point = namedtuple("Point", "x y")
+    state = core.State("test.test", "hello", {"float": float("nan")})
+    time = datetime.datetime(2021, 1, 2, 3, 4, 5, 6789, tzinfo=dt_util.UTC)
+    data = {
+        "time": time,
+        "set": {1},
+        "point": Point(1, 2),
+        "mapping": MappingProxyType({"a": 1}),
+        "state": state,
+        "infinity": float("inf"),
+        1: "one",
+        "text": "h\u00e9llo",
+    }
+    expected = {
+        "time": time.isoformat(),
+        "set": [1],
+        "point": [1, 2],
+        "mapping": {"a": 1},
+        "state": {**state.as_dict(), "attributes": {"float": None}},
+        "infinity": None,
+        "1": "one",
+        "text": "h\u00e9llo",
+    }
+    expected["state"]["last_changed"] = state.last_changed.isoformat()
+    expected["state"]["last_updated"] = state.last_updated.isoformat()
+    expected["state"]["context"] = state.context.as_dict()
+
+    orjson = json_helper.orjson if native else None
+    with patch("homeassistant.helpers.json.orjson", orjson):
+        assert json.loads(json_dumps(data)) == expected
+        assert json.loads(json_bytes(data)) == expected
+        assert json.loads(json_dumps(data, pretty=True)) == expected
+        assert "\n" in json_dumps(data, pretty=True)
+        # Integers of more than 64 bit are not supported by all encoders
+        assert json_dumps({"big": 2 ** 70}) == '{"big":1180591620717411303424}'
+
+        with pytest.raises(TypeError):
+            json_dumps({"set": {1}}, default=None)
+        with pytest.raises(TypeError):
+            json_dumps({"object": object()})
+        # Without default only JSON types are accepted by all encoders
+        with pytest.raises(TypeError):
+            json_dumps({"time": time}, default=None)
+        with pytest.raises(TypeError):
+            json_dumps({"dataclass": Dataclass()}, default=None)
+
+        circular = {}
+        circular["circular"] = circular
+        with pytest.raises(ValueError):
+            json_dumps(circular)
+
+
+@pytest.mark.parametrize("native", [True, False])
+def test_json_dumps_ensure_ascii(native):
+    """Test escaping non ASCII characters like the stdlib encoder."""
+    data = {"h\u00e9llo": "\u2603 \U0001f600"}
+
+    orjson = json_helper.orjson if native else None
+    with patch("homeassistant.helpers.json.orjson", orjson):
+        assert json_dumps(data, ensure_ascii=True) == json.dumps(
+            data, separators=(",", ":")
+        )
+        assert json_dumps(data) == json.dumps(
+            data, ensure_ascii=False, separators=(",", ":")
+        )
@@ -0,0 +1,28 @@
+"""Test the reference index helper."""
+from homeassistant.helpers.reference_index import ReferenceIndex
+
+
+def test_reference_index():
+    """Test adding, replacing and removing references."""
+    index = ReferenceIndex()
+    index.async_add("automation.one", ["light.kitchen", "light.hall"], ["device-1"])
+    index.async_add("automation.two", ["light.kitchen"])
+
+    assert index.async_referencing_entity("light.kitchen") == [
+        "automation.one",
+        "automation.two",
+    ]
+    assert index.async_referencing_entity("light.hall") == ["automation.one"]
+    assert index.async_referencing_device("device-1") == ["automation.one"]
+    assert index.async_referencing_entity("light.unknown") == []
+
+    index.async_add("automation.one", ["light.hall"])
+
+    assert index.async_referencing_entity("light.kitchen") == ["automation.two"]
+    assert index.async_referencing_device("device-1") == []
+
+    index.async_remove("automation.two")
+    index.async_remove("automation.unknown")
+
+    assert index.async_referencing_entity("light.kitchen") == []
+    assert index.async_referencing_entity("light.hall") == ["automation.one"]
@@ -1,5 +1,5 @@
 """The tests for the Restore component."""
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START
@@ -8,6 +8,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE_TASK,
+    STATE_DUMP_INTERVAL,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -15,6 +16,8 @@ from homeassistant.helpers.restore_state import (
 )
 from homeassistant.util import dt as dt_util
 
+from tests.common import async_fire_time_changed, flush_store
+
 
 async def test_caching_data(hass):
     """Test that we cache data."""
@@ -27,7 +30,9 @@ async def test_caching_data(hass):
 
     data = await RestoreStateData.async_get_instance(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([state.as_dict() for state in stored_states])
+    await data.store.async_save(
+        {"states": [state.as_dict() for state in stored_states]}
+    )
 
     # Emulate a fresh load
     hass.data[DATA_RESTORE_STATE_TASK] = None
@@ -38,7 +43,7 @@ async def test_caching_data(hass):
 
     # Mock that only b1 is present this run
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save"
     ) as mock_write_data:
         state = await entity.async_get_last_state()
         await hass.async_block_till_done()
@@ -63,7 +68,9 @@ async def test_hass_starting(hass):
 
     data = await RestoreStateData.async_get_instance(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([state.as_dict() for state in stored_states])
+    await data.store.async_save(
+        {"states": [state.as_dict() for state in stored_states]}
+    )
 
     # Emulate a fresh load
     hass.data[DATA_RESTORE_STATE_TASK] = None
@@ -75,7 +82,7 @@ async def test_hass_starting(hass):
     # Mock that only b1 is present this run
     states = [State("input_boolean.b1", "on")]
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save"
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         state = await entity.async_get_last_state()
         await hass.async_block_till_done()
@@ -89,7 +96,7 @@ async def test_hass_starting(hass):
 
     # Finish hass startup
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save"
     ) as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
         await hass.async_block_till_done()
@@ -132,13 +139,13 @@ async def test_dump_data(hass):
     }
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save"
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         await data.async_dump_states()
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = args[0]["states"]
 
     # b0 should not be written, since it didn't extend RestoreEntity
     # b1 should be written, since it is present in the current run
@@ -158,13 +165,13 @@ async def test_dump_data(hass):
     await entity.async_remove()
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save"
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         await data.async_dump_states()
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = args[0]["states"]
     assert len(written_states) == 2
     assert written_states[0]["state"]["entity_id"] == "input_boolean.b3"
     assert written_states[0]["state"]["state"] == "off"
@@ -193,7 +200,7 @@ async def test_dump_error(hass):
     data = await RestoreStateData.async_get_instance(hass)
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save",
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save",
         side_effect=HomeAssistantError,
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         await data.async_dump_states()
@@ -242,6 +249,91 @@ async def test_state_saved_on_remove(hass):
     assert set(state.attributes["complicated"]["value"]) == {1, 2, now.isoformat()}
 
 
+async def test_dump_changed_states(hass, hass_storage):
+    """Test that only changed states are saved after the initial dump."""
+    hass.states.async_set("input_boolean.b0", "on")
+    hass.states.async_set("input_boolean.b1", "on")
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b0"
+    await entity.async_internal_added_to_hass()
+
+    data = await RestoreStateData.async_get_instance(hass)
+    await data.async_dump_states()
+
+    stored = hass_storage[STORAGE_KEY]["data"]["states"]
+    assert [item["state"]["entity_id"] for item in stored] == ["input_boolean.b0"]
+    assert stored[0]["state"]["state"] == "on"
+
+    # Changes of entities that are not restored are ignored
+    hass.states.async_set("input_boolean.b1", "off")
+    await hass.async_block_till_done()
+    assert data.async_dump_changed_states() == 0
+
+    hass.states.async_set("input_boolean.b0", "off")
+    await hass.async_block_till_done()
+    assert data.async_dump_changed_states() == 1
+    assert data.async_dump_changed_states() == 0
+    await flush_store(data.store)
+
+    stored = hass_storage[STORAGE_KEY]["data"]["states"]
+    assert len(stored) == 1
+    assert stored[0]["state"]["state"] == "off"
+
+    # Changes are dumped periodically
+    hass.states.async_set("input_boolean.b0", "on")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + STATE_DUMP_INTERVAL)
+    await hass.async_block_till_done()
+    await flush_store(data.store)
+
+    stored = hass_storage[STORAGE_KEY]["data"]["states"]
+    assert stored[0]["state"]["state"] == "on"
+
+    # Unchanged states are only saved again to refresh their last seen time
+    with patch.object(data.store, "async_delay_save_change") as mock_save_change:
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(hours=1))
+        await hass.async_block_till_done()
+    assert not mock_save_change.called
+
+    future = dt_util.utcnow() + timedelta(days=2)
+    with patch.object(
+        data.store, "async_delay_save_change"
+    ) as mock_save_change, patch.object(dt_util, "utcnow", return_value=future):
+        async_fire_time_changed(hass, future)
+        await hass.async_block_till_done()
+    assert mock_save_change.call_count == 1
+
+
+async def test_migrate_stored_states(hass, hass_storage):
+    """Test loading the states stored by version 1."""
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b0"
+    now = dt_util.utcnow().isoformat()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            {
+                "state": {
+                    "entity_id": "input_boolean.b0",
+                    "state": "off",
+                    "attributes": {},
+                    "last_changed": now,
+                    "last_updated": now,
+                    "context": {"id": "3c2243ff5f30447eb12e7348cfd5b8ff"},
+                },
+                "last_seen": now,
+            }
+        ],
+    }
+
+    state = await entity.async_get_last_state()
+    assert state.state == "off"
+    assert hass_storage[STORAGE_KEY]["version"] == 2
+
+
 async def test_restoring_invalid_entity_id(hass, hass_storage):
     """Test restoring invalid entity IDs."""
     entity = RestoreEntity()
@@ -279,3 +279,104 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+async def test_journaled_store_saves_changes(hass, hass_storage):
+    """Test a journaled store saves changed items with a delay."""
+    store = storage.JournaledStore(
+        hass, MOCK_VERSION, MOCK_KEY, collections={"items": "id"}
+    )
+    items = {"a": {"id": "a", "value": 1}, "b": {"id": "b", "value": 2}}
+    store.async_delay_save(lambda: {"items": list(items.values())}, 1)
+
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    items["a"]["value"] = 3
+    del items["b"]
+    items["c"] = {"id": "c", "value": 4}
+    for item_id in ("a", "b", "c"):
+        store.async_delay_save_change(
+            "items", item_id, lambda i=item_id: items.get(i), 1
+        )
+    assert hass_storage[store.key]["data"]["items"][0]["value"] == 1
+
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert await store.async_load() == {
+        "items": [{"id": "a", "value": 3}, {"id": "c", "value": 4}]
+    }
+
+
+def test_journaled_store_replay_and_compact(tmp_path):
+    """Test the journal is replayed on load and compacted when it grows."""
+    hass = Mock(config=Mock(path=lambda *parts: str(tmp_path.joinpath(*parts))))
+    store = storage.JournaledStore(
+        hass, MOCK_VERSION, MOCK_KEY, collections={"items": "id"}, compact_size=200
+    )
+    path = store.path
+    journal_path = f"{path}{storage.JOURNAL_SUFFIX}"
+
+    store._write_data(
+        path,
+        {"version": MOCK_VERSION, "key": MOCK_KEY, "data": {"items": [{"id": "a"}]}},
+    )
+    store._write_journal(path, [["items", "b", {"id": "b"}], ["items", "a", None]])
+    assert store._load_data(path)["data"] == {"items": [{"id": "b"}]}
+
+    # A record cut off by an interrupted write is skipped
+    with open(journal_path, "a") as journal:
+        journal.write('\n["items", "c", {"id"')
+    store._write_journal(path, [["items", "d", {"id": "d"}]])
+    assert store._load_data(path)["data"] == {"items": [{"id": "b"}, {"id": "d"}]}
+
+    store._write_journal(path, [["items", "e", {"id": "e", "value": "x" * 200}]])
+    assert not tmp_path.joinpath(journal_path).exists()
+    with open(path) as snapshot:
+        assert json.load(snapshot)["data"]["items"] == [
+            {"id": "b"},
+            {"id": "d"},
+            {"id": "e", "value": "x" * 200},
+        ]
+
+
+def test_journaled_store_skips_records_in_snapshot(tmp_path):
+    """Test journal records already included in the snapshot are skipped."""
+    hass = Mock(config=Mock(path=lambda *parts: str(tmp_path.joinpath(*parts))))
+    store = storage.JournaledStore(
+        hass, MOCK_VERSION, MOCK_KEY, collections={"items": "id"}
+    )
+    path = store.path
+    journal_path = tmp_path.joinpath(f"{path}{storage.JOURNAL_SUFFIX}")
+
+    store._write_data(
+        path,
+        {"version": MOCK_VERSION, "key": MOCK_KEY, "data": {"items": [{"id": "a"}]}},
+    )
+    store._write_journal(path, [["items", "a", None]])
+    journal = journal_path.read_text()
+
+    # Interrupted before the journal was removed after writing a snapshot
+    store._write_data(
+        path,
+        {
+            "version": MOCK_VERSION,
+            "key": MOCK_KEY,
+            "data": {"items": [{"id": "a", "value": 1}]},
+        },
+    )
+    journal_path.write_text(journal)
+
+    store = storage.JournaledStore(
+        hass, MOCK_VERSION, MOCK_KEY, collections={"items": "id"}
+    )
+    assert store._load_data(path)["data"] == {"items": [{"id": "a", "value": 1}]}
+
+    # New records are numbered after the records in the snapshot
+    store = storage.JournaledStore(
+        hass, MOCK_VERSION, MOCK_KEY, collections={"items": "id"}
+    )
+    store._write_journal(path, [["items", "b", {"id": "b"}]])
+    assert store._load_data(path)["data"] == {
+        "items": [{"id": "a", "value": 1}, {"id": "b"}]
+    }
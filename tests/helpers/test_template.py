@@ -711,6 +711,29 @@ def test_render_with_possible_json_value_with_valid_json(hass):
     assert tpl.async_render_with_possible_json_value('{"hello": "world"}') == "world"
 
 
+def test_render_with_possible_json_value_str(hass):
+    """Render with possible JSON value reusing the JSON parsed by the value."""
+    tpl = template.Template("{{ value_json.hello }}", hass)
+    value = template.JSONValueStr('{"hello": "world"}')
+    assert value.json is value.json
+    assert tpl.async_render_with_possible_json_value(value) == "world"
+
+    value = template.JSONValueStr("{ I AM NOT JSON }")
+    with pytest.raises(ValueError):
+        value.json
+    assert tpl.async_render_with_possible_json_value(value, "-") == "-"
+
+    class OtherStr(str):
+        """String with an unrelated json attribute."""
+
+        json = "not parsed JSON"
+
+    assert (
+        tpl.async_render_with_possible_json_value(OtherStr('{"hello": "world"}'))
+        == "world"
+    )
+
+
 def test_render_with_possible_json_value_with_invalid_json(hass):
     """Render with possible JSON value with invalid JSON."""
     tpl = template.Template("{{ value_json }}", hass)
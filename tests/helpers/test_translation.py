@@ -11,6 +11,8 @@ from homeassistant.helpers import translation
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component, setup_component
 
+from tests.common import flush_store
+
 
 @pytest.fixture
 def mock_config_flows():
@@ -376,6 +378,47 @@ async def test_caching(hass):
         assert len(mock_build.mock_calls) > 1
 
 
+async def test_translation_bundle(hass, hass_storage):
+    """Test unchanged translation files are loaded from the bundle."""
+    hass.config.components.add("sensor")
+    hass.config.components.add("sensor.moon")
+
+    translations = await translation.async_get_translations(hass, "en", "state")
+    assert "component.sensor.state.moon__phase.first_quarter" in translations
+
+    bundle = hass.data.pop(translation.TRANSLATION_BUNDLES)["en"]
+    await flush_store(bundle._store)
+    stored = hass_storage[f"{translation.STORAGE_KEY}.en"]["data"]
+    assert {"sensor", "sensor.moon"} <= set(stored["components"])
+
+    hass.data.pop(translation.TRANSLATION_FLATTEN_CACHE)
+    with patch(
+        "homeassistant.helpers.translation.load_translations_files",
+        side_effect=translation.load_translations_files,
+    ) as mock_load:
+        assert (
+            await translation.async_get_translations(hass, "en", "state")
+            == translations
+        )
+
+    assert len(mock_load.mock_calls) == 0
+
+    hass.data.pop(translation.TRANSLATION_BUNDLES)
+    hass.data.pop(translation.TRANSLATION_FLATTEN_CACHE)
+    stored["components"]["sensor.moon"]["signature"] = [None, "Moon"]
+    with patch(
+        "homeassistant.helpers.translation.load_translations_files",
+        side_effect=translation.load_translations_files,
+    ) as mock_load:
+        assert (
+            await translation.async_get_translations(hass, "en", "state")
+            == translations
+        )
+
+    assert len(mock_load.mock_calls) == 1
+    assert list(mock_load.mock_calls[0][1][0]) == ["sensor.moon"]
+
+
 async def test_custom_component_translations(hass):
     """Test getting translation from custom components."""
     hass.config.components.add("test_standalone")
@@ -23,7 +23,7 @@ BAD_CORE_CONFIG = "homeassistant:\n  unit_system: bad\n\n\n"
 
 
 @pytest.fixture(autouse=True)
-async def apply_stop_hass(stop_hass):
+async def apply_stop_hass(stop_hass, hass_storage):
     """Make sure all hass are stopped."""
 
 
@@ -121,6 +121,18 @@ def test_secrets(isfile_patch, loop):
         ]
 
 
+@patch("os.path.isfile", return_value=True)
+def test_nothing_written(isfile_patch, loop, hass_storage):
+    """Test checking the config does not write to storage."""
+    files = {YAML_CONFIG_FILE: BASE_CONFIG + "http:"}
+    with patch_yaml_files(files):
+        res = check_config.check(get_test_config_dir())
+
+    assert res["except"] == {}
+    assert res["components"].keys() == {"homeassistant", "http"}
+    assert hass_storage == {}
+
+
 @patch("os.path.isfile", return_value=True)
 def test_package_invalid(isfile_patch, loop):
     """Test an invalid package."""
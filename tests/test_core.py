@@ -524,6 +524,59 @@ async def test_eventbus_coroutine_event_listener(hass):
     assert len(coroutine_calls) == 1
 
 
+async def test_eventbus_eager_callbacks(hass, caplog):
+    """Test callback listeners run while the event is fired."""
+    hass.bus.eager_callbacks = True
+    calls = []
+
+    @ha.callback
+    def callback_listener(event):
+        calls.append("callback")
+
+    @ha.callback
+    def bad_listener(event):
+        raise Exception("bad listener")
+
+    async def coroutine_listener(event):
+        calls.append("coroutine")
+
+    hass.bus.async_listen("test_eager", coroutine_listener)
+    hass.bus.async_listen("test_eager", bad_listener)
+    hass.bus.async_listen("test_eager", callback_listener)
+    hass.bus.async_listen_once("test_eager", callback_listener)
+    hass.bus.async_fire("test_eager")
+
+    assert calls == ["callback", "callback"]
+    assert "Error running listener" in caplog.text
+
+    await hass.async_block_till_done()
+    assert calls == ["callback", "callback", "coroutine"]
+
+    hass.bus.async_fire("test_eager")
+    await hass.async_block_till_done()
+    assert calls == ["callback", "callback", "coroutine", "callback", "coroutine"]
+
+
+async def test_eventbus_eager_callbacks_max_depth(hass):
+    """Test nested events have their listeners scheduled past the max depth."""
+    hass.bus.eager_callbacks = True
+    depths = []
+
+    @ha.callback
+    def nesting_listener(event):
+        depths.append(event.data["depth"])
+        if event.data["depth"] < ha.EAGER_CALLBACK_MAX_DEPTH + 2:
+            hass.bus.async_fire("test_nested", {"depth": event.data["depth"] + 1})
+
+    hass.bus.async_listen("test_nested", nesting_listener)
+    hass.bus.async_fire("test_nested", {"depth": 1})
+
+    assert depths == list(range(1, ha.EAGER_CALLBACK_MAX_DEPTH + 1))
+
+    await hass.async_block_till_done()
+    assert depths == list(range(1, ha.EAGER_CALLBACK_MAX_DEPTH + 3))
+
+
 def test_state_init():
     """Test state.init."""
     with pytest.raises(InvalidEntityFormatError):
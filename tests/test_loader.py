@@ -1,4 +1,5 @@
 """Test to verify that we can load components."""
+import asyncio
 from unittest.mock import ANY, patch
 
 import pytest
@@ -200,6 +201,31 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_async_import(hass):
+    """Test importing an integration and its platforms in the executor."""
+    integration = await loader.async_get_integration(hass, "hue")
+    hass.data.setdefault(loader.DATA_COMPONENTS, {}).pop("hue", None)
+
+    with patch.object(
+        integration, "get_component", wraps=integration.get_component
+    ) as mock_get_component:
+        components = await asyncio.gather(
+            integration.async_get_component(), integration.async_get_component()
+        )
+
+    assert components == [hue, hue]
+    # Concurrent requests share a single import
+    assert len(mock_get_component.mock_calls) == 1
+    assert "hue" in hass.data[loader.DATA_IMPORT_TIMES]
+
+    await integration.async_prefetch_platforms(["light", "not_a_platform"])
+    assert hass.data[loader.DATA_COMPONENTS]["hue.light"] is hue_light
+    assert await integration.async_get_platform("light") is hue_light
+
+    with pytest.raises(ImportError):
+        await integration.async_get_platform("not_a_platform")
+
+
 async def test_get_integration_legacy(hass):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
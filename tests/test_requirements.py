@@ -7,6 +7,8 @@ import pytest
 from homeassistant import loader, setup
 from homeassistant.requirements import (
     CONSTRAINT_FILE,
+    DATA_PKG_CACHE,
+    STORAGE_KEY,
     RequirementsNotFound,
     async_get_integration_with_requirements,
     async_process_requirements,
@@ -80,6 +82,43 @@ async def test_install_existing_package(hass):
     assert len(mock_inst.mock_calls) == 0
 
 
+async def test_satisfied_requirements_are_cached(hass, hass_storage):
+    """Test satisfied requirements are only checked again when packages change."""
+    with patch(
+        "homeassistant.util.package.environment_fingerprint", return_value="env-1"
+    ), patch(
+        "homeassistant.util.package.is_installed", return_value=True
+    ) as mock_is_installed:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+
+    assert len(mock_is_installed.mock_calls) == 1
+
+    await hass.async_stop(force=True)
+    assert hass_storage[STORAGE_KEY]["data"] == {
+        "fingerprint": "env-1",
+        "requirements": ["hello==1.0.0"],
+    }
+
+    hass.data.pop(DATA_PKG_CACHE)
+    with patch(
+        "homeassistant.util.package.environment_fingerprint", return_value="env-1"
+    ), patch("homeassistant.util.package.is_installed") as mock_is_installed:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+
+    assert len(mock_is_installed.mock_calls) == 0
+
+    hass.data.pop(DATA_PKG_CACHE)
+    with patch(
+        "homeassistant.util.package.environment_fingerprint", return_value="env-2"
+    ), patch(
+        "homeassistant.util.package.is_installed", return_value=True
+    ) as mock_is_installed:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+
+    assert len(mock_is_installed.mock_calls) == 1
+
+
 async def test_install_missing_package(hass):
     """Test an install attempt on an existing package."""
     with patch(
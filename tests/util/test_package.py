@@ -246,3 +246,17 @@ def test_check_package_global():
 def test_check_package_zip():
     """Test for an installed zip package."""
     assert not package.is_installed(TEST_ZIP_REQ)
+
+
+def test_environment_fingerprint(tmp_path):
+    """Test the fingerprint changes when a package directory changes."""
+    site_dir = tmp_path / "site-packages"
+    site_dir.mkdir()
+
+    with patch("sys.path", [str(site_dir), str(tmp_path / "missing")]):
+        fingerprint = package.environment_fingerprint()
+        assert package.environment_fingerprint() == fingerprint
+
+        (site_dir / "hello-1.0.0.dist-info").mkdir()
+        os.utime(site_dir, ns=(0, 0))
+        assert package.environment_fingerprint() != fingerprint
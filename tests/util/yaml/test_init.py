@@ -445,3 +445,149 @@ def test_input():
     """Test loading inputs."""
     data = {"hello": yaml.Input("test_name")}
     assert yaml.parse_yaml(yaml.dump(data)) == data
+
+
+def _write_old_file(path, content):
+    """Write a file with a modification time outside the racy window."""
+    path.write_text(content)
+    os.utime(path, (1000000000, 1000000000))
+
+
+def test_parse_cache(tmp_path):
+    """Test unchanged files are loaded from the parse cache."""
+    cache_path = str(tmp_path / ".storage" / "yaml_parse_cache")
+    config_path = str(tmp_path / YAML_CONFIG_FILE)
+    _write_old_file(
+        tmp_path / YAML_CONFIG_FILE,
+        "light: !include light.yaml\npassword: !env_var PARSE_CACHE_PASSWORD\n",
+    )
+    _write_old_file(tmp_path / "light.yaml", "- platform: demo\n")
+
+    with patch.dict(os.environ, {"PARSE_CACHE_PASSWORD": "one"}):
+        cache = yaml.ParseCache(cache_path)
+        conf = yaml.load_yaml(config_path, cache)
+        cache.save()
+
+        with patch.object(
+            yaml_loader.yaml, "load", wraps=yaml_loader.yaml.load
+        ) as mock_load:
+            cached = yaml.load_yaml(config_path, yaml.ParseCache(cache_path))
+
+        assert mock_load.call_count == 0
+        assert cached == conf
+        assert conf["password"] == "one"
+        assert '"one"' not in (tmp_path / ".storage" / "yaml_parse_cache").read_text()
+        assert os.stat(cache_path).st_mode & 0o777 == 0o600
+        assert cached["light"] is not conf["light"]
+        assert cached["light"].__config_file__ == config_path
+        assert cached["light"].__line__ == 0
+        assert cached["light"][0].__config_file__ == str(tmp_path / "light.yaml")
+
+        _write_old_file(tmp_path / "light.yaml", "- platform: hue\n")
+        with patch.object(
+            yaml_loader.yaml, "load", wraps=yaml_loader.yaml.load
+        ) as mock_load:
+            conf = yaml.load_yaml(config_path, yaml.ParseCache(cache_path))
+
+        assert mock_load.call_count == 2
+        assert conf["light"] == [{"platform": "hue"}]
+
+    with patch.dict(os.environ, {"PARSE_CACHE_PASSWORD": "two"}):
+        conf = yaml.load_yaml(config_path, yaml.ParseCache(cache_path))
+
+    assert conf["password"] == "two"
+
+
+def test_parse_cache_skips_recently_changed_files(tmp_path):
+    """Test files changed within the racy window are not cached."""
+    config_path = tmp_path / YAML_CONFIG_FILE
+    config_path.write_text("key: value\n")
+
+    cache = yaml.ParseCache(str(tmp_path / ".yaml_parse_cache"))
+    assert yaml.load_yaml(str(config_path), cache) == {"key": "value"}
+    cache.save()
+
+    assert not (tmp_path / ".yaml_parse_cache").exists()
+
+
+def test_parse_cache_secrets(tmp_path):
+    """Test secrets are resolved again and not stored in the parse cache."""
+    cache_path = tmp_path / ".storage" / "yaml_parse_cache"
+    config_path = str(tmp_path / YAML_CONFIG_FILE)
+    _write_old_file(
+        tmp_path / YAML_CONFIG_FILE,
+        "http:\n  api_password: !secret http_pw\n  other: hunter2\n"
+        "light: !include light.yaml\n",
+    )
+    _write_old_file(tmp_path / "light.yaml", "- password: !secret light_pw\n")
+    _write_old_file(
+        tmp_path / yaml.SECRET_YAML, "http_pw: hunter2\nlight_pw: swordfish\n"
+    )
+
+    cache = yaml.ParseCache(str(cache_path))
+    conf = yaml.load_yaml(config_path, cache)
+    cache.save()
+
+    assert conf["http"] == {"api_password": "hunter2", "other": "hunter2"}
+    assert conf["light"] == [{"password": "swordfish"}]
+    assert "swordfish" not in cache_path.read_text()
+    assert cache_path.read_text().count("hunter2") == 1
+
+    yaml.clear_secret_cache()
+    with patch.object(
+        yaml_loader.yaml, "load", wraps=yaml_loader.yaml.load
+    ) as mock_load:
+        cached = yaml.load_yaml(config_path, yaml.ParseCache(str(cache_path)))
+
+    # Only the secrets file is parsed
+    assert mock_load.call_count == 1
+    assert cached == conf
+    assert cached["light"][0].__config_file__ == str(tmp_path / "light.yaml")
+    yaml.clear_secret_cache()
+
+
+def test_parse_cache_replays_warnings(tmp_path, caplog):
+    """Test warnings logged while parsing are logged again on a cache hit."""
+    cache_path = str(tmp_path / ".storage" / "yaml_parse_cache")
+    config_path = str(tmp_path / YAML_CONFIG_FILE)
+    _write_old_file(tmp_path / YAML_CONFIG_FILE, "light: !include light.yaml\n")
+    _write_old_file(tmp_path / "light.yaml", "platform: demo\nplatform: hue\n")
+
+    cache = yaml.ParseCache(cache_path)
+    yaml.load_yaml(config_path, cache)
+    cache.save()
+    assert caplog.text.count("contains duplicate key") == 1
+
+    caplog.clear()
+    with patch.object(
+        yaml_loader.yaml, "load", wraps=yaml_loader.yaml.load
+    ) as mock_load:
+        yaml.load_yaml(config_path, yaml.ParseCache(cache_path))
+
+    assert mock_load.call_count == 0
+    assert caplog.text.count("contains duplicate key") == 1
+    assert 'light.yaml contains duplicate key "platform"' in caplog.text
+
+
+def test_parse_cache_drops_unused_entries(tmp_path):
+    """Test entries of files no longer loaded are dropped on save."""
+    cache_path = str(tmp_path / ".storage" / "yaml_parse_cache")
+    config_path = str(tmp_path / YAML_CONFIG_FILE)
+    _write_old_file(tmp_path / YAML_CONFIG_FILE, "light: !include light.yaml\n")
+    _write_old_file(tmp_path / "light.yaml", "- platform: demo\n")
+
+    cache = yaml.ParseCache(cache_path)
+    yaml.load_yaml(config_path, cache)
+    cache.save()
+    assert "light.yaml" in (tmp_path / ".storage" / "yaml_parse_cache").read_text()
+
+    _write_old_file(tmp_path / YAML_CONFIG_FILE, "light:\n")
+    yaml.load_yaml(config_path, cache)
+    cache.save()
+    assert "light.yaml" not in (tmp_path / ".storage" / "yaml_parse_cache").read_text()
+
+    # Nothing changed, the cache is not written again
+    with patch.object(yaml_loader.tempfile, "NamedTemporaryFile") as mock_tmp:
+        yaml.load_yaml(config_path, cache)
+        cache.save()
+    assert mock_tmp.call_count == 0